@@ -0,0 +1,68 @@
+"""Benchmark framebuffer text: per-call 5x7 rasterization vs glyph atlas blits.
+
+Usage: python scripts/bench_glyph_atlas.py [--repeat N] [--scale S]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pipboy.interface import font5x7  # noqa: E402
+from pipboy.interface.framebuffer import Framebuffer  # noqa: E402
+
+LINE = "STATUS  INV  DATA  MAP  RADIO  12:34:56 HP 115/115"
+
+
+def legacy_draw_text(fb, x, y, text, fg, scale):
+    # The column-run rasterizer Framebuffer.draw_text used before the atlas
+    advance = font5x7.GLYPH_ADVANCE * scale
+    tw, th = font5x7.text_size(text, scale)
+    fb._mark(x, y, tw, th)
+    for ch in text:
+        if ch != " ":
+            for col, bits in enumerate(font5x7.glyph_columns(ch)):
+                row = 0
+                while bits:
+                    if bits & 1:
+                        run = 0
+                        while bits & 1:
+                            run += 1
+                            bits >>= 1
+                        fb._fill(x + col * scale, y + row * scale, scale, run * scale, fg)
+                        row += run
+                    else:
+                        bits >>= 1
+                        row += 1
+        x += advance
+
+
+def bench(label, draw, repeat, scale):
+    fb = Framebuffer()
+    rows = fb.height // (font5x7.LINE_HEIGHT * scale)
+    draw(fb, 0, 0, LINE, "#99ff66", scale)  # warm up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for r in range(rows):
+            draw(fb, 0, r * font5x7.LINE_HEIGHT * scale, LINE, "#99ff66", scale)
+    dt = time.perf_counter() - t0
+    chars = repeat * rows * len(LINE)
+    print(f"{label:<28} {chars / dt:12.0f} chars/s  {dt / repeat * 1000:8.2f} ms/screen ({rows} lines)")
+    return chars / dt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    base = bench("per-call rasterization", legacy_draw_text, args.repeat, args.scale)
+    rate = bench("glyph atlas", lambda fb, x, y, t, fg, s: fb.draw_text(x, y, t, fg=fg, scale=s), args.repeat, args.scale)
+    print(f"{'':<28} speedup x{rate / base:.1f}")
+
+
+if __name__ == "__main__":
+    main()
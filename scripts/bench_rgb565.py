@@ -0,0 +1,70 @@
+"""Benchmark RGB565 wire conversion: legacy per-pixel loop vs the vectorized path.
+
+Usage: python scripts/bench_rgb565.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+from array import array
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pipboy.interface.rgb565 import rgb565_to_be_bytes  # noqa: E402
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+WIDTH, HEIGHT = 480, 320
+
+
+def legacy_loop(pixels):
+    # The conversion ILI9486.write_pixels_rgb565 used before the vectorized path
+    b = bytearray()
+    for p in pixels:
+        b += p.to_bytes(2, "big")
+    return bytes(b)
+
+
+def bench(label, fn, arg, repeat):
+    fn(arg)  # warm up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    dt = (time.perf_counter() - t0) / repeat
+    print(f"{label:<34} {dt * 1000:9.3f} ms/frame  {1 / dt:9.1f} frames/s")
+    return dt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    n = WIDTH * HEIGHT
+    frame_list = [(i * 2654435761) & 0xFFFF for i in range(n)]
+    frame_array = array("H", frame_list)
+    frame_bytes = frame_array.tobytes()
+    expected = legacy_loop(frame_list)
+    assert bytes(rgb565_to_be_bytes(frame_array)) == expected
+
+    print(f"Full frame {WIDTH}x{HEIGHT} ({n} pixels), {args.repeat} repeats")
+    base = bench("legacy per-pixel loop (list)", legacy_loop, frame_list, max(1, args.repeat // 10))
+    results = [
+        ("vectorized list[int]", frame_list),
+        ("vectorized array('H')", frame_array),
+        ("vectorized bytes", frame_bytes),
+    ]
+    if np is not None:
+        results.append(("vectorized numpy uint16", np.array(frame_array, dtype=np.uint16)))
+        results.append(("numpy '>u2' (no copy)", np.array(frame_array, dtype=">u2")))
+    for label, arg in results:
+        dt = bench(label, rgb565_to_be_bytes, arg, args.repeat)
+        print(f"{'':<34} speedup x{base / dt:.0f}")
+
+
+if __name__ == "__main__":
+    main()
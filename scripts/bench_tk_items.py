@@ -0,0 +1,120 @@
+"""Benchmark Tk canvas churn: delete("all") + recreate vs retained items.
+
+Renders the dev UI's frame (title, tab bar, tab labels, app text) the way
+TkInterface._tick used to (delete everything, create every item) and through
+RetainedCanvas, and reports canvas items created per second at the dev UI's tick
+rate. Uses a real Tk canvas when a display is available, else a stub that only
+counts calls.
+
+Usage: python scripts/bench_tk_items.py [--frames N] [--fps F] [--tabs T] [--lines L]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pipboy.interface.tk_items import RetainedCanvas  # noqa: E402
+
+
+class CountingCanvas:
+    """Wraps a canvas (or stands in for one) and counts item creation."""
+
+    def __init__(self, canvas=None):
+        self.canvas = canvas
+        self.created = 0
+        self._next = 0
+
+    def _create(self, kind, *args, **kwargs):
+        self.created += 1
+        if self.canvas is not None:
+            return getattr(self.canvas, f"create_{kind}")(*args, **kwargs)
+        self._next += 1
+        return self._next
+
+    def create_text(self, *a, **k):
+        return self._create("text", *a, **k)
+
+    def create_rectangle(self, *a, **k):
+        return self._create("rectangle", *a, **k)
+
+    def __getattr__(self, name):
+        if self.canvas is not None:
+            return getattr(self.canvas, name)
+        return lambda *a, **k: None
+
+
+def frame_content(n, tabs, lines):
+    # A clock-like app: one line changes every frame, the rest are static
+    yield "text", "title", (10, 10), {"text": "PiPIPBOY", "fill": "#99ff66"}
+    yield "rectangle", "tabbar", (0, 564, 800, 600), {"fill": "#001100", "outline": "#001100"}
+    for i in range(tabs):
+        fill = "#99ff66" if i == 0 else "#66aa44"
+        yield "text", f"tab{i}", (10 + 60 * i, 574), {"text": f"App{i}", "fill": fill}
+    for i in range(lines):
+        text = f"tick {n}" if i == 0 else f"line {i}"
+        yield "text", None, (10, 60 + 16 * i), {"text": text, "fill": "#99ff66"}
+
+
+def legacy_frame(canvas, n, tabs, lines):
+    canvas.delete("all")
+    for kind, _, coords, opts in frame_content(n, tabs, lines):
+        getattr(canvas, f"create_{kind}")(*coords, **opts)
+
+
+def retained_frame(items, n, tabs, lines):
+    items.begin()
+    for kind, key, coords, opts in frame_content(n, tabs, lines):
+        if kind == "text":
+            items.text(key, *coords, **opts)
+        else:
+            items.rect(key, *coords, **opts)
+    items.end()
+
+
+def bench(label, canvas, frame, frames, fps):
+    t0 = time.perf_counter()
+    for n in range(frames):
+        frame(n)
+        flush = getattr(canvas, "update_idletasks", None)
+        if flush is not None and canvas.canvas is not None:
+            flush()
+    dt = time.perf_counter() - t0
+    per_frame = canvas.created / frames
+    print(f"{label:<12} {per_frame:8.1f} items/frame  {per_frame * fps:10.0f} items/s at {fps:g} fps"
+          f"  {dt / frames * 1000:8.3f} ms/frame")
+    return per_frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--fps", type=float, default=20.0, help="Tick rate to report items/s at (old dev UI: 20)")
+    parser.add_argument("--tabs", type=int, default=9)
+    parser.add_argument("--lines", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+        make = lambda: CountingCanvas(tk.Canvas(root, width=800, height=600))  # noqa: E731
+        print("Tk canvas")
+    except Exception:
+        root = None
+        make = CountingCanvas
+        print("No display: counting calls on a stub canvas")
+
+    old = make()
+    bench("delete(all)", old, lambda n: legacy_frame(old, n, args.tabs, args.lines), args.frames, args.fps)
+    new = make()
+    items = RetainedCanvas(new)
+    bench("retained", new, lambda n: retained_frame(items, n, args.tabs, args.lines), args.frames, args.fps)
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
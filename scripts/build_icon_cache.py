@@ -0,0 +1,31 @@
+"""Pre-resize every icon in resources/icons into the icon cache.
+
+Run once after installing or changing icons so the UI never resizes at runtime.
+
+Usage: python scripts/build_icon_cache.py [--cache-dir DIR] [--sizes 12,18,24,32,48] [ICON_DIR ...]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pipboy.interface.icon_cache import ICON_SIZES, IconCache  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("icon_dirs", nargs="*", type=Path, default=[ROOT / "resources" / "icons"])
+    parser.add_argument("--cache-dir", type=Path, default=None)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in ICON_SIZES))
+    args = parser.parse_args(argv)
+
+    cache = IconCache(args.cache_dir, sizes=[int(s) for s in args.sizes.split(",") if s])
+    for d in args.icon_dirs:
+        n = cache.build_all(d)
+        print(f"{d}: {n} resized into {cache.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Render every app headlessly and save one PNG per app (no Tk, X server or panel).
+
+Usage: python scripts/snapshot_apps.py [--out DIR] [--frames N] [--scale S]
+
+The apps are the hardware tab list (or the config's `apps:` list), taken from the
+app registry like `pipboy.main` does.
+
+Also reports the render + update rate of the offscreen backend, which makes it a
+quick CI smoke test that every app draws without raising.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pipboy.interface.app_manager import AppManager  # noqa: E402
+from pipboy.interface.hardware_interface import HardwareInterface  # noqa: E402
+from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay  # noqa: E402
+from pipboy.interface.palette import Palette  # noqa: E402
+
+
+def load_config():
+    try:
+        import yaml
+
+        from pipboy.main import CONFIG_PATH
+
+        return yaml.safe_load(CONFIG_PATH.read_text()) or {}
+    except Exception:
+        return {}
+
+
+def build_apps(config, display):
+    from pipboy.app.registry import HARDWARE_APPS, app_names, create_apps
+
+    # No sensors headless: apps fall back to their own defaults
+    return create_apps(app_names(config, HARDWARE_APPS), {"display": display})
+
+
+class _NoInput:
+    def on(self, name, handler):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default=str(ROOT / "diagnostics" / "snapshots"))
+    parser.add_argument("--frames", type=int, default=100, help="Frames rendered per app for timing")
+    parser.add_argument("--scale", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    display = OffscreenDisplay(OffscreenConfig(text_scale=args.scale, snapshot_dir=args.out))
+    config = load_config()
+    manager = AppManager(build_apps(config, display), palette=Palette.from_config(config))
+    hw = HardwareInterface(display, _NoInput(), manager)
+    hw.initialize()
+    for i, app in enumerate(manager.apps):
+        manager.select(i)
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            hw.run_once()
+        dt = time.perf_counter() - t0
+        path = display.snapshot(Path(args.out) / f"{app.name.lower()}.png")
+        print(f"{app.name:<14} {args.frames / dt:8.0f} fps  -> {path}")
+
+
+if __name__ == "__main__":
+    main()
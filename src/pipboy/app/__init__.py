@@ -1,8 +1,23 @@
-from .debug import DebugApp
-from .peripherals_app import PeripheralsApp
-from .clock import ClockApp
-from .environment import EnvironmentApp
-from .file_manager import FileManagerApp
-from .map import MapApp
-from .radio import RadioApp
-from .update import UpdateApp
+# App classes are imported on first access so that importing pipboy.app (or the
+# registry) doesn't pull in every app module
+_EXPORTS = {
+    "DebugApp": ".debug",
+    "PeripheralsApp": ".peripherals_app",
+    "ClockApp": ".clock",
+    "EnvironmentApp": ".environment",
+    "FileManagerApp": ".file_manager",
+    "MapApp": ".map",
+    "RadioApp": ".radio",
+    "UpdateApp": ".update",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module, __name__), name)
@@ -12,6 +12,11 @@ class App:
     """Minimal app interface"""
 
     name: str
+    # Seconds between redraws while shown, for apps whose view changes on its own
+    # (e.g. a clock); None redraws only after input or invalidate()
+    refresh_interval: float | None = None
+    # True while the view animates; the UI then redraws at its animation frame rate
+    animating: bool = False
 
     def __init__(self, name: str):
         self.name = name
@@ -24,9 +29,25 @@ class App:
         """Handle input events"""
         raise NotImplementedError
 
+    def invalidate(self) -> None:
+        """Ask for a redraw after the app's state changed outside of input handling"""
+        callback = getattr(self, "on_invalidate", None)
+        if callback is not None:
+            callback()
+
 
 class SelfUpdatingApp(App):
-    """An app that may refresh its data periodically"""
+    """An app that may refresh its data periodically
+
+    `update()` is called by `UpdateScheduler` on a background thread while
+    `needs_update()` is true, so it must not draw; build new state aside and publish it
+    with a single attribute assignment.
+    """
+
+    # Seconds between updates; None uses the scheduler's default
+    update_interval: float | None = None
+    # Keep updating while another app is shown
+    update_when_hidden: bool = False
 
     def needs_update(self) -> bool:
         return False
@@ -7,6 +7,10 @@ from .base import SelfUpdatingApp
 
 
 class ClockApp(SelfUpdatingApp):
+    # Twice a second, so the seconds never lag by more than half a second
+    refresh_interval = 0.5
+    update_interval = 0.5
+
     def __init__(self, sensors=None):
         super().__init__("Clock")
         self.sensors = sensors or {}
@@ -22,11 +26,12 @@ class ClockApp(SelfUpdatingApp):
         return True
 
     def update(self):
+        # Runs on the update thread; _time is replaced in one assignment
         rtc = self.sensors.get('rtc')
+        t = None
         if rtc is not None:
             try:
-                self._time = rtc.read_time()
+                t = rtc.read_time()
             except Exception:
-                self._time = None
-        else:
-            self._time = None
+                t = None
+        self._time = t
@@ -7,7 +7,8 @@ class DisplayApp:
     """Display-related controls (brightness, rotation).
 
     Minimal stub implementation used for UI. Exposes:
-      - {'rotate': degrees}
+      - {'rotate': degrees} (0/90/180/270, handed to a controller with
+        request_rotation or set_rotation, e.g. ILI9486Display)
       - {'brightness': 0-100}
     """
 
@@ -31,8 +32,13 @@ class DisplayApp:
                 return False
         if isinstance(evt, dict) and 'rotate' in evt:
             try:
-                r = int(evt['rotate'])
-                self._rotation = r % 360
+                r = int(evt['rotate']) % 360
+                if self.controller is not None and hasattr(self.controller, 'request_rotation'):
+                    # Applied by the render loop before its next frame
+                    self.controller.request_rotation(r)
+                elif self.controller is not None and hasattr(self.controller, 'set_rotation'):
+                    self.controller.set_rotation(r)
+                self._rotation = r
                 return True
             except Exception:
                 return False
@@ -6,17 +6,20 @@ from .base import SelfUpdatingApp
 
 
 class EnvironmentApp(SelfUpdatingApp):
+    update_interval = 2.0
+
     def __init__(self, sensors=None):
         super().__init__("Environment")
         self.sensors = sensors or {}
         self._readings = {}
 
     def render(self, ctx):
-        if self._readings:
-            t = self._readings.get('temperature')
-            h = self._readings.get('humidity')
-            p = self._readings.get('pressure')
-            tm = self._readings.get('time')
+        readings = self._readings
+        if readings:
+            t = readings.get('temperature')
+            h = readings.get('humidity')
+            p = readings.get('pressure')
+            tm = readings.get('time')
             lines = []
             if t is not None:
                 lines.append(f"T: {t:.1f} C")
@@ -33,25 +36,31 @@ class EnvironmentApp(SelfUpdatingApp):
         else:
             ctx.draw_text(10, 80, "Environment: no sensor data")
 
+    def needs_update(self):
+        return bool(self.sensors)
+
     def update(self):
-        # Read sensors if present and cache values
+        # Read sensors if present into a fresh dict, then swap it in with one
+        # assignment so render (on another thread) never sees a partial set
+        readings = {}
         bme = self.sensors.get('bme280')
         if bme is not None:
             try:
-                self._readings['temperature'] = bme.read_temperature()
+                readings['temperature'] = bme.read_temperature()
             except Exception:
-                self._readings.pop('temperature', None)
+                pass
             try:
-                self._readings['humidity'] = bme.read_humidity()
+                readings['humidity'] = bme.read_humidity()
             except Exception:
-                self._readings.pop('humidity', None)
+                pass
             try:
-                self._readings['pressure'] = bme.read_pressure()
+                readings['pressure'] = bme.read_pressure()
             except Exception:
-                self._readings.pop('pressure', None)
+                pass
         rtc = self.sensors.get('rtc')
         if rtc is not None:
             try:
-                self._readings['time'] = rtc.read_time()
+                readings['time'] = rtc.read_time()
             except Exception:
-                self._readings.pop('time', None)
+                pass
+        self._readings = readings
@@ -0,0 +1,133 @@
+"""App registry: the app list, defined once, built on demand
+
+Every launcher (`main`, `TkInterface`, the freenove profile) gets its apps from
+`create_apps`. Each app is described by an `AppSpec` naming its class as a
+"module:Class" string, so nothing is imported up front. By default `create_apps`
+returns `LazyApp` placeholders carrying only the tab name; `AppManager` swaps a
+placeholder for the real app the first time its tab is selected, which is when the
+app's module is imported and its constructor runs.
+
+Constructor arguments come from a shared context dict (sensors, the display, ...),
+read when the app is built, so a launcher may add entries after `create_apps`.
+
+Which apps appear, and in what order, is `HARDWARE_APPS` / `DEV_APPS` unless the
+config has a top-level `apps:` list of names. Third-party packages can add apps
+through the "pipboy.apps" entry point group (`Name = "module:Class"`); those are
+constructed without arguments.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "pipboy.apps"
+
+
+@dataclass(frozen=True)
+class AppSpec:
+    name: str
+    # "module:Class"; relative modules resolve against pipboy.app
+    target: str
+    # constructor keyword -> context key
+    inject: Mapping[str, str] = field(default_factory=dict)
+
+    def load_class(self) -> Any:
+        module, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module, __package__), attr)
+
+    def create(self, context: Optional[Mapping[str, Any]] = None) -> Any:
+        context = context or {}
+        kwargs = {kw: context[key] for kw, key in self.inject.items() if key in context}
+        return self.load_class()(**kwargs)
+
+
+APPS: Dict[str, AppSpec] = {
+    spec.name: spec
+    for spec in (
+        AppSpec("FileManager", ".file_manager:FileManagerApp"),
+        AppSpec("Fan", ".fan:FanApp"),
+        AppSpec("Camera", ".camera:CameraApp"),
+        AppSpec("Lights", ".lights:LightsApp"),
+        AppSpec("Display", ".display:DisplayApp", {"controller": "display"}),
+        AppSpec("Map", ".map:MapApp", {"sensors": "sensors"}),
+        AppSpec("Environment", ".environment:EnvironmentApp", {"sensors": "sensors"}),
+        AppSpec("Clock", ".clock:ClockApp", {"sensors": "sensors"}),
+        AppSpec("Radio", ".radio:RadioApp"),
+        AppSpec("Update", ".update:UpdateApp"),
+        AppSpec("Debug", ".debug:DebugApp"),
+        AppSpec("Peripherals", ".peripherals_app:PeripheralsApp"),
+        AppSpec("Settings", ".settings:SettingsApp"),
+        AppSpec("Exit", ".exit_app:ExitApp"),
+    )
+}
+
+# Default tab order on the Pi and in the desktop dev UI
+HARDWARE_APPS = ("FileManager", "Fan", "Camera", "Lights", "Display", "Map",
+                 "Environment", "Clock", "Radio", "Update", "Debug")
+DEV_APPS = ("FileManager", "Map", "Environment", "Clock", "Radio", "Update",
+            "Debug", "Settings", "Exit")
+
+
+def available() -> Dict[str, AppSpec]:
+    """Built-in specs plus any registered under the "pipboy.apps" entry point group."""
+    specs = dict(APPS)
+    try:
+        from importlib.metadata import entry_points
+
+        eps = entry_points()
+        group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, ())
+        for ep in group:
+            specs.setdefault(ep.name, AppSpec(ep.name, ep.value))
+    except Exception as e:
+        logger.debug("App entry points unavailable: %s", e)
+    return specs
+
+
+def app_names(config: Any, default: Sequence[str]) -> List[str]:
+    """The config's `apps:` list if it has one, else `default`."""
+    names = config.get("apps") if isinstance(config, dict) else None
+    if isinstance(names, list) and names:
+        return [str(n) for n in names]
+    return list(default)
+
+
+class LazyApp:
+    """Stands in for an app until `AppManager` first selects it."""
+
+    lazy = True
+
+    def __init__(self, spec: AppSpec, context: Mapping[str, Any]):
+        self.spec = spec
+        self.name = spec.name
+        self.context = context
+        # Set by AppManager if building the app failed
+        self.error: Optional[Exception] = None
+
+    def load(self) -> Any:
+        return self.spec.create(self.context)
+
+    def render(self, ctx: Any) -> None:
+        if self.error is not None:
+            ctx.draw_text(10, 60, f"{self.name} unavailable: {self.error}")
+
+
+def create_apps(
+    names: Iterable[str],
+    context: Optional[Mapping[str, Any]] = None,
+    lazy: bool = True,
+) -> List[Any]:
+    """Apps (or placeholders when `lazy`) for `names`, in order; unknown names are skipped."""
+    specs = available()
+    context = context if context is not None else {}
+    apps = []
+    for name in names:
+        spec = specs.get(name)
+        if spec is None:
+            logger.warning("Unknown app %r in app list", name)
+            continue
+        apps.append(LazyApp(spec, context) if lazy else spec.create(context))
+    return apps
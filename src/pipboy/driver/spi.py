@@ -7,14 +7,29 @@ Gracefully degrades if `spidev` is not available (e.g., on dev machines).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
+
+# spidev rejects transfers larger than the kernel's buffer size (4096 by default)
+DEFAULT_BUFSIZ = 4096
+
+
+def read_spidev_bufsiz(default: int = DEFAULT_BUFSIZ) -> int:
+    """Return the spidev kernel module's `bufsiz` parameter, or `default` if unknown."""
+    try:
+        with open("/sys/module/spidev/parameters/bufsiz", "r") as fh:
+            return int(fh.read().strip()) or default
+    except Exception:
+        return default
 
 
 @dataclass
 class SPIConfig:
     bus: int = 0
     device: int = 0
+    # Defaults; `driver.spi_tuning` measures the best values for an attached panel
     max_speed_hz: int = 10_000_000
+    # Bytes per bulk write; 0 uses the kernel's bufsiz (larger values are capped to it)
+    chunk_size: int = 0
 
 
 class SPI:
@@ -22,23 +37,45 @@ class SPI:
         self.config = config or SPIConfig()
         self._spidev = None
         self.available = False
+        self.bufsiz = DEFAULT_BUFSIZ
         try:
             import spidev
 
             self._spidev = spidev.SpiDev()
             self._spidev.open(self.config.bus, self.config.device)
             self._spidev.max_speed_hz = self.config.max_speed_hz
+            self.bufsiz = read_spidev_bufsiz()
+            if self.config.chunk_size:
+                self.bufsiz = min(self.config.chunk_size, self.bufsiz)
             self.available = True
         except Exception:
             # Not on a Raspberry Pi or spidev not installed — degrade gracefully
             self._spidev = None
             self.available = False
 
+    def set_speed(self, hz: int) -> None:
+        self.config.max_speed_hz = hz
+        if self._spidev is not None:
+            self._spidev.max_speed_hz = hz
+
     def xfer2(self, data: bytes) -> bytes:
         if not self.available or self._spidev is None:
             raise RuntimeError("SPI not available")
         return bytes(self._spidev.xfer2(list(data)))
 
+    def writebytes2(self, data: Any) -> None:
+        """Write-only bulk transfer of any bytes-like object.
+
+        Slices are memoryviews of `data` sized to the kernel's `bufsiz`, handed to
+        spidev's buffer-protocol `writebytes2` without copying or reading back.
+        """
+        if not self.available or self._spidev is None:
+            raise RuntimeError("SPI not available")
+        mv = memoryview(data).cast("B")
+        step = self.bufsiz
+        for off in range(0, len(mv), step):
+            self._spidev.writebytes2(mv[off : off + step])
+
     def close(self) -> None:
         if self._spidev:
             try:
@@ -23,10 +23,18 @@ class SPIBus:
         self.spi = spidev.SpiDev()
         self.spi.open(bus, device)
         self.spi.max_speed_hz = max_speed_hz
+        self.available = True
+
+    def set_speed(self, hz: int) -> None:
+        self.spi.max_speed_hz = hz
 
     def xfer2(self, data):
         return self.spi.xfer2(data)
 
+    def writebytes2(self, data):
+        # Write-only; spidev splits buffers larger than its bufsiz itself
+        self.spi.writebytes2(data)
+
     def close(self):
         try:
             self.spi.close()
@@ -35,27 +43,57 @@ class SPIBus:
 
 
 class ILI9486Display:
-    """Stubbed ILI9486 SPI display. Implement init/draw_image/fill as needed."""
+    """ILI9486 SPI display that draws PIL images / NumPy arrays and solid fills.
+
+    Images are converted to big-endian RGB565 with the vectorized converter in
+    `interface.rgb565`; pass `cache=True` for static assets (icons, backgrounds) to
+    reuse the conversion keyed by image identity.
+    """
+
+    def __init__(self, spi: SPIBus, dc_pin=None, reset_pin=None, cs_pin=None,
+                 width: int = 480, height: int = 320, cache_size: int = 32):
+        from ..interface.rgb565 import RGB565ImageCache
 
-    def __init__(self, spi: SPIBus, dc_pin=None, reset_pin=None, cs_pin=None):
         self.spi = spi
         self.dc_pin = dc_pin
         self.reset_pin = reset_pin
         self.cs_pin = cs_pin
+        self.width = width
+        self.height = height
+        self.panel = None
+        self.image_cache = RGB565ImageCache(cache_size)
         self.initialized = False
 
     def init(self):
-        # Initialize display. This is hardware-specific and requires command sequences.
+        # Initialize display: reset, pixel format and orientation via the panel driver
+        from ..interface.ili9486_driver import ILI9486, ILIConfig
+
+        self.panel = ILI9486(self.spi, dc_pin=self.dc_pin, reset_pin=self.reset_pin,
+                             config=ILIConfig(width=self.width, height=self.height))
+        self.panel.initialize()
         self.initialized = True
 
-    def draw_image(self, pil_image):
+    def draw_image(self, pil_image, x: int = 0, y: int = 0, cache: bool = False):
         if not self.initialized:
             raise RuntimeError("Display not initialized")
-        # Convert PIL to raw bytes and send via SPI (implementation omitted)
-        raise NotImplementedError("draw_image must be implemented for your panel")
+        from ..interface.framebuffer import pack_rect
+        from ..interface.rgb565 import image_size, image_to_rgb565
+
+        w, h = image_size(pil_image)
+        data = self.image_cache.get(pil_image) if cache else image_to_rgb565(pil_image)
+        # Clip to the screen; partially visible images send only the visible rows/columns
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if (x0, y0, x1, y1) != (x, y, x + w, y + h):
+            scratch = memoryview(bytearray((x1 - x0) * (y1 - y0) * 2))
+            data = pack_rect(memoryview(data), w * 2, x0 - x, y0 - y, x1 - x0, y1 - y0, scratch)
+        self.panel.draw_rgb565_buffer(x0, y0, x1 - x0, y1 - y0, data)
 
     def fill(self, color):
         if not self.initialized:
             raise RuntimeError("Display not initialized")
-        # Fill screen with a color (implementation omitted)
-        raise NotImplementedError
+        from ..interface.rgb565 import to_rgb565
+
+        self.panel.fill_rect(0, 0, self.width, self.height, to_rgb565(color))
@@ -0,0 +1,255 @@
+"""SPI clock and chunk-size tuning for the display panel
+
+Sweeps SPI clock rates and bulk-write chunk sizes against the attached ILI9486,
+measuring full-frame throughput for each combination and checking that data arrives
+intact. The fastest combination that passed every check is written to the hardware
+profile (`spi_speed_hz` / `spi_chunk_size` in hardware.tuned.yaml, next to config.yaml
+and read on top of it).
+
+Integrity is checked with a seeded test pattern, using the first method that works
+at the slowest clock:
+  - "readback": write the pattern to a small window and read it back with RAMRD
+    (needs MISO wired to the panel)
+  - "loopback": the pattern's CRC32 compared with the bytes echoed on MISO (needs a
+    MOSI-MISO jumper)
+Without either, results are reported as unverified and the sweep relies on transfers
+not failing.
+
+`FakeSPI` simulates a bus with a virtual clock, per-transfer overhead and corruption
+above a given rate, so the sweep runs on any machine:
+
+    python -m pipboy.driver.spi_tuning --fake --dry-run
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from .spi import DEFAULT_BUFSIZ, read_spidev_bufsiz
+
+DEFAULT_SPEEDS = [8_000_000, 12_000_000, 16_000_000, 20_000_000, 24_000_000, 32_000_000, 40_000_000, 48_000_000]
+DEFAULT_CHUNKS = [1024, 2048, 4096, 8192, 16384, 65536]
+
+# Readback window: small enough for a single transfer
+CHECK_W, CHECK_H = 16, 16
+
+
+@dataclass
+class TuneSample:
+    speed_hz: int
+    chunk_size: int
+    bytes_per_sec: float
+    # True/False: integrity check passed/failed; None: could not be checked
+    ok: Optional[bool]
+    error: Optional[str] = None
+
+
+@dataclass
+class TuneResult:
+    speed_hz: int
+    chunk_size: int
+    bytes_per_sec: float
+    verified: bool
+    method: Optional[str]
+    samples: List[TuneSample] = field(default_factory=list)
+
+
+class FakeSPI:
+    """Simulated SPI bus for exercising the sweep.
+
+    Transfers advance `clock()` by a fixed per-call overhead plus 8 bits per byte at
+    the configured speed. Above `max_stable_hz` echoed bytes are corrupted. Chunks
+    larger than `max_bufsiz` are rejected like spidev does.
+    """
+
+    def __init__(self, max_stable_hz: int = 24_000_000, overhead_s: float = 40e-6, max_bufsiz: int = 65536, seed: int = 0):
+        self.available = True
+        self.max_stable_hz = max_stable_hz
+        self.overhead_s = overhead_s
+        self.max_bufsiz = max_bufsiz
+        self.bufsiz = DEFAULT_BUFSIZ
+        self.speed_hz = 1_000_000
+        self._now = 0.0
+        self._rng = random.Random(seed)
+
+    def clock(self) -> float:
+        return self._now
+
+    def set_speed(self, hz: int) -> None:
+        self.speed_hz = hz
+
+    def _transfer(self, n: int) -> None:
+        if n > self.max_bufsiz:
+            raise OSError(90, "Message too long")
+        self._now += self.overhead_s + n * 8 / self.speed_hz
+
+    def xfer2(self, data: Any) -> bytes:
+        out = bytearray(memoryview(data).cast("B"))
+        self._transfer(len(out))
+        if self.speed_hz > self.max_stable_hz and out:
+            out[self._rng.randrange(len(out))] ^= 1 << self._rng.randrange(8)
+        return bytes(out)
+
+    def writebytes2(self, data: Any) -> None:
+        mv = memoryview(data).cast("B")
+        for off in range(0, len(mv), self.bufsiz):
+            self._transfer(len(mv[off : off + self.bufsiz]))
+
+
+def _pattern(seed: int, n: int) -> bytes:
+    return random.Random(seed).randbytes(n)
+
+
+def check_readback(panel: Any, seed: int) -> bool:
+    data = _pattern(seed, CHECK_W * CHECK_H * 2)
+    panel.draw_rgb565_buffer(0, 0, CHECK_W, CHECK_H, data)
+    return panel.read_rgb565(0, 0, CHECK_W, CHECK_H) == data
+
+
+def check_loopback(spi: Any, seed: int) -> bool:
+    data = _pattern(seed, 1024)
+    return zlib.crc32(bytes(spi.xfer2(data))) == zlib.crc32(data)
+
+
+def detect_method(spi: Any, panel: Any) -> Optional[str]:
+    """Pick the integrity check that works at the current (slow) clock."""
+    if panel is not None and hasattr(panel, "read_rgb565"):
+        try:
+            if check_readback(panel, 1) and check_readback(panel, 2):
+                return "readback"
+        except Exception:
+            pass
+    try:
+        if check_loopback(spi, 1) and check_loopback(spi, 2):
+            return "loopback"
+    except Exception:
+        pass
+    return None
+
+
+def _set_speed(spi: Any, hz: int) -> None:
+    setter = getattr(spi, "set_speed", None)
+    if setter is not None:
+        setter(hz)
+    elif hasattr(spi, "max_speed_hz"):
+        spi.max_speed_hz = hz
+
+
+def tune_spi(
+    spi: Any,
+    panel: Any,
+    speeds: Optional[List[int]] = None,
+    chunks: Optional[List[int]] = None,
+    frame_size: tuple = (480, 320),
+    repeats: int = 3,
+    checks: int = 3,
+    clock: Optional[Callable[[], float]] = None,
+) -> Optional[TuneResult]:
+    """Sweep speeds x chunk sizes and return the fastest combination that passed.
+
+    Speeds are tried in ascending order; once every chunk size fails at a speed,
+    faster ones are not tried. Returns None if nothing passed.
+    """
+    speeds = sorted(speeds or DEFAULT_SPEEDS)
+    max_chunk = getattr(spi, "max_bufsiz", None) or read_spidev_bufsiz()
+    chunks = [c for c in (chunks or DEFAULT_CHUNKS) if c <= max_chunk] or [max_chunk]
+    clock = clock or getattr(spi, "clock", None) or time.perf_counter
+    w, h = frame_size
+    frame = _pattern(0, w * h * 2)
+
+    _set_speed(spi, speeds[0])
+    spi.bufsiz = chunks[0]
+    method = detect_method(spi, panel)
+
+    samples: List[TuneSample] = []
+    seed = 100
+    for speed in speeds:
+        _set_speed(spi, speed)
+        passed_any = False
+        for chunk in chunks:
+            spi.bufsiz = chunk
+            try:
+                t0 = clock()
+                for _ in range(repeats):
+                    panel.draw_rgb565_buffer(0, 0, w, h, frame)
+                elapsed = clock() - t0
+                rate = repeats * len(frame) / elapsed if elapsed > 0 else 0.0
+                ok: Optional[bool] = None
+                if method is not None:
+                    ok = True
+                    for _ in range(checks):
+                        seed += 1
+                        good = check_readback(panel, seed) if method == "readback" else check_loopback(spi, seed)
+                        if not good:
+                            ok = False
+                            break
+                samples.append(TuneSample(speed, chunk, rate, ok))
+                passed_any = passed_any or ok is not False
+            except Exception as e:
+                samples.append(TuneSample(speed, chunk, 0.0, False, str(e)))
+        if not passed_any:
+            break
+
+    good = [s for s in samples if s.ok is not False and s.error is None]
+    if not good:
+        return None
+    best = max(good, key=lambda s: (s.bytes_per_sec, -s.speed_hz))
+    return TuneResult(best.speed_hz, best.chunk_size, best.bytes_per_sec, method is not None, method, samples)
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(float(v)) for v in text.split(",") if v.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> Optional[TuneResult]:
+    parser = argparse.ArgumentParser(description="Tune SPI clock and chunk size for the display")
+    parser.add_argument("--fake", action="store_true", help="Use a simulated bus instead of spidev")
+    parser.add_argument("--config", default=None, help="config.yaml whose profile to tune (default: ./config.yaml)")
+    parser.add_argument("--speeds", type=_int_list, default=None, help="Comma-separated clock rates in Hz")
+    parser.add_argument("--chunks", type=_int_list, default=None, help="Comma-separated chunk sizes in bytes")
+    parser.add_argument("--repeats", type=int, default=3, help="Full frames written per combination")
+    parser.add_argument("--dry-run", action="store_true", help="Report only; don't update the profile")
+    args = parser.parse_args(argv)
+
+    from ..interface.hardware_profile_pi5 import load_profile, update_profile
+    from ..interface.ili9486_driver import ILI9486
+
+    if args.fake:
+        spi = FakeSPI()
+    else:
+        from .spi import SPI, SPIConfig
+
+        profile = load_profile(args.config)
+        spi = SPI(SPIConfig(bus=profile.spi_bus, device=profile.spi_device))
+        if not spi.available:
+            print("SPI not available; use --fake to try the sweep without hardware")
+            return None
+    panel = ILI9486(spi)
+    try:
+        panel.initialize()
+        result = tune_spi(spi, panel, args.speeds, args.chunks, repeats=args.repeats)
+    finally:
+        close = getattr(spi, "close", None)
+        if close is not None:
+            close()
+    if result is None:
+        print("No stable SPI setting found")
+        return None
+    for s in result.samples:
+        status = {True: "ok", False: "FAIL", None: "unverified"}[s.ok]
+        print(f"{s.speed_hz / 1e6:7.2f} MHz  chunk {s.chunk_size:6d}  {s.bytes_per_sec / 1e6:7.2f} MB/s  {status}"
+              + (f" ({s.error})" if s.error else ""))
+    print(f"Best: {result.speed_hz / 1e6:.2f} MHz, chunk {result.chunk_size} bytes, "
+          f"{result.bytes_per_sec / 1e6:.2f} MB/s ({result.method or 'unverified'})")
+    if not args.dry_run:
+        update_profile({"spi_speed_hz": result.speed_hz, "spi_chunk_size": result.chunk_size}, args.config)
+        print("Saved to hardware profile")
+    return result
+
+
+if __name__ == "__main__":
+    main()
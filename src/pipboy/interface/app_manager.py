@@ -2,25 +2,145 @@
 
 Provides a small, testable controller that renders the top tab bar and delegates
 rendering and input to the active app.
+
+On framebuffer contexts rendering is retained (see `scene`): the tab bar and each
+app's output are nodes that are only repainted when they change, and the caller
+must not clear the frame in between (`paints_incrementally`). Colours there come from
+the palette's RGB565 words: the frame background is the theme's, and the selected tab
+pulses through `Palette.pulse565` while the feedback runs.
+
+Each app render is held to `frame_budget` seconds. A render can't be interrupted, so
+the budget is enforced between frames: an app that overruns `OVERRUN_LIMIT` times in
+a row is demoted and rendered at most every `demoted_interval` seconds (or right
+after input to it), with its last frame shown in between, until it has come in under
+budget `RECOVER_AFTER` times. An app whose render raises also keeps its last frame.
+Overruns and errors are counted per app in `health`. With `hang_timeout` set, a
+render taking that long dumps every thread's stack to stderr (`faulthandler`).
+
+Apps may be registry placeholders (`lazy = True`); they are built the first time
+they become `current`.
 """
 from __future__ import annotations
 
-from typing import List, Any
+import faulthandler
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List
+
+from .palette import Palette
+from .rgb565 import to_rgb565
+from .scene import Scene, SceneContext
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AppHealth:
+    """Render budget bookkeeping for one app."""
+
+    overruns: int = 0
+    errors: int = 0
+    # Frames where the cached last frame was shown instead of rendering
+    skipped: int = 0
+    demoted: bool = False
+    # > 0: consecutive overruns; < 0: consecutive renders within budget
+    streak: int = 0
+    last_render: float = float("-inf")
+    last_seconds: float = 0.0
+
+
+class _Recorder:
+    """Forwards drawing to a context while recording it, so it can be replayed."""
+
+    def __init__(self, ctx: Any, calls: list):
+        self._ctx = ctx
+        self._calls = calls
+
+    def draw_text(self, *args: Any, **kwargs: Any) -> None:
+        self._calls.append((args, kwargs))
+        self._ctx.draw_text(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
 
 
 class AppManager:
-    def __init__(self, apps: List[Any], feedback_color: str = "#ffff66", feedback_duration: float = 0.5):
+    # Tab bar geometry, shared by render() and tab_index_at()
+    TAB_X = 10
+    TAB_WIDTH = 60
+    TAB_HEIGHT = 36
+    # Consecutive overruns before an app is demoted, and in-budget renders to recover
+    OVERRUN_LIMIT = 3
+    RECOVER_AFTER = 5
+
+    def __init__(
+        self,
+        apps: List[Any],
+        feedback_color: str = "#ffff66",
+        feedback_duration: float = 0.5,
+        frame_budget: float = 0.05,
+        demoted_interval: float = 1.0,
+        hang_timeout: float | None = None,
+        palette: Palette | None = None,
+    ):
         assert apps, "At least one app required"
         self.apps = apps
         self.index = 0
         # UI feedback state and configurable appearance
         self._last_feedback_time = 0.0
         self._feedback_duration = feedback_duration
-        self._feedback_color = feedback_color
+        # Tab colours; replace with a new Palette to switch themes
+        self.palette = palette or Palette.from_theme({"feedback_fg": feedback_color})
+        self.scene = Scene()
+        # Called when a redraw is needed (set by the render loop's scheduler)
+        self.on_invalidate: Callable[[], None] | None = None
+        self.last_app_render: tuple[str, float] | None = None
+        for app in apps:
+            try:
+                app.on_invalidate = self.invalidate
+            except Exception:
+                pass
+        # app index -> context recording that app's drawing into its scene layer
+        self._app_layers: dict[int, SceneContext] = {}
+        self.frame_budget = frame_budget
+        self.demoted_interval = demoted_interval
+        self.hang_timeout = hang_timeout
+        self.health = [AppHealth() for _ in apps]
+        # app index -> draw_text calls of its last immediate-mode render
+        self._cached: dict[int, list] = {}
+        # Render the current app on the next frame even if demoted
+        self._force_render = True
+
+    @property
+    def _feedback_color(self) -> str:
+        return self.palette.feedback
 
     @property
     def current(self):
-        return self.apps[self.index]
+        app = self.apps[self.index]
+        if getattr(app, "lazy", False):
+            app = self._materialize(self.index)
+        return app
+
+    def _materialize(self, i: int) -> Any:
+        """Build the real app behind a registry placeholder (see `pipboy.app.registry`)."""
+        placeholder = self.apps[i]
+        try:
+            app = placeholder.load()
+        except Exception as e:
+            logger.warning("Failed to load app %s: %s", getattr(placeholder, "name", "?"), e)
+            placeholder.error = e
+            # Not retried; the placeholder shows the error from now on
+            placeholder.lazy = False
+            self.health[i].errors += 1
+            return placeholder
+        try:
+            app.on_invalidate = self.invalidate
+        except Exception:
+            pass
+        self.apps[i] = app
+        return app
 
     def next(self):
         self.index = (self.index + 1) % len(self.apps)
@@ -36,10 +156,27 @@ class AppManager:
             return
         self.index = max(0, min(len(self.apps) - 1, int(index)))
         self.feedback()
-    def feedback(self) -> None:
-        import time
 
+    def invalidate(self) -> None:
+        """Request a redraw from whoever drives rendering."""
+        if self.on_invalidate is not None:
+            self.on_invalidate()
+
+    def feedback(self) -> None:
         self._last_feedback_time = time.monotonic()
+        self._force_render = True
+        self.invalidate()
+
+    def feedback_remaining(self) -> float:
+        """Seconds until the current feedback pulse ends (0.0 if inactive)."""
+        return max(0.0, self._feedback_duration - (time.monotonic() - self._last_feedback_time))
+
+    def refresh_interval(self) -> float | None:
+        """How often the current view must be redrawn without input (None: never)."""
+        interval = getattr(self.current, "refresh_interval", None)
+        if interval is not None and self.health[self.index].demoted:
+            return max(interval, self.demoted_interval)
+        return interval
 
     def _is_feedback_active(self) -> bool:
         import time
@@ -55,6 +192,21 @@ class AppManager:
             return 0.0
         return (time.monotonic() - self._last_feedback_time) / self._feedback_duration
 
+    def tab_index_at(self, x: int, y: int, height: int | None = None, at_bottom: bool = False) -> int | None:
+        """Return the index of the tab at (x, y) in screen coordinates, or None.
+
+        Tabs run along the top, or along the bottom of a `height` tall screen.
+        """
+        if at_bottom and height:
+            if not (height - self.TAB_HEIGHT <= y <= height):
+                return None
+        elif not (0 <= y <= self.TAB_HEIGHT):
+            return None
+        idx = (x - self.TAB_X) // self.TAB_WIDTH
+        if idx < 0 or idx >= len(self.apps):
+            return None
+        return int(idx)
+
     def handle_input(self, event: str) -> None:
         if event == "next":
             self.next()
@@ -66,10 +218,124 @@ class AppManager:
                 self.current.handle_input(event)
             except Exception:
                 pass
+            self._force_render = True
+            self.invalidate()
+
+    def paints_incrementally(self, ctx: Any) -> bool:
+        """True if `render(ctx)` keeps the frame up to date itself (retained scene).
+
+        Callers must then skip their per-frame `clear()`.
+        """
+        return hasattr(ctx, "epoch") and hasattr(ctx, "fill_rect") and hasattr(ctx, "text_size")
+
+    def _tab_fg(self, i: int, fb_active: bool, rgb565: bool = False) -> Any:
+        p = self.palette
+        if i != self.index:
+            return p.dim565 if rgb565 else p.dim
+        if fb_active:
+            # Tk pulses the string colour itself (TkInterface._tab_fg_override)
+            return p.pulse565_at(self.feedback_phase()) if rgb565 else p.feedback
+        return p.fg565 if rgb565 else p.fg
+
+    def _render_app(self, ctx: Any, retained: bool = False) -> bool:
+        """Render the current app within its budget.
+
+        `retained`: `ctx` is a scene layer, which keeps the last frame by itself when
+        the app isn't rendered; immediate contexts get the recorded calls replayed.
+        Returns whether the app actually rendered.
+        """
+        # Only an actual render sets this, so skipped frames aren't timed again
+        self.last_app_render = None
+        app = self.current
+        if not hasattr(app, "render"):
+            return False
+        idx = self.index
+        health = self.health[idx]
+        t0 = time.monotonic()
+        if health.demoted and not self._force_render and t0 - health.last_render < self.demoted_interval:
+            self._show_cached(ctx, idx, retained)
+            health.skipped += 1
+            return False
+        self._force_render = False
+        calls: list = []
+        target = ctx if retained else _Recorder(ctx, calls)
+        if self.hang_timeout:
+            faulthandler.dump_traceback_later(self.hang_timeout)
+        try:
+            app.render(target)
+        except Exception as e:
+            health.errors += 1
+            logger.debug("Render of %s failed: %s", getattr(app, "name", "?"), e)
+            self._show_cached(ctx, idx, retained)
+            raise
+        finally:
+            if self.hang_timeout:
+                faulthandler.cancel_dump_traceback_later()
+            elapsed = time.monotonic() - t0
+            health.last_render = t0
+            health.last_seconds = elapsed
+            # (app name, seconds) of the last app render, for frame timing
+            self.last_app_render = (getattr(app, "name", "?"), elapsed)
+        if not retained:
+            self._cached[idx] = calls
+        self._account(app, health, elapsed)
+        return True
+
+    def _show_cached(self, ctx: Any, idx: int, retained: bool) -> None:
+        if retained:
+            return
+        for args, kwargs in self._cached.get(idx, ()):
+            ctx.draw_text(*args, **kwargs)
+
+    def _account(self, app: Any, health: AppHealth, elapsed: float) -> None:
+        name = getattr(app, "name", "?")
+        if elapsed > self.frame_budget:
+            health.overruns += 1
+            health.streak = health.streak + 1 if health.streak > 0 else 1
+            if not health.demoted and health.streak >= self.OVERRUN_LIMIT:
+                health.demoted = True
+                logger.info("Demoting %s: render took %.0f ms (budget %.0f ms)", name, elapsed * 1000, self.frame_budget * 1000)
+        else:
+            health.streak = health.streak - 1 if health.streak < 0 else -1
+            if health.demoted and -health.streak >= self.RECOVER_AFTER:
+                health.demoted = False
+                logger.info("Restoring %s to full refresh rate", name)
+
+    def _render_scene(self, ctx: Any) -> None:
+        bg = self.palette.bg565
+        if to_rgb565(ctx.background) != bg:
+            # Theme background (at start, or after a theme change): repaint on it
+            ctx.background = bg
+            self.scene.invalidate()
+        fb_active = self._is_feedback_active()
+        tabs = self.scene.layer("tabs")
+        x = self.TAB_X
+        for i, app in enumerate(self.apps):
+            label = getattr(app, "name", f"App{i}")[:8]
+            tabs.text(f"tab{i}", x, 10, label, self._tab_fg(i, fb_active, rgb565=True))
+            x += self.TAB_WIDTH
+        sc = self._app_layers.get(self.index)
+        if sc is None:
+            sc = self._app_layers[self.index] = SceneContext(self.scene.layer(f"app{self.index}"), ctx, self.scene)
+        sc.ctx = ctx
+        for i, other in self._app_layers.items():
+            other.layer.visible = i == self.index
+        sc.begin()
+        rendered = False
+        try:
+            rendered = self._render_app(sc, retained=True)
+        finally:
+            # Skipped and failed renders leave the previous nodes in place
+            if rendered:
+                sc.end()
+            self.scene.paint(ctx)
 
     def render(self, ctx: Any) -> None:
+        if self.paints_incrementally(ctx):
+            self._render_scene(ctx)
+            return
         # Draw tab bar (top or bottom depending on ctx.tab_at_bottom)
-        x = 10
+        x = self.TAB_X
         fb_active = self._is_feedback_active()
 
         # Determine y position based on context preference
@@ -88,10 +354,7 @@ class AppManager:
 
         for i, app in enumerate(self.apps):
             label = getattr(app, "name", f"App{i}")[:8]
-            if i == self.index:
-                fg = "#99ff66" if not fb_active else self._feedback_color
-            else:
-                fg = "#66aa44"
+            fg = self._tab_fg(i, fb_active)
             # Allow TkInterface to override tab fg (pulse effect)
             if hasattr(ctx, "_tab_fg_override") and ctx._tab_fg_override is not None and i == self.index:
                 fg = ctx._tab_fg_override
@@ -102,10 +365,12 @@ class AppManager:
                 full_key = getattr(app, "name", f"app{i}").lower()
                 if hasattr(ctx, "icons") and full_key in ctx.icons and hasattr(ctx, "canvas"):
                     try:
-                        if hasattr(ctx, "tab_at_bottom") and ctx.tab_at_bottom:
-                            ctx.canvas.create_image(x, icon_y, image=ctx.icons[full_key], anchor="sw")
+                        anchor = "sw" if getattr(ctx, "tab_at_bottom", False) else "nw"
+                        if hasattr(ctx, "draw_image"):
+                            # Retained canvas item, one per tab
+                            ctx.draw_image(x, icon_y, ctx.icons[full_key], anchor=anchor, key=f"tabicon{i}")
                         else:
-                            ctx.canvas.create_image(x, icon_y, image=ctx.icons[full_key], anchor="nw")
+                            ctx.canvas.create_image(x, icon_y, image=ctx.icons[full_key], anchor=anchor)
                         icon_drawn = True
                     except Exception:
                         # ignore icon drawing errors
@@ -116,7 +381,6 @@ class AppManager:
             # Adjust text offset and vertical position if icon drawn
             text_x = x + (24 if icon_drawn else 0)
             ctx.draw_text(text_x, text_y, label, fg=fg)
-            x += 60
+            x += self.TAB_WIDTH
         # Delegate to active app
-        if hasattr(self.current, "render"):
-            self.current.render(ctx)
+        self._render_app(ctx)
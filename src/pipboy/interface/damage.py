@@ -0,0 +1,129 @@
+"""Damage (dirty rectangle) tracking for framebuffer displays
+
+Drawing primitives report the rectangles they touch; at flush time the tracker
+coalesces them into a small set of rectangles so each costs one window/RAMWR
+sequence on the panel instead of a full-frame push.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+Rect = Tuple[int, int, int, int]  # x0, y0, x1, y1 (exclusive)
+
+
+def _area(r: Rect) -> int:
+    return (r[2] - r[0]) * (r[3] - r[1])
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def _overlap(a: Rect, b: Rect) -> int:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0
+
+
+def _waste(a: Rect, b: Rect) -> int:
+    """Pixels that merging a and b would send without them being damaged."""
+    return _area(_union(a, b)) - _area(a) - _area(b) + _overlap(a, b)
+
+
+def coalesce(rects: List[Rect], max_rects: int = 8, slack: int = 64) -> List[Rect]:
+    """Merge rectangles whose union wastes at most `slack` pixels, then keep merging
+    the cheapest pair until no more than `max_rects` remain."""
+    rects = list(rects)
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                if _waste(rects[i], rects[j]) <= slack:
+                    rects[i] = _union(rects[i], rects[j])
+                    del rects[j]
+                    merged = True
+                    break
+            if merged:
+                break
+    while len(rects) > max_rects:
+        best = None
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                w = _waste(rects[i], rects[j])
+                if best is None or w < best[0]:
+                    best = (w, i, j)
+        _, i, j = best
+        rects[i] = _union(rects[i], rects[j])
+        del rects[j]
+    return rects
+
+
+def scroll_rects(rects: List[Rect], y0: int, y1: int, dy: int) -> List[Rect]:
+    """Rectangles after the rows of band [y0, y1) move up by `dy` (down if negative).
+
+    Parts above and below the band stay put; the part inside moves with the content
+    and is clipped to the band.
+    """
+    out = []
+    for r in rects:
+        if r[3] <= y0 or r[1] >= y1:
+            out.append(r)
+            continue
+        if r[1] < y0:
+            out.append((r[0], r[1], r[2], y0))
+        if r[3] > y1:
+            out.append((r[0], y1, r[2], r[3]))
+        top = max(y0, max(r[1], y0) - dy)
+        bottom = min(y1, min(r[3], y1) - dy)
+        if top < bottom:
+            out.append((r[0], top, r[2], bottom))
+    return out
+
+
+class DamageTracker:
+    """Accumulate damaged regions of a width x height surface.
+
+    `slack` is the number of undamaged pixels worth sending to save one extra
+    window command; `max_rects` bounds how many rectangles a flush produces.
+    """
+
+    def __init__(self, width: int, height: int, max_rects: int = 8, slack: int = 64):
+        self.width = width
+        self.height = height
+        self.max_rects = max_rects
+        self.slack = slack
+        self._rects: List[Rect] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._rects)
+
+    def add(self, x: int, y: int, w: int, h: int) -> None:
+        r = (max(0, x), max(0, y), min(self.width, x + w), min(self.height, y + h))
+        if r[0] >= r[2] or r[1] >= r[3]:
+            return
+        for e in self._rects:
+            if e[0] <= r[0] and e[1] <= r[1] and e[2] >= r[2] and e[3] >= r[3]:
+                return
+        self._rects.append(r)
+        if len(self._rects) > 4 * self.max_rects:
+            # Keep the pending list bounded while a frame is being drawn
+            self._rects = coalesce(self._rects, self.max_rects, self.slack)
+
+    def add_full(self) -> None:
+        self._rects = [(0, 0, self.width, self.height)]
+
+    def clear(self) -> None:
+        self._rects = []
+
+    def scroll(self, y0: int, y1: int, dy: int) -> None:
+        """Move pending damage along with content scrolled by `dy` rows in band [y0, y1)."""
+        self._rects = scroll_rects(self._rects, y0, y1, dy)
+
+    def rects(self) -> List[Rect]:
+        """Pending damage as raw (x0, y0, x1, y1) rectangles."""
+        return list(self._rects)
+
+    def coalesce(self) -> List[Tuple[int, int, int, int]]:
+        """Return the coalesced damage as (x, y, w, h) rectangles."""
+        return [(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in coalesce(self._rects, self.max_rects, self.slack)]
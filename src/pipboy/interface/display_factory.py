@@ -0,0 +1,55 @@
+"""Create the display backend selected by `display.type` in config.yaml
+
+    display:
+      type: ili9486        # userspace SPI (default)
+      rotation: 0
+
+    display:
+      type: fbdev          # kernel framebuffer (fbtft / panel-mipi-dbi)
+      device: /dev/fb1
+
+    display:
+      type: offscreen      # in-memory, no hardware or X server
+      snapshot_dir: /tmp/pipboy
+      snapshot_every: 30   # PNG every N frames; 0 only on demand
+
+Other keys of the section are passed to the backend's config dataclass when it has
+a field of that name and ignored otherwise.
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any
+
+
+def _build(config_cls: type, conf: dict) -> Any:
+    names = {f.name for f in fields(config_cls)}
+    return config_cls(**{k: v for k, v in conf.items() if k in names})
+
+
+def create_display(conf: dict | None = None, profile: Any = None) -> Any:
+    """Return an uninitialized display for a `display` config section.
+
+    `profile` (a HardwareProfile) supplies SPI bus and tuning values the section
+    doesn't set.
+    """
+    conf = dict(conf or {})
+    kind = str(conf.pop("type", "ili9486")).lower()
+    if kind == "ili9486":
+        from .ili9486_display import ILI9486Config, ILI9486Display
+
+        if profile is not None:
+            conf.setdefault("spi_bus", profile.spi_bus)
+            conf.setdefault("spi_device", profile.spi_device)
+            conf.setdefault("spi_speed_hz", profile.spi_speed_hz)
+            conf.setdefault("spi_chunk_size", profile.spi_chunk_size)
+        return ILI9486Display(_build(ILI9486Config, conf))
+    if kind in ("fbdev", "framebuffer"):
+        from .fbdev_display import FBDevConfig, FBDevDisplay
+
+        return FBDevDisplay(_build(FBDevConfig, conf))
+    if kind in ("offscreen", "headless"):
+        from .offscreen_display import OffscreenConfig, OffscreenDisplay
+
+        return OffscreenDisplay(_build(OffscreenConfig, conf))
+    raise ValueError(f"Unknown display type {kind!r}")
@@ -0,0 +1,154 @@
+"""Linux framebuffer (/dev/fbN) display backend
+
+For panels driven by the kernel (fbtft, panel-mipi-dbi), which appear as a
+framebuffer device. Apps draw into the same `Framebuffer` as with `ILI9486Display`,
+in the device's native little-endian RGB565; `update()` copies the changed spans into
+an mmap of the device, and the kernel takes care of the transfer. There is no
+userspace SPI at all.
+
+Drawing stays in a private buffer rather than the mapping itself: fbtft's deferred
+I/O sends every page written to, so only spans that actually changed (damage narrowed
+by a `TileDiffer`) are copied in.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from .damage import coalesce
+from .frame_diff import TileDiffer
+from .framebuffer import Framebuffer
+
+
+@dataclass
+class FBDevConfig:
+    device: str = "/dev/fb1"
+    # 0: read from /sys/class/graphics/fbN
+    width: int = 0
+    height: int = 0
+    # Bytes per device line; 0: from sysfs, else width * 2
+    stride: int = 0
+    # Shown until AppManager paints the theme background (Palette.bg565)
+    background: str = "#001100"
+    text_scale: int = 1
+    font: str = "builtin"
+    font_size: int = 0
+    diff_tile: int = 16
+
+
+def read_fb_geometry(device: str) -> tuple[int, int, int, int] | None:
+    """Return (width, height, stride, bits_per_pixel) of a framebuffer from sysfs."""
+    sys_dir = Path("/sys/class/graphics") / Path(device).name
+    try:
+        w, h = (int(v) for v in (sys_dir / "virtual_size").read_text().strip().split(","))
+        stride = int((sys_dir / "stride").read_text().strip())
+        bpp = int((sys_dir / "bits_per_pixel").read_text().strip())
+        return w, h, stride, bpp
+    except Exception:
+        return None
+
+
+class FBDevDisplay(Framebuffer):
+    def __init__(self, config: FBDevConfig | None = None):
+        self.config = config or FBDevConfig()
+        width, height, stride = self.config.width, self.config.height, self.config.stride
+        self.bits_per_pixel = 16
+        if not (width and height):
+            geom = read_fb_geometry(self.config.device)
+            if geom is not None:
+                width, height, sys_stride, self.bits_per_pixel = geom
+                stride = stride or sys_stride
+        width = width or 480
+        height = height or 320
+        super().__init__(width, height, byteorder="little", background=self.config.background)
+        self.text_scale = self.config.text_scale
+        self.font = self.config.font
+        self.font_size = self.config.font_size or None
+        self.device_stride = stride or width * 2
+        self.differ = TileDiffer(width, height, self.config.diff_tile) if self.config.diff_tile else None
+        self.initialized = False
+        self.last_flush_bytes = 0
+        self.last_flush_seconds = 0.0
+        self.last_flush_rects: list[tuple[int, int, int, int]] = []
+        # Called with (seconds, bytes) once per completed copy into the device
+        self.on_flush: Callable[[float, int], None] | None = None
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+
+    def initialize(self) -> None:
+        if self.bits_per_pixel != 16:
+            raise RuntimeError(f"{self.config.device} is {self.bits_per_pixel} bpp; only RGB565 is supported")
+        try:
+            self._fd = os.open(self.config.device, os.O_RDWR)
+            self._map = mmap.mmap(self._fd, self.device_stride * self.height, mmap.MAP_SHARED)
+        except Exception:
+            # No device (dev machine): keep drawing, skip flushing
+            self.close()
+        self.clear()
+        self.initialized = True
+
+    def _copy_rects(self, rects: list[tuple[int, int, int, int]]) -> int:
+        dst = self._map
+        ds = self.device_stride
+        s = self.stride
+        src = self._mv
+        for x, y, w, h in rects:
+            if x == 0 and w == self.width and ds == s:
+                dst[y * ds : (y + h) * ds] = src[y * s : (y + h) * s]
+                continue
+            n = w * 2
+            so = y * s + x * 2
+            do = y * ds + x * 2
+            for _ in range(h):
+                dst[do : do + n] = src[so : so + n]
+                so += s
+                do += ds
+        return sum(w * h * 2 for _, _, w, h in rects)
+
+    def update(self) -> None:
+        # Copy only the changed spans into the device mapping
+        if not self.damage:
+            self.last_flush_rects = []
+            self.last_flush_bytes = 0
+            self.last_flush_seconds = 0.0
+            return
+        if self.differ is not None:
+            changed = self.differ.diff(self.buffer, self.damage.rects())
+            rects = [(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in coalesce(changed, self.damage.max_rects, self.damage.slack)]
+        else:
+            rects = self.damage.coalesce()
+        self.damage.clear()
+        self.last_flush_rects = rects
+        if self._map is None:
+            self.last_flush_bytes = 0
+            self.last_flush_seconds = 0.0
+            return
+        t0 = time.perf_counter()
+        self.last_flush_bytes = self._copy_rects(rects)
+        self.last_flush_seconds = time.perf_counter() - t0
+        if self.on_flush is not None:
+            self.on_flush(self.last_flush_seconds, self.last_flush_bytes)
+        if self.differ is not None:
+            self.differ.commit(self.buffer, rects)
+
+    def close(self) -> None:
+        if self._map is not None:
+            try:
+                self._map.close()
+            except Exception:
+                pass
+            self._map = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except Exception:
+                pass
+            self._fd = None
+
+    def get_last_frame(self) -> memoryview:
+        """Read-only view of the framebuffer (little-endian RGB565, row-major)."""
+        return self._mv.toreadonly()
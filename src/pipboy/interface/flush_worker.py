@@ -0,0 +1,90 @@
+"""Background flush worker for framebuffer displays
+
+The worker owns the transfer of one presented frame at a time. The render loop hands
+it a frame (for the framebuffer displays, the rectangles to send plus the panel scroll
+state to send them under) with `submit()`, which never blocks: if a transfer is still in
+flight the new frame is refused and the caller keeps its damage for the next frame
+("drop stale frame"). At most one frame is ever queued behind the panel, so what
+reaches the screen is never more than one transfer old.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FlushWorker:
+    def __init__(self, flush: Callable[[Any], int], name: str = "pipboy-flush"):
+        """flush: callable sending one submitted frame, returning bytes sent"""
+        self._flush = flush
+        self._name = name
+        self._cond = threading.Condition()
+        self._pending: Optional[Any] = None
+        self._busy = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.frames_flushed = 0
+        self.last_flush_bytes = 0
+        self.last_flush_seconds = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self._busy or self._pending is not None
+
+    def submit(self, frame: Any, timeout: float = 0.0) -> bool:
+        """Queue a frame for transfer. Waits at most `timeout` seconds for the
+        previous transfer to finish; returns False if the frame was not accepted."""
+        with self._cond:
+            if self._busy or self._pending is not None:
+                if timeout <= 0 or not self._cond.wait_for(
+                    lambda: not self._busy and self._pending is None, timeout
+                ):
+                    return False
+            self._pending = frame
+            self._cond.notify_all()
+            return True
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._busy and self._pending is None, timeout)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._stopping)
+                if self._stopping:
+                    return
+                frame = self._pending
+                self._pending = None
+                self._busy = True
+            t0 = time.perf_counter()
+            try:
+                self.last_flush_bytes = self._flush(frame)
+            except Exception as e:
+                # Keep the worker alive; the next frame retries
+                logger.debug("Display flush failed: %s", e)
+            self.last_flush_seconds = time.perf_counter() - t0
+            with self._cond:
+                self._busy = False
+                self.frames_flushed += 1
+                self._cond.notify_all()
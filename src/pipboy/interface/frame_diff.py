@@ -0,0 +1,181 @@
+"""Tile-based frame diffing for framebuffer displays
+
+Apps redraw their whole view every tick, so damage tracking alone reports everything
+they touched even when it came out identical. `TileDiffer` keeps a copy of what the
+panel is showing and compares the new frame against it in fixed-size tiles, so only
+tiles whose pixels actually changed get sent. Damage, when available, narrows which
+tiles are compared at all.
+
+Comparison is on `bytearray` slices (a memcmp each): a whole tile band first, then
+rows, then the individual tiles of rows that differ. Dirty tiles are merged into
+horizontal runs per band, and runs with the same columns in consecutive bands into
+taller rectangles, so each rectangle costs one set_window/RAMWR sequence.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from .damage import Rect, scroll_rects
+
+
+class TileDiffer:
+    def __init__(self, width: int, height: int, tile: int = 16):
+        self.width = width
+        self.height = height
+        self.tile = tile
+        self.stride = width * 2
+        self.cols = (width + tile - 1) // tile
+        self.bands = (height + tile - 1) // tile
+        # What the panel currently shows, in framebuffer layout
+        self.reference = bytearray(self.stride * height)
+        # Regions whose panel contents are unknown: always reported dirty
+        self._forced: List[Rect] = [(0, 0, width, height)]
+        self.tiles_compared = 0
+        self.tiles_changed = 0
+
+    def invalidate(self, x: int = 0, y: int = 0, w: Optional[int] = None, h: Optional[int] = None) -> None:
+        """Mark a region as not matching the reference (default: everything)."""
+        w = self.width - x if w is None else w
+        h = self.height - y if h is None else h
+        self._forced.append((max(0, x), max(0, y), min(self.width, x + w), min(self.height, y + h)))
+
+    def scroll(self, y0: int, y1: int, dy: int) -> None:
+        """Mirror a panel-side scroll of band [y0, y1) by `dy` rows into the reference.
+
+        The rows it exposes show whatever scrolled off, so they are invalidated.
+        """
+        n = y1 - y0
+        s = self.stride
+        ref = memoryview(self.reference)
+        self._forced = scroll_rects(self._forced, y0, y1, dy)
+        if abs(dy) >= n:
+            self.invalidate(0, y0, self.width, n)
+        elif dy > 0:
+            ref[y0 * s : (y1 - dy) * s] = ref[(y0 + dy) * s : y1 * s]
+            self.invalidate(0, y1 - dy, self.width, dy)
+        else:
+            ref[(y0 - dy) * s : y1 * s] = ref[y0 * s : (y1 + dy) * s]
+            self.invalidate(0, y0, self.width, -dy)
+
+    def _tiles(self, rects: List[Rect], grid: List[Optional[bytearray]]) -> None:
+        t = self.tile
+        for x0, y0, x1, y1 in rects:
+            if x0 >= x1 or y0 >= y1:
+                continue
+            c0, c1 = x0 // t, (x1 - 1) // t + 1
+            for b in range(y0 // t, (y1 - 1) // t + 1):
+                row = grid[b]
+                if row is None:
+                    row = grid[b] = bytearray(self.cols)
+                row[c0:c1] = b"\x01" * (c1 - c0)
+
+    def diff(self, buf: bytearray, hints: Optional[List[Rect]] = None) -> List[Rect]:
+        """Return the (x0, y0, x1, y1) rectangles where `buf` differs from the reference.
+
+        `hints` limits the comparison to tiles touching those rectangles, and the
+        changed tiles are clipped back to them so a small damaged area never grows
+        to whole tiles. Without hints every tile is compared.
+        """
+        t = self.tile
+        stride = self.stride
+        ref = self.reference
+        candidates: List[Optional[bytearray]] = [None] * self.bands
+        self._tiles([(0, 0, self.width, self.height)] if hints is None else hints, candidates)
+        dirty: List[Optional[bytearray]] = [None] * self.bands
+        self._tiles(self._forced, dirty)
+        compared = changed = 0
+        for b in range(self.bands):
+            cand = candidates[b]
+            if cand is None:
+                continue
+            known = dirty[b]
+            cols = [c for c in range(self.cols) if cand[c] and not (known and known[c])]
+            if not cols:
+                continue
+            compared += len(cols)
+            y0 = b * t
+            y1 = min(self.height, y0 + t)
+            lo = cols[0] * t * 2
+            hi = min(self.width, (cols[-1] + 1) * t) * 2
+            if lo == 0 and hi == stride and buf[y0 * stride : y1 * stride] == ref[y0 * stride : y1 * stride]:
+                continue
+            row = dirty[b] if known is not None else bytearray(self.cols)
+            for y in range(y0, y1):
+                off = y * stride
+                if buf[off + lo : off + hi] == ref[off + lo : off + hi]:
+                    continue
+                left = []
+                for c in cols:
+                    a = off + c * t * 2
+                    e = off + min(self.width, (c + 1) * t) * 2
+                    if buf[a:e] != ref[a:e]:
+                        row[c] = 1
+                        changed += 1
+                    else:
+                        left.append(c)
+                cols = left
+                if not cols:
+                    break
+                lo = cols[0] * t * 2
+                hi = min(self.width, (cols[-1] + 1) * t) * 2
+            dirty[b] = row
+        self.tiles_compared = compared
+        self.tiles_changed = changed
+        merged = self._merge(dirty)
+        if hints is None:
+            return merged
+        out = []
+        for h in hints + self._forced:
+            for r in merged:
+                c = (max(h[0], r[0]), max(h[1], r[1]), min(h[2], r[2]), min(h[3], r[3]))
+                if c[0] < c[2] and c[1] < c[3]:
+                    out.append(c)
+        return out
+
+    def _merge(self, dirty: List[Optional[bytearray]]) -> List[Rect]:
+        t = self.tile
+        out: List[Rect] = []
+        # (c0, c1) -> index in out of the rectangle ending at the previous band
+        open_runs: dict = {}
+        for b in range(self.bands):
+            row = dirty[b]
+            runs: List[Tuple[int, int]] = []
+            if row is not None:
+                c = 0
+                while c < self.cols:
+                    if row[c]:
+                        start = c
+                        while c < self.cols and row[c]:
+                            c += 1
+                        runs.append((start, c))
+                    else:
+                        c += 1
+            y1 = min(self.height, (b + 1) * t)
+            still_open = {}
+            for run in runs:
+                i = open_runs.get(run)
+                if i is not None:
+                    x0, y0, x1, _ = out[i]
+                    out[i] = (x0, y0, x1, y1)
+                else:
+                    i = len(out)
+                    out.append((run[0] * t, b * t, min(self.width, run[1] * t), y1))
+                still_open[run] = i
+            open_runs = still_open
+        return out
+
+    def commit(self, buf: bytearray, rects: List[Tuple[int, int, int, int]]) -> None:
+        """Record that the (x, y, w, h) rectangles of `buf` were handed to the panel."""
+        stride = self.stride
+        ref = self.reference
+        for x, y, w, h in rects:
+            if x == 0 and w == self.width:
+                ref[y * stride : (y + h) * stride] = buf[y * stride : (y + h) * stride]
+                continue
+            n = w * 2
+            off = y * stride + x * 2
+            for _ in range(h):
+                ref[off : off + n] = buf[off : off + n]
+                off += stride
+        self._forced = []
+
@@ -0,0 +1,130 @@
+"""Low-overhead per-frame timing for the hardware render loop
+
+`HardwareInterface.run_once` records the duration of each phase of a frame (clear,
+`AppManager.render`, the current app's own render, `display.update`) into fixed-size
+ring buffers, one per series. The display's transfer time and size ("flush",
+"flush_bytes") are recorded once per completed transfer instead, so frames that send
+nothing add no samples and an async flush is counted when its worker finishes.
+Recording is an array store; percentiles are only computed when asked for.
+
+Read it programmatically with `FrameStats.summary()`, or on a running Pi send
+SIGUSR1 to print a table to stderr:
+
+    kill -USR1 $(pgrep -f pipboy)
+"""
+from __future__ import annotations
+
+import logging
+import math
+import signal
+import sys
+from array import array
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class RingStat:
+    """The last `size` samples of one series."""
+
+    __slots__ = ("_buf", "_size", "_next", "count")
+
+    def __init__(self, size: int = 512):
+        self._buf = array("d", bytes(8 * size))
+        self._size = size
+        self._next = 0
+        # Samples ever added (the ring holds the last min(count, size))
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self._buf[self._next] = value
+        self._next = (self._next + 1) % self._size
+        self.count += 1
+
+    def values(self) -> list[float]:
+        if self.count < self._size:
+            return list(self._buf[: self.count])
+        return list(self._buf[self._next :]) + list(self._buf[: self._next])
+
+    def percentiles(self, *ps: float) -> list[float]:
+        """Nearest-rank percentiles of the retained samples (0.0 when empty)."""
+        vals = sorted(self.values())
+        if not vals:
+            return [0.0 for _ in ps]
+        n = len(vals)
+        return [vals[min(n - 1, max(0, math.ceil(p / 100.0 * n) - 1))] for p in ps]
+
+    def summary(self) -> dict[str, float]:
+        vals = self.values()
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        return {
+            "count": self.count,
+            "mean": sum(vals) / len(vals) if vals else 0.0,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "max": max(vals) if vals else 0.0,
+        }
+
+
+class FrameStats:
+    # Series holding byte counts rather than seconds
+    BYTE_SERIES = ("flush_bytes",)
+
+    def __init__(self, size: int = 512):
+        self.size = size
+        self.series: dict[str, RingStat] = {}
+        self.errors: dict[str, int] = {}
+        self.last_errors: dict[str, str] = {}
+        self.frames = 0
+
+    def record(self, name: str, value: float) -> None:
+        stat = self.series.get(name)
+        if stat is None:
+            stat = self.series[name] = RingStat(self.size)
+        stat.add(value)
+
+    def error(self, phase: str, exc: BaseException) -> None:
+        """Count an exception swallowed by the render loop."""
+        self.errors[phase] = self.errors.get(phase, 0) + 1
+        self.last_errors[phase] = f"{type(exc).__name__}: {exc}"
+        logger.debug("Frame phase %s failed: %s", phase, exc)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            # list(): the flush worker may add a series meanwhile
+            "series": {name: stat.summary() for name, stat in list(self.series.items())},
+            "errors": dict(self.errors),
+        }
+
+    def format(self) -> str:
+        lines = [f"frames: {self.frames}", f"{'series':<24}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+        for name in sorted(self.series):
+            s = self.series[name].summary()
+            if name in self.BYTE_SERIES:
+                cells = "".join(f"{s[k]:>10.0f}" for k in ("p50", "p95", "p99", "max"))
+                name = f"{name} (B)"
+            else:
+                cells = "".join(f"{s[k] * 1000:>10.2f}" for k in ("p50", "p95", "p99", "max"))
+                name = f"{name} (ms)"
+            lines.append(f"{name:<24}{s['count']:>8}{cells}")
+        for phase, n in sorted(self.errors.items()):
+            lines.append(f"errors in {phase}: {n} (last: {self.last_errors.get(phase)})")
+        return "\n".join(lines)
+
+    def dump(self, out: Optional[TextIO] = None) -> None:
+        out = out or sys.stderr
+        out.write(self.format() + "\n")
+        out.flush()
+
+    def install_signal_handler(self, signum: Optional[int] = None) -> bool:
+        """Dump to stderr on `signum` (default SIGUSR1). Only works on the main thread."""
+        signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            return False
+        try:
+            signal.signal(signum, lambda *_: self.dump())
+            return True
+        except (ValueError, OSError):
+            return False
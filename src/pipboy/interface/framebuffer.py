@@ -0,0 +1,301 @@
+"""RGB565 framebuffer with in-place drawing primitives
+
+The display backends share this class: pixels live in a single preallocated
+`bytearray` laid out row-major in the panel's wire byte order (big-endian RGB565 for
+SPI panels), so flushing is a memoryview slice rather than a conversion pass. Drawing
+never reallocates the buffer; primitives write rows with slice assignment, and text is
+copied from pre-rasterized glyph strips (see `glyph_atlas`).
+
+Every primitive reports the rectangle it touched to a `DamageTracker`, and `clear()`
+only erases what was drawn since the previous clear, so redrawing a mostly static
+screen leaves a handful of small dirty rectangles to flush.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from . import font5x7
+from .damage import DamageTracker, scroll_rects
+from .glyph_atlas import BUILTIN, GlyphAtlas
+from .rgb565 import RGB565ImageCache, image_size, image_to_rgb565, to_rgb565
+
+# Past this many drawn rectangles per frame, clear() falls back to a full fill
+_MAX_INK_RECTS = 256
+
+
+def pack_rect(src: memoryview, stride: int, x: int, y: int, w: int, h: int, out: memoryview | None) -> memoryview:
+    """Return rectangle (x, y, w, h) of a row-major RGB565 buffer as one contiguous view.
+
+    Rectangles spanning whole rows are sliced straight out of `src`; others are
+    copied row by row into `out`.
+    """
+    if x == 0 and w * 2 == stride:
+        return src[y * stride : (y + h) * stride]
+    n = w * 2
+    s = y * stride + x * 2
+    d = 0
+    for _ in range(h):
+        out[d : d + n] = src[s : s + n]
+        s += stride
+        d += n
+    return out[:d]
+
+
+def copy_rect(dst: memoryview, src: memoryview, stride: int, x: int, y: int, w: int, h: int) -> None:
+    """Copy rectangle (x, y, w, h) between two buffers of identical geometry."""
+    if x == 0 and w * 2 == stride:
+        dst[y * stride : (y + h) * stride] = src[y * stride : (y + h) * stride]
+        return
+    n = w * 2
+    off = y * stride + x * 2
+    for _ in range(h):
+        dst[off : off + n] = src[off : off + n]
+        off += stride
+
+
+class Framebuffer:
+    def __init__(self, width: int = 480, height: int = 320, byteorder: str = "big", background: Any = 0):
+        self.byteorder = byteorder
+        self.background = background
+        self._allocate(width, height)
+        self.image_cache = RGB565ImageCache(byteorder=byteorder)
+        self.glyphs = GlyphAtlas(byteorder=byteorder)
+        # draw_text defaults; backends set these from their config
+        self.text_scale = 1
+        self.font = BUILTIN
+        self.font_size: int | None = None
+
+    def _allocate(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.stride = width * 2
+        self.buffer = bytearray(self.stride * height)
+        self._mv = memoryview(self.buffer)
+        # colour word -> one full row of that colour, used as a slice source
+        self._row_patterns: dict[int, memoryview] = {}
+        self.damage = DamageTracker(width, height)
+        # Rectangles drawn since the last clear(); None forces a full clear
+        self._ink: list[tuple[int, int, int, int]] | None = None
+        self._clear_word: int | None = None
+        self._scratch: memoryview | None = None
+        # Bumped whenever the contents are moved wholesale (clear, resize, scroll) so retained
+        # painters (see `scene`) know to start over
+        self.epoch = getattr(self, "epoch", 0) + 1
+
+    def resize(self, width: int, height: int) -> None:
+        """Reallocate for a new geometry; the contents are lost and fully damaged."""
+        self._allocate(width, height)
+        self.damage.add_full()
+
+    # Helpers
+    def _row_pattern(self, color: Any) -> memoryview:
+        word = to_rgb565(color)
+        pat = self._row_patterns.get(word)
+        if pat is None:
+            if len(self._row_patterns) >= 32:
+                self._row_patterns.clear()
+            pat = memoryview(word.to_bytes(2, self.byteorder) * self.width)
+            self._row_patterns[word] = pat
+        return pat
+
+    def _clip(self, x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        return x0, y0, x1, y1
+
+    def _mark(self, x: int, y: int, w: int, h: int) -> None:
+        self.damage.add(x, y, w, h)
+        if self._ink is not None:
+            if len(self._ink) >= _MAX_INK_RECTS:
+                self._ink = None
+            else:
+                self._ink.append((x, y, w, h))
+
+    def _fill(self, x: int, y: int, w: int, h: int, color: Any) -> None:
+        x0, y0, x1, y1 = self._clip(x, y, w, h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        n = (x1 - x0) * 2
+        first = y0 * self.stride + x0 * 2
+        self._mv[first : first + n] = self._row_pattern(color)[:n]
+        self._copy_first_row(x0, y0, x1, y1)
+
+    def _copy_first_row(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        # Replicate row y0 of the span [x0, x1) down to y1
+        mv = self._mv
+        stride = self.stride
+        first = y0 * stride + x0 * 2
+        if x0 == 0 and x1 == self.width:
+            # Contiguous block: double the filled region each copy
+            total = (y1 - y0) * stride
+            done = stride
+            while done < total:
+                n = min(done, total - done)
+                mv[first + done : first + done + n] = mv[first : first + n]
+                done += n
+            return
+        n = (x1 - x0) * 2
+        src = mv[first : first + n]
+        for off in range(first + stride, y1 * stride, stride):
+            mv[off : off + n] = src
+
+    # Primitives
+    def clear(self, color: Any = None) -> None:
+        """Reset the frame to `color` (default: background).
+
+        If the colour matches the previous clear, only the rectangles drawn since then
+        are erased and damaged; otherwise the whole frame is filled.
+        """
+        color = self.background if color is None else color
+        word = to_rgb565(color)
+        if self._ink is None or word != self._clear_word:
+            self._fill(0, 0, self.width, self.height, color)
+            self.damage.add_full()
+            self._clear_word = word
+        else:
+            for x, y, w, h in self._ink:
+                self._fill(x, y, w, h, color)
+                self.damage.add(x, y, w, h)
+        self._ink = []
+        self.epoch += 1
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Any) -> None:
+        self._fill(x, y, w, h, color)
+        self._mark(x, y, w, h)
+
+    def draw_pixel(self, x: int, y: int, color: Any) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            off = y * self.stride + x * 2
+            self._mv[off : off + 2] = self._row_pattern(color)[:2]
+            self._mark(x, y, 1, 1)
+
+    def hline(self, x: int, y: int, w: int, color: Any) -> None:
+        self.fill_rect(x, y, w, 1, color)
+
+    def vline(self, x: int, y: int, h: int, color: Any) -> None:
+        self.fill_rect(x, y, 1, h, color)
+
+    def draw_rect(self, x: int, y: int, w: int, h: int, color: Any) -> None:
+        """Draw a one pixel wide rectangle outline."""
+        if w <= 0 or h <= 0:
+            return
+        self.hline(x, y, w, color)
+        self.hline(x, y + h - 1, w, color)
+        self.vline(x, y, h, color)
+        self.vline(x + w - 1, y, h, color)
+
+    def blit_rgb565(self, x: int, y: int, w: int, h: int, data: Any) -> None:
+        """Copy a w*h block of RGB565 pixels (already in buffer byte order) to (x, y)."""
+        x0, y0, x1, y1 = self._clip(x, y, w, h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = memoryview(data).cast("B")
+        src_stride = w * 2
+        n = (x1 - x0) * 2
+        s = (y0 - y) * src_stride + (x0 - x) * 2
+        d = y0 * self.stride + x0 * 2
+        for _ in range(y1 - y0):
+            self._mv[d : d + n] = src[s : s + n]
+            s += src_stride
+            d += self.stride
+        self._mark(x0, y0, x1 - x0, y1 - y0)
+
+    def draw_image(self, img: Any, x: int = 0, y: int = 0, cache: bool = False) -> None:
+        """Draw a PIL image or NumPy array at (x, y); `cache` reuses the RGB565
+        conversion for static assets."""
+        w, h = image_size(img)
+        data = self.image_cache.get(img) if cache else image_to_rgb565(img, self.byteorder)
+        self.blit_rgb565(x, y, w, h, data)
+
+    def scroll_region(self, y0: int, y1: int, dy: int, fill: Any = None) -> None:
+        """Move the rows of band [y0, y1) up by `dy` pixels (down if negative) and fill
+        the rows it exposes with `fill` (default: background).
+
+        Apps scrolling a list or log draw only the newly exposed rows afterwards.
+        `epoch` doesn't move; a retained `Scene` follows the scroll through
+        `SceneContext.scroll_region` instead of repainting.
+        """
+        y0 = max(0, y0)
+        y1 = min(self.height, y1)
+        n = y1 - y0
+        if n <= 0 or dy == 0:
+            return
+        color = self.background if fill is None else fill
+        s = self.stride
+        if abs(dy) >= n:
+            exposed = (y0, y1)
+        elif dy > 0:
+            self._mv[y0 * s : (y1 - dy) * s] = self._mv[(y0 + dy) * s : y1 * s]
+            exposed = (y1 - dy, y1)
+        else:
+            self._mv[(y0 - dy) * s : y1 * s] = self._mv[y0 * s : (y1 + dy) * s]
+            exposed = (y0, y0 - dy)
+        self._fill(0, exposed[0], self.width, exposed[1] - exposed[0], color)
+        if self._ink is not None:
+            moved = scroll_rects([(x, y, x + w, y + h) for x, y, w, h in self._ink], y0, y1, dy)
+            self._ink = [(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in moved]
+            if to_rgb565(color) != self._clear_word:
+                self._ink.append((0, exposed[0], self.width, exposed[1] - exposed[0]))
+        self._scroll_damage(y0, y1, dy, exposed)
+
+    def _scroll_damage(self, y0: int, y1: int, dy: int, exposed: tuple[int, int]) -> None:
+        # Nothing scrolls on the other side, so the whole band has to be resent
+        self.damage.add(0, y0, self.width, y1 - y0)
+
+    def rect_bytes(self, x: int, y: int, w: int, h: int) -> memoryview:
+        """Return the pixels of a rectangle as one contiguous view.
+
+        Full-width rectangles are a direct slice of the framebuffer; narrower ones are
+        packed into a preallocated scratch buffer, valid until the next call.
+        """
+        if self._scratch is None and not (x == 0 and w == self.width):
+            self._scratch = memoryview(bytearray(len(self.buffer)))
+        return pack_rect(self._mv, self.stride, x, y, w, h, self._scratch)
+
+    def text_size(self, text: str, scale: int | None = None, font: str | None = None, size: int | None = None) -> tuple[int, int]:
+        """The (width, height) `draw_text` paints and marks for `text`.
+
+        Measured on the same glyph strip draw_text blits from, so the cell includes
+        the built-in font's trailing spacing column (which draw_text paints in bg).
+        """
+        if not text:
+            return 0, 0
+        scale = self.text_scale if scale is None else scale
+        font = self.font if font is None else font
+        return self.glyphs.strip(font, size or self.font_size or font5x7.LINE_HEIGHT * scale, 0, 0).measure(text)
+
+    def draw_text(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        fg: Any = "#99ff66",
+        scale: int | None = None,
+        bg: Any = None,
+        font: str | None = None,
+        size: int | None = None,
+        color: Any = None,
+    ) -> None:
+        """Draw `text` from the glyph atlas with its top-left corner at (x, y).
+
+        Glyph cells are opaque: they are painted in `bg`, which defaults to the
+        background colour. `size` is the line height in pixels for TrueType fonts;
+        the built-in font uses `scale` instead. Unset options fall back to the
+        `text_scale`, `font` and `font_size` attributes; `color` is accepted for
+        callers using the older keyword.
+        """
+        if not text:
+            return
+        scale = self.text_scale if scale is None else scale
+        font = self.font if font is None else font
+        size = size or self.font_size or font5x7.LINE_HEIGHT * scale
+        fg = color if color is not None else fg
+        strip = self.glyphs.strip(font, size, fg, self.background if bg is None else bg)
+        if y >= self.height or y + strip.height <= 0 or x >= self.width:
+            return
+        tw, th = self.glyphs.draw_text(self._mv, self.width, self.height, x, y, text, strip)
+        x0, y0, x1, y1 = self._clip(x, y, tw, th)
+        if x0 < x1 and y0 < y1:
+            self._mark(x0, y0, x1 - x0, y1 - y0)
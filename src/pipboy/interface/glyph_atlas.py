@@ -0,0 +1,186 @@
+"""Pre-rasterized glyph atlas for framebuffer text
+
+Each (font, size, fg, bg) combination is rasterized once into a `GlyphStrip`: every
+printable ASCII glyph side by side in one packed RGB565 image. Drawing text is then
+a slice copy per glyph row from the strip into the framebuffer; nothing is
+rasterized per call. Strips are kept in an LRU bounded by count and bytes.
+
+Fonts are either the built-in 5x7 bitmap font (`"builtin"`, scaled by integer
+factors) or a TrueType file, given as a path or a name looked up in
+`resources/fonts`. TrueType rendering needs Pillow and is antialiased against `bg`.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import font5x7
+from .rgb565 import image_to_rgb565, rgb565_to_rgb, to_rgb565
+
+BUILTIN = "builtin"
+CHARSET = "".join(chr(c) for c in range(font5x7.FIRST_CHAR, font5x7.LAST_CHAR + 1))
+
+FONT_DIRS = [
+    Path(__file__).parent.parent.parent / "resources" / "fonts",
+    Path(__file__).parent.parent.parent.parent / "resources" / "fonts",
+    # fonts-dejavu-core, as suggested in resources/fonts/README.md
+    Path("/usr/share/fonts/truetype/dejavu"),
+]
+
+
+class GlyphStrip:
+    """One rasterized font/size/colour: glyphs packed left to right in a single row."""
+
+    def __init__(self, height: int, glyphs: Dict[str, Tuple[int, int]], data: bytearray, width: int):
+        self.height = height
+        # char -> (x offset, advance width) in pixels
+        self.glyphs = glyphs
+        self.data = data
+        self.width = width
+        self.stride = width * 2
+        self._mv = memoryview(data)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+    def glyph(self, ch: str) -> Tuple[int, int]:
+        g = self.glyphs.get(ch)
+        return g if g is not None else self.glyphs["?"]
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        return sum(self.glyph(ch)[1] for ch in text), self.height
+
+
+def _rasterize_builtin(size: int, fg: int, bg: int, byteorder: str) -> GlyphStrip:
+    scale = max(1, round(size / font5x7.LINE_HEIGHT))
+    cell = font5x7.GLYPH_ADVANCE * scale
+    height = font5x7.GLYPH_HEIGHT * scale
+    width = cell * len(CHARSET)
+    stride = width * 2
+    data = bytearray(bg.to_bytes(2, byteorder) * (width * height))
+    block = fg.to_bytes(2, byteorder) * scale
+    glyphs = {}
+    for i, ch in enumerate(CHARSET):
+        x0 = i * cell
+        glyphs[ch] = (x0, cell)
+        for col, bits in enumerate(font5x7.glyph_columns(ch)):
+            for row in range(font5x7.GLYPH_HEIGHT):
+                if bits >> row & 1:
+                    off = row * scale * stride + (x0 + col * scale) * 2
+                    for _ in range(scale):
+                        data[off : off + 2 * scale] = block
+                        off += stride
+    return GlyphStrip(height, glyphs, data, width)
+
+
+def find_font(name: str, search_dirs: Optional[Iterable[Path]] = None) -> Optional[Path]:
+    """Resolve a font path or a (case-insensitive) file stem under the font dirs."""
+    p = Path(name)
+    if p.suffix and p.exists():
+        return p
+    for d in search_dirs or FONT_DIRS:
+        try:
+            for f in Path(d).iterdir():
+                if f.suffix.lower() in (".ttf", ".otf") and f.stem.lower() == name.lower():
+                    return f
+        except Exception:
+            continue
+    return None
+
+
+def _rasterize_truetype(path: Path, size: int, fg: int, bg: int, byteorder: str) -> GlyphStrip:
+    from PIL import Image, ImageDraw, ImageFont
+
+    font = ImageFont.truetype(str(path), size)
+    ascent, descent = font.getmetrics()
+    height = ascent + descent
+    glyphs = {}
+    x = 0
+    for ch in CHARSET:
+        advance = max(1, int(round(font.getlength(ch))))
+        glyphs[ch] = (x, advance)
+        x += advance
+    width = x
+    mask = Image.new("L", (width, height), 0)
+    draw = ImageDraw.Draw(mask)
+    for ch, (gx, _) in glyphs.items():
+        draw.text((gx, 0), ch, fill=255, font=font)
+    img = Image.composite(
+        Image.new("RGB", (width, height), rgb565_to_rgb(fg)),
+        Image.new("RGB", (width, height), rgb565_to_rgb(bg)),
+        mask,
+    )
+    return GlyphStrip(height, glyphs, bytearray(image_to_rgb565(img, byteorder)), width)
+
+
+class GlyphAtlas:
+    """LRU cache of glyph strips plus the blitter that draws text from them."""
+
+    def __init__(self, byteorder: str = "big", max_strips: int = 16, max_bytes: int = 2 * 1024 * 1024):
+        self.byteorder = byteorder
+        self.max_strips = max_strips
+        self.max_bytes = max_bytes
+        self._strips: "OrderedDict[tuple, GlyphStrip]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._strips)
+
+    def strip(self, font: str, size: int, fg: Any, bg: Any) -> GlyphStrip:
+        key = (font, size, to_rgb565(fg), to_rgb565(bg))
+        s = self._strips.get(key)
+        if s is not None:
+            self.hits += 1
+            self._strips.move_to_end(key)
+            return s
+        self.misses += 1
+        path = None if font == BUILTIN else find_font(font)
+        if path is None:
+            s = _rasterize_builtin(size, key[2], key[3], self.byteorder)
+        else:
+            s = _rasterize_truetype(path, size, key[2], key[3], self.byteorder)
+        self._strips[key] = s
+        self._bytes += s.nbytes
+        self._evict()
+        return s
+
+    def _evict(self) -> None:
+        while len(self._strips) > 1 and (len(self._strips) > self.max_strips or self._bytes > self.max_bytes):
+            _, old = self._strips.popitem(last=False)
+            self._bytes -= old.nbytes
+
+    def clear(self) -> None:
+        self._strips.clear()
+        self._bytes = 0
+
+    def draw_text(self, dst: memoryview, dst_width: int, dst_height: int, x: int, y: int, text: str,
+                  strip: GlyphStrip) -> Tuple[int, int]:
+        """Blit `text` from `strip` into a row-major RGB565 buffer, clipped to its
+        bounds. Returns the (width, height) of the text cell."""
+        h = strip.height
+        r0 = max(0, -y)
+        r1 = min(h, dst_height - y)
+        dst_stride = dst_width * 2
+        src = strip._mv
+        src_stride = strip.stride
+        cx = x
+        for ch in text:
+            gx, gw = strip.glyph(ch)
+            c0 = max(0, -cx)
+            c1 = min(gw, dst_width - cx)
+            if c0 < c1 and r0 < r1:
+                n = (c1 - c0) * 2
+                s = r0 * src_stride + (gx + c0) * 2
+                d = (y + r0) * dst_stride + (cx + c0) * 2
+                for _ in range(r1 - r0):
+                    dst[d : d + n] = src[s : s + n]
+                    s += src_stride
+                    d += dst_stride
+            cx += gw
+            if cx >= dst_width:
+                break
+        return strip.measure(text)
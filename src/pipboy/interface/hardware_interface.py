@@ -1,22 +1,55 @@
 """HardwareInterface: wire display + input to AppManager for Pi hardware
 
 Provides a small loop runner and a run_once method for testability.
+
+`run()` renders only when a `RenderScheduler` says a frame is due: after input or an
+app invalidating itself, on the current app's `refresh_interval`, and continuously
+while it sets `animating` or the tab feedback pulse runs, capped at `max_fps`. Between
+those it sleeps.
+
+Each frame's phases are timed into `stats` (see `frame_stats`); SIGUSR1 prints them.
+App data updates (`SelfUpdatingApp.update`) run on a separate `UpdateScheduler`
+thread, never inside a frame.
 """
 from __future__ import annotations
 
 import time
 from typing import Any
 
+from .frame_stats import FrameStats
+from .render_scheduler import RenderScheduler
+from .update_scheduler import UpdateScheduler
+
 
 class HardwareInterface:
-    def __init__(self, display: Any, inputs: Any, app_manager: Any, tick: float = 0.5):
+    def __init__(self, display: Any, inputs: Any, app_manager: Any, tick: float | None = None, max_fps: float = 30.0):
+        """`tick`: longest sleep with nothing to do, as a safety net (None: until an event)."""
         self.display = display
         self.inputs = inputs
         self.app_manager = app_manager
         self.tick = tick
+        self.scheduler = RenderScheduler(max_fps=max_fps, idle_timeout=tick)
+        self.stats = FrameStats()
+        self.updates = UpdateScheduler(app_manager) if hasattr(app_manager, "apps") else None
+        self._shown: Any = None
         self._wired = False
+        # The last frame drew the selected tab in a pulse colour
+        self._pulsed = False
+        # Transfers are timed as they complete, which with an async flush is on the
+        # worker thread and not once per frame
+        if hasattr(display, "on_flush"):
+            display.on_flush = self._record_flush
+
+    def _record_flush(self, seconds: float, sent: int) -> None:
+        self.stats.record("flush", seconds)
+        self.stats.record("flush_bytes", sent)
 
     def initialize(self) -> None:
+        # Input and app state changes wake the render loop
+        try:
+            self.app_manager.on_invalidate = self.scheduler.invalidate
+        except Exception:
+            pass
         # initialize display
         try:
             self.display.initialize()
@@ -39,26 +72,102 @@ class HardwareInterface:
             pass
         self._wired = True
 
+    def handle_touch(self, x: int, y: int) -> None:
+        """Route a raw touch panel point: tabs select apps, the rest goes to the app."""
+        to_screen = getattr(self.display, "touch_to_screen", None)
+        if to_screen is not None:
+            x, y = to_screen(x, y)
+        idx = self.app_manager.tab_index_at(x, y) if hasattr(self.app_manager, "tab_index_at") else None
+        if idx is not None:
+            self.app_manager.select(idx)
+            return
+        self.app_manager.handle_input({"type": "touch", "x": x, "y": y})
+
     def run_once(self) -> None:
-        # Single tick: render and update
-        # clear display
+        # Single tick: render and update, timing each phase
+        stats = self.stats
+        t0 = time.perf_counter()
+        # Display changes requested from input callbacks (e.g. rotation) happen
+        # here, between frames, on the render thread
+        apply_pending = getattr(self.display, "apply_pending", None)
+        if apply_pending is not None:
+            try:
+                apply_pending()
+            except Exception as e:
+                stats.error("apply_pending", e)
+        # clear display, unless the app manager repaints only what changed
         try:
-            self.display.clear()
-        except Exception:
-            pass
+            retained = getattr(self.app_manager, "paints_incrementally", None)
+            if retained is None or not retained(self.display):
+                self.display.clear()
+        except Exception as e:
+            stats.error("clear", e)
+        t1 = time.perf_counter()
+        # Sampled before rendering: the pulse may end while this frame is drawn
+        # or flushed, and this frame still shows it
+        remaining = getattr(self.app_manager, "feedback_remaining", None)
+        self._pulsed = remaining is not None and remaining() > 0
         # Render current view into display via app_manager.render(ctx)
         try:
             self.app_manager.render(self.display)
-        except Exception:
-            pass
+        except Exception as e:
+            stats.error("render", e)
+        t2 = time.perf_counter()
         # Flush to device
         try:
             self.display.update()
-        except Exception:
-            pass
+        except Exception as e:
+            stats.error("update", e)
+        t3 = time.perf_counter()
+        stats.record("clear", t1 - t0)
+        stats.record("render", t2 - t1)
+        stats.record("update", t3 - t2)
+        stats.record("frame", t3 - t0)
+        app = getattr(self.app_manager, "last_app_render", None)
+        if app is not None:
+            stats.record(f"app:{app[0]}", app[1])
+        stats.frames += 1
+
+    def _schedule_next(self) -> None:
+        sched = self.scheduler
+        interval = getattr(self.app_manager, "refresh_interval", None)
+        sched.set_timer("app", interval() if callable(interval) else None)
+        if self._pulsed:
+            # The selected tab pulses until the feedback ends (only its label is
+            # repainted); the first frame drawn after restores the tab colour
+            sched.invalidate()
+        current = getattr(self.app_manager, "current", None)
+        if getattr(current, "animating", False):
+            # Next frame as soon as the frame-rate cap allows
+            sched.invalidate()
+        if self.updates is not None and current is not self._shown:
+            # A newly shown app gets fresh data without waiting out its interval
+            self._shown = current
+            self.updates.wake()
+        if getattr(self.display, "damage", None):
+            # The flush was dropped (async transfer still busy); retry next frame
+            sched.invalidate()
+
+    def stop(self) -> None:
+        """Make `run()` return after the current frame."""
+        self.scheduler.stop()
 
     def run(self) -> None:
         self.initialize()
-        while True:
-            self.run_once()
-            time.sleep(self.tick)
+        self.stats.install_signal_handler()
+        if self.updates is not None:
+            self.updates.start()
+        try:
+            while self.scheduler.wait():
+                self.run_once()
+                self._schedule_next()
+        finally:
+            if self.updates is not None:
+                self.updates.stop()
+            # Let the display finish an in-flight transfer and release the bus
+            close = getattr(self.display, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
@@ -1,6 +1,8 @@
 """
 Pi5 hardware profile: pin mappings and config loader.
-Reads from config.yaml in repo root (if present) for overrides.
+Reads from config.yaml in repo root (if present) for overrides, then from
+hardware.tuned.yaml next to it, where measured settings (SPI tuning) are saved so
+the hand-written config is never rewritten.
 """
 from __future__ import annotations
 
@@ -15,6 +17,10 @@ DEFAULTS = {
     'i2c_bus': 1,
     'spi_bus': 0,
     'spi_device': 0,
+    # Written to hardware.tuned.yaml by `python -m pipboy.driver.spi_tuning`
+    # (0 chunk size: kernel bufsiz)
+    'spi_speed_hz': 10_000_000,
+    'spi_chunk_size': 0,
     'uart_port': '/dev/serial0',
     'uart_baud': 9600,
     'buttons': {'up': 5, 'down': 6, 'select': 13, 'back': 19},
@@ -23,6 +29,10 @@ DEFAULTS = {
 }
 
 
+# Measured settings, loaded on top of config.yaml's 'hardware' section
+TUNED_NAME = 'hardware.tuned.yaml'
+
+
 @dataclass
 class HardwareProfile:
     i2c_bus: int
@@ -33,6 +43,22 @@ class HardwareProfile:
     buttons: dict
     rotary: dict
     pwm: dict
+    spi_speed_hz: int = DEFAULTS['spi_speed_hz']
+    spi_chunk_size: int = DEFAULTS['spi_chunk_size']
+
+
+def tuned_path(config_path: str = None) -> str:
+    if config_path is None:
+        config_path = os.path.join(os.getcwd(), 'config.yaml')
+    return os.path.join(os.path.dirname(os.path.abspath(config_path)), TUNED_NAME)
+
+
+def _read_yaml(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as fh:
+        data = yaml.safe_load(fh)
+    return data if isinstance(data, dict) else {}
 
 
 def load_profile(config_path: str = None) -> HardwareProfile:
@@ -40,12 +66,13 @@ def load_profile(config_path: str = None) -> HardwareProfile:
         config_path = os.path.join(os.getcwd(), 'config.yaml')
     cfg = DEFAULTS.copy()
     try:
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as fh:
-                data = yaml.safe_load(fh) or {}
-            cfg.update(data.get('hardware', {}))
+        cfg.update(_read_yaml(config_path).get('hardware', {}))
     except Exception as e:
         logger.debug('Failed reading config.yaml: %s', e)
+    try:
+        cfg.update(_read_yaml(tuned_path(config_path)))
+    except Exception as e:
+        logger.debug('Failed reading %s: %s', TUNED_NAME, e)
     return HardwareProfile(
         i2c_bus=cfg['i2c_bus'],
         spi_bus=cfg['spi_bus'],
@@ -55,4 +82,20 @@ def load_profile(config_path: str = None) -> HardwareProfile:
         buttons=cfg['buttons'],
         rotary=cfg['rotary'],
         pwm=cfg['pwm'],
+        spi_speed_hz=int(cfg['spi_speed_hz']),
+        spi_chunk_size=int(cfg['spi_chunk_size']),
     )
+
+
+def update_profile(values: dict, config_path: str = None) -> None:
+    """Save `values` to hardware.tuned.yaml next to config.yaml.
+
+    Earlier tuned values are kept unless overwritten; config.yaml itself is not
+    touched, so its comments and layout survive.
+    """
+    path = tuned_path(config_path)
+    data = _read_yaml(path)
+    data.update(values)
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write('# Written by pipboy.driver.spi_tuning; overrides the hardware section of config.yaml\n')
+        yaml.safe_dump(data, fh, sort_keys=False)
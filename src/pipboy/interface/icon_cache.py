@@ -0,0 +1,165 @@
+"""Pre-resized icon cache
+
+Icons are drawn at a handful of fixed sizes (`ICON_SIZES`). Each source PNG is
+resized to those once, with PIL, into `<cache_dir>/<size>/`; the file name carries a
+hash of the source path and its mtime, so editing an icon rebuilds it and stale
+copies are removed. Hand-made sizes in `resources/icons/<size>/<name>.png` take
+precedence over generated ones.
+
+At runtime `IconCache.photo()` only loads files: a requested size is snapped to the
+nearest cached size (`snap_size`), and each (icon, size) is read into a Tk image
+once. Layout changes therefore never resample. Without PIL the original image is
+loaded and integer-subsampled instead, also once per size.
+
+Build everything ahead of time (e.g. at install) with
+    python scripts/build_icon_cache.py
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ICON_SIZES = (12, 18, 24, 32, 48)
+
+
+def default_cache_dir() -> Path:
+    env = os.environ.get("PIPBOY_ICON_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "pipboy" / "icons"
+
+
+def snap_size(size: int, sizes: Iterable[int] = ICON_SIZES) -> int:
+    """The largest of `sizes` not above `size` (the smallest if all are)."""
+    sizes = sorted(sizes)
+    fitting = [s for s in sizes if s <= size]
+    return fitting[-1] if fitting else sizes[0]
+
+
+class IconCache:
+    def __init__(self, cache_dir: Optional[Path] = None, sizes: Iterable[int] = ICON_SIZES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.sizes = tuple(sorted(sizes))
+        # (source path, size) -> Tk image
+        self._photos: Dict[Tuple[str, int], Any] = {}
+        # Resizes done by this instance, for tests and diagnostics
+        self.resized = 0
+
+    def _stem(self, src: Path) -> str:
+        digest = hashlib.sha1(str(src.resolve()).encode()).hexdigest()[:8]
+        return f"{src.stem.lower()}-{digest}"
+
+    def path_for(self, src: Path, size: int) -> Path:
+        """Where the `size` px copy of `src` lives for its current mtime."""
+        src = Path(src)
+        return self.cache_dir / str(size) / f"{self._stem(src)}-{src.stat().st_mtime_ns:x}.png"
+
+    def build(self, src: Path, sizes: Optional[Iterable[int]] = None) -> Dict[int, Path]:
+        """Resize `src` to every missing size; returns size -> cached path."""
+        try:
+            from PIL import Image
+        except Exception:
+            return {}
+        src = Path(src)
+        built: Dict[int, Path] = {}
+        img = None
+        for size in sizes or self.sizes:
+            try:
+                dest = self.path_for(src, size)
+                if not dest.exists():
+                    if img is None:
+                        img = Image.open(src).convert("RGBA")
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    # Write aside and rename so a concurrent reader never sees half a file
+                    tmp = dest.with_suffix(".tmp")
+                    img.resize((size, size), Image.LANCZOS).save(tmp, "PNG")
+                    os.replace(tmp, dest)
+                    self.resized += 1
+                    self._drop_stale(src, dest)
+                built[size] = dest
+            except Exception as e:
+                logger.debug("Could not cache %s at %spx: %s", src, size, e)
+        return built
+
+    def build_all(self, icon_dir: Path) -> int:
+        """Build every PNG directly in `icon_dir`; returns the number of resizes."""
+        before = self.resized
+        for src in sorted(Path(icon_dir).glob("*.png")):
+            self.build(src)
+        return self.resized - before
+
+    def _drop_stale(self, src: Path, keep: Path) -> None:
+        prefix = self._stem(src) + "-"
+        for old in keep.parent.glob(prefix + "*.png"):
+            if old != keep:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+    def resolve(self, src: Path, size: int) -> Optional[Path]:
+        """A file holding `src` at `size` px: hand-made, cached, or built now."""
+        src = Path(src)
+        pre = src.parent / str(size) / src.name
+        if pre.exists():
+            return pre
+        try:
+            dest = self.path_for(src, size)
+        except OSError:
+            return None
+        if dest.exists():
+            return dest
+        return self.build(src, (size,)).get(size)
+
+    def photo(self, src: Path, size: int) -> Any:
+        """Tk image of `src` at the cached size nearest `size` (None if unloadable)."""
+        size = snap_size(size, self.sizes)
+        key = (str(src), size)
+        if key in self._photos:
+            return self._photos[key]
+        img = None
+        try:
+            import tkinter as tk
+
+            path = self.resolve(Path(src), size)
+            if path is not None:
+                img = tk.PhotoImage(file=str(path))
+            else:
+                # No PIL: approximate with an integer subsample of the original
+                img = tk.PhotoImage(file=str(src))
+                w = img.width()
+                if w > size:
+                    step = max(1, int(round(w / size)))
+                    img = img.subsample(step, step)
+        except Exception as e:
+            logger.debug("Could not load icon %s: %s", src, e)
+            img = None
+        self._photos[key] = img
+        return img
+
+
+class IconSet:
+    """Name -> Tk image mapping that loads each icon from the cache on first use."""
+
+    def __init__(self, paths: Dict[str, Path], size: int, cache: Optional[IconCache] = None):
+        self.paths = dict(paths)
+        self.size = size
+        self.cache = cache or IconCache()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.paths
+
+    def __getitem__(self, name: str) -> Any:
+        return self.cache.photo(self.paths[name], self.size)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
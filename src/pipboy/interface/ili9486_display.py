@@ -1,70 +1,369 @@
-"""Scaffold driver for ILI9486-like SPI displays
+"""Framebuffer display for ILI9486-like SPI panels
 
-This is a lightweight scaffold with clear hooks for SPI initialization and rendering.
+Apps draw into a single preallocated 480x320 RGB565 framebuffer (see `Framebuffer`);
+`update()` coalesces the damaged regions and streams each one to the panel through
+`ILI9486.set_window` / `CMD_RAMWR`, so a small change costs a small transfer.
+
+With `async_flush` enabled the transfer runs on a `FlushWorker` thread: `update()`
+copies the damaged regions of the back buffer (the one apps draw into) into a front
+buffer owned by the worker and returns immediately. If the previous transfer is still
+running the frame is dropped and its damage carried into the next one.
+
+Before flushing, a `TileDiffer` compares the damaged tiles against the last frame sent
+and drops the ones that came out identical, so apps that redraw everything each tick
+still only send what changed.
+
+Rotation (0/90/180/270 clockwise, plus mirroring) is applied by the controller through
+MADCTL, so a rotated frame costs no CPU: the framebuffer simply takes the rotated
+geometry. `touch_to_screen()` maps touch panel points, which stay in the rotation-0
+frame, into it.
+
+`scroll_region()` uses the controller's vertical scrolling (VSCRDEF/VSCRSADD) when
+the panel orientation allows it: the band is rotated in GRAM instead of being resent,
+so only the newly exposed rows are transferred. Flushes map framebuffer rows to the
+rotated GRAM rows, and the scroll state travels with each frame to the flush worker.
 """
 # Credit: portions derived from SirLefti/piboy (MIT) — https://github.com/SirLefti/piboy
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
+from typing import Callable
+
+from .damage import coalesce
+from .flush_worker import FlushWorker
+from .frame_diff import TileDiffer
+from .framebuffer import Framebuffer, copy_rect, pack_rect
+from .ili9486_driver import ILI9486, ILIConfig, madctl_for
+
+# (y0, y1, offset): band [y0, y1) rotated by offset rows in panel memory
+Scroll = tuple[int, int, int]
+
+
+def _panel_rows(y: int, h: int, scroll: Scroll | None) -> list[tuple[int, int, int]]:
+    """Split framebuffer rows [y, y + h) into (source row, panel row, count) runs."""
+    if scroll is None or not scroll[2]:
+        return [(y, y, h)]
+    b0, b1, off = scroll
+    vsa = b1 - b0
+    runs = []
+    end = y + h
+    while y < end:
+        if y < b0:
+            n = min(end, b0) - y
+            runs.append((y, y, n))
+        elif y >= b1:
+            n = end - y
+            runs.append((y, y, n))
+        else:
+            g = b0 + (y - b0 + off) % vsa
+            n = min(end, b1) - y
+            n = min(n, b1 - g)
+            runs.append((y, g, n))
+        y += n
+    return runs
 
 
 @dataclass
 class ILI9486Config:
     spi_bus: int = 0
     spi_device: int = 0
+    # From the hardware profile; see driver.spi_tuning
+    spi_speed_hz: int = 10_000_000
+    spi_chunk_size: int = 0
     dc_pin: int = 24
     reset_pin: int = 25
+    # Geometry at rotation 0; width and height swap for 90 and 270
     width: int = 480
     height: int = 320
+    rotation: int = 0
+    mirror_x: bool = False
+    mirror_y: bool = False
+    # Shown until AppManager paints the theme background (Palette.bg565)
+    background: str = "#001100"
+    text_scale: int = 1
+    # "builtin" (5x7 bitmap) or a TrueType name/path resolved by glyph_atlas.find_font
+    font: str = "builtin"
+    # Line height in pixels for TrueType fonts; 0 derives it from text_scale
+    font_size: int = 0
+    # Push frames from a background thread while the next one renders
+    async_flush: bool = False
+    # Longest update() waits for a busy flush worker before dropping the frame
+    flush_wait: float = 0.0
+    # Tile size for diffing frames against the last one sent; 0 sends all damage
+    diff_tile: int = 16
 
 
-class ILI9486Display:
+class ILI9486Display(Framebuffer):
     def __init__(self, config: ILI9486Config | None = None, spi=None):
         self.config = config or ILI9486Config()
+        self.config.rotation %= 360
+        # Validates the rotation up front
+        madctl_for(self.config.rotation)
+        super().__init__(*self._rotated_size(), background=self.config.background)
+        self.text_scale = self.config.text_scale
+        self.font = self.config.font
+        self.font_size = self.config.font_size or None
         # Optionally accept an SPI wrapper object
         self.spi = spi
+        self.panel: ILI9486 | None = None
         self.initialized = False
+        # Bytes and rectangles pushed by the most recent update() (0 and [] when
+        # nothing was sent)
+        self.last_flush_bytes = 0
+        # Time spent in the last transfer (on the worker thread when async)
+        self.last_flush_seconds = 0.0
+        # Called with (seconds, bytes) once per completed transfer, from whichever
+        # thread flushes
+        self.on_flush: Callable[[float, int], None] | None = None
+        self.last_flush_rects: list[tuple[int, int, int, int]] = []
+        self.frames_dropped = 0
+        self._worker: FlushWorker | None = None
+        # (rotation, mirror_x, mirror_y) asked for from another thread, see request_rotation
+        self._pending_rotation: tuple[int, bool | None, bool | None] | None = None
+        self._front: memoryview | None = None
+        self._front_scratch: memoryview | None = None
+        # Scroll band as drawn by the app, and as last programmed into the panel
+        # (the latter only touched by whichever thread flushes)
+        self._scroll: Scroll | None = None
+        self._panel_scroll: Scroll | None = None
+        self.differ = TileDiffer(self.width, self.height, self.config.diff_tile) if self.config.diff_tile else None
 
     def initialize(self) -> None:
-        # Set up SPI, reset pins, etc.
+        # Set up SPI (unless injected) and the panel controller
+        if self.spi is None:
+            try:
+                from ..driver.spi import SPI, SPIConfig
+
+                self.spi = SPI(
+                    SPIConfig(
+                        bus=self.config.spi_bus,
+                        device=self.config.spi_device,
+                        max_speed_hz=self.config.spi_speed_hz,
+                        chunk_size=self.config.spi_chunk_size,
+                    )
+                )
+            except Exception:
+                self.spi = None
+        if self.spi is not None and getattr(self.spi, "available", False):
+            panel = ILI9486(
+                self.spi,
+                dc_pin=self.config.dc_pin,
+                reset_pin=self.config.reset_pin,
+                config=ILIConfig(
+                    width=self.config.width,
+                    height=self.config.height,
+                    rotation=self.config.rotation,
+                    mirror_x=self.config.mirror_x,
+                    mirror_y=self.config.mirror_y,
+                ),
+            )
+            try:
+                panel.initialize()
+                self.panel = panel
+            except Exception:
+                # Don't crash on SPI errors — degrade gracefully
+                self.panel = None
+        if self.config.async_flush and self.panel is not None and self._worker is None:
+            self._front = memoryview(bytearray(len(self.buffer)))
+            self._front_scratch = memoryview(bytearray(len(self.buffer)))
+            self._worker = FlushWorker(self._flush_front)
+            self._worker.start()
+        self.clear()
         self.initialized = True
-        # Framebuffer for testable rendering
-        self._framebuffer = []
-
-    def clear(self) -> None:
-        # Clear buffer / screen
-        self._framebuffer = []
-
-    def draw_text(self, x: int, y: int, text: str, color: str = "#99ff66") -> None:
-        # Convert text to framebuffer operations
-        # For testability, we append text ops to an internal framebuffer list
-        if not hasattr(self, "_framebuffer"):
-            self._framebuffer = []
-        self._framebuffer.append({"type": "text", "x": x, "y": y, "text": text, "color": color})
-
-    def _flush_to_spi(self):
-        # Simple placeholder flush: convert text ops to bytes and send via SPI.xfer2
-        if not self.spi or not getattr(self.spi, "available", False):
+
+    def _rotated_size(self) -> tuple[int, int]:
+        if self.config.rotation in (90, 270):
+            return self.config.height, self.config.width
+        return self.config.width, self.config.height
+
+    def set_rotation(self, rotation: int, mirror_x: bool | None = None, mirror_y: bool | None = None) -> None:
+        """Rotate the output clockwise in the panel controller.
+
+        The framebuffer takes the rotated geometry (reallocated if width and height
+        swap) and the next update() resends the whole frame.
+        """
+        rotation %= 360
+        mirror_x = self.config.mirror_x if mirror_x is None else mirror_x
+        mirror_y = self.config.mirror_y if mirror_y is None else mirror_y
+        madctl_for(rotation, mirror_x, mirror_y)
+        if self._worker is not None:
+            # Don't swap buffers under an in-flight transfer
+            self._worker.wait_idle(1.0)
+        self.config.rotation = rotation
+        self.config.mirror_x = mirror_x
+        self.config.mirror_y = mirror_y
+        size = self._rotated_size()
+        if size != (self.width, self.height):
+            self.resize(*size)
+            if self._front is not None:
+                self._front = memoryview(bytearray(len(self.buffer)))
+                self._front_scratch = memoryview(bytearray(len(self.buffer)))
+        else:
+            self.damage.add_full()
+        self._scroll = None
+        self._panel_scroll = None
+        if self.config.diff_tile:
+            self.differ = TileDiffer(self.width, self.height, self.config.diff_tile)
+        if self.panel is not None:
+            try:
+                self.panel.set_rotation(rotation, mirror_x, mirror_y)
+            except Exception:
+                pass
+
+    def request_rotation(self, rotation: int, mirror_x: bool | None = None, mirror_y: bool | None = None) -> None:
+        """Ask for `set_rotation` on the render thread; safe to call from input callbacks.
+
+        set_rotation reallocates the buffer and damage tracker, so it must not run
+        while a frame is being drawn or flushed. The render loop applies the latest
+        request with `apply_pending()` before its next frame.
+        """
+        madctl_for(rotation % 360)
+        self._pending_rotation = (rotation, mirror_x, mirror_y)
+
+    def apply_pending(self) -> bool:
+        """Apply a rotation from `request_rotation`; returns whether there was one."""
+        pending, self._pending_rotation = self._pending_rotation, None
+        if pending is None:
+            return False
+        self.set_rotation(*pending)
+        return True
+
+    def touch_to_screen(self, x: int, y: int) -> tuple[int, int]:
+        """Map a touch point from the rotation-0 frame to current screen coordinates."""
+        w0, h0 = self.config.width, self.config.height
+        r = self.config.rotation
+        if r == 90:
+            x, y = h0 - 1 - y, x
+        elif r == 180:
+            x, y = w0 - 1 - x, h0 - 1 - y
+        elif r == 270:
+            x, y = y, w0 - 1 - x
+        if self.config.mirror_x:
+            x = self.width - 1 - x
+        if self.config.mirror_y:
+            y = self.height - 1 - y
+        return x, y
+
+    def _scroll_damage(self, y0: int, y1: int, dy: int, exposed: tuple[int, int]) -> None:
+        if self.panel is None or not self.panel.can_scroll:
+            super()._scroll_damage(y0, y1, dy, exposed)
+            return
+        n = y1 - y0
+        if self._scroll is None or self._scroll[:2] != (y0, y1):
+            if self._scroll is not None and self._scroll[2]:
+                # The old band is rotated in GRAM; resend it unrotated
+                b0, b1, _ = self._scroll
+                self.damage.add(0, b0, self.width, b1 - b0)
+                if self.differ is not None:
+                    self.differ.invalidate(0, b0, self.width, b1 - b0)
+            self._scroll = (y0, y1, 0)
+        if abs(dy) >= n:
+            self.damage.add(0, y0, self.width, n)
             return
+        # The panel moves the band itself: pending damage moves with it and only the
+        # exposed rows are new
+        self.damage.scroll(y0, y1, dy)
+        self.damage.add(0, exposed[0], self.width, exposed[1] - exposed[0])
+        if self.differ is not None:
+            self.differ.scroll(y0, y1, dy)
+        self._scroll = (y0, y1, (self._scroll[2] + dy) % n)
+
+    def _send_rects(
+        self,
+        src: memoryview,
+        rects: list[tuple[int, int, int, int]],
+        scratch: memoryview | None,
+        scroll: Scroll | None = None,
+    ) -> int:
+        if self.panel is None:
+            return 0
+        sent = 0
+        t0 = time.perf_counter()
         try:
-            for op in getattr(self, "_framebuffer", []):
-                if op.get("type") == "text":
-                    payload = op.get("text", "").encode("utf-8", errors="replace")
-                    # send in chunks to SPI
-                    for i in range(0, len(payload), 64):
-                        chunk = payload[i : i + 64]
-                        # In a real driver we'd send commands/data; use xfer2 for bulk bytes
-                        self.spi.xfer2(bytes(chunk))
+            if scroll != self._panel_scroll:
+                self._panel_scroll = None
+                if scroll is not None:
+                    self.panel.set_scroll(*scroll)
+                self._panel_scroll = scroll
+            for x, y, w, h in rects:
+                for sy, py, n in _panel_rows(y, h, scroll):
+                    self.panel.draw_rgb565_buffer(x, py, w, n, pack_rect(src, self.stride, x, sy, w, n, scratch))
+                    sent += w * n * 2
         except Exception:
             # Don't crash on SPI errors — degrade gracefully
             pass
+        self.last_flush_seconds = time.perf_counter() - t0
+        if self.on_flush is not None:
+            self.on_flush(self.last_flush_seconds, sent)
+        return sent
+
+    def _flush_to_spi(self, rects: list[tuple[int, int, int, int]]) -> int:
+        if self._scratch is None:
+            self._scratch = memoryview(bytearray(len(self.buffer)))
+        return self._send_rects(self._mv, rects, self._scratch, self._scroll)
+
+    def _flush_front(self, frame: tuple[list[tuple[int, int, int, int]], Scroll | None]) -> int:
+        # Runs on the worker thread; only touches the front buffer
+        rects, scroll = frame
+        sent = self._send_rects(self._front, rects, self._front_scratch, scroll)
+        self.last_flush_bytes = sent
+        return sent
+
+    def _no_flush(self) -> None:
+        self.last_flush_rects = []
+        self.last_flush_bytes = 0
+        self.last_flush_seconds = 0.0
 
     def update(self) -> None:
-        # Flush framebuffer to display - in real driver this would write to SPI
-        # For testing, we just keep last_frame and optionally flush to SPI
-        self.last_frame = list(getattr(self, "_framebuffer", []))
-        self._flush_to_spi()
+        # Flush only the damaged regions to the panel
+        if not self.damage:
+            self._no_flush()
+            return
+        if self.differ is not None:
+            changed = self.differ.diff(self.buffer, self.damage.rects())
+            rects = [(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in coalesce(changed, self.damage.max_rects, self.damage.slack)]
+        else:
+            rects = self.damage.coalesce()
+        if not rects:
+            # Everything redrawn came out identical
+            self.damage.clear()
+            self._no_flush()
+            return
+        if self._worker is None:
+            self.damage.clear()
+            self.last_flush_rects = rects
+            self.last_flush_bytes = self._flush_to_spi(rects)
+            if self.differ is not None:
+                self.differ.commit(self.buffer, rects)
+            return
+        # Present to the worker; a busy worker means this frame is stale before it
+        # is sent, so keep the damage and let the next frame carry it
+        if self._worker.busy and not self._worker.wait_idle(self.config.flush_wait):
+            self.frames_dropped += 1
+            return
+        for x, y, w, h in rects:
+            copy_rect(self._front, self._mv, self.stride, x, y, w, h)
+        self.damage.clear()
+        self.last_flush_rects = rects
+        self._worker.submit((rects, self._scroll))
+        if self.differ is not None:
+            self.differ.commit(self.buffer, rects)
+
+    def close(self) -> None:
+        """Stop the flush worker (after its current transfer) and release SPI."""
+        if self._worker is not None:
+            self._worker.wait_idle(1.0)
+            self._worker.stop()
+            self._worker = None
+        close = getattr(self.spi, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
 
-    def get_last_frame(self):
-        return getattr(self, "last_frame", [])
+    def get_last_frame(self) -> memoryview:
+        """Read-only view of the framebuffer (big-endian RGB565, row-major)."""
+        return self._mv.toreadonly()
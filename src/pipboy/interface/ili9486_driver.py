@@ -2,22 +2,49 @@
 
 This driver implements minimal ILI9486 commands to initialize the display and write pixel data
 in RGB565 format via SPI. It is intentionally small and testable — SPI operations are performed
-through an injected `spi` object exposing `xfer2(bytes)`.
+through an injected `spi` object exposing `xfer2(bytes)`; when it also provides a write-only
+`writebytes2(buffer)` (see `driver.spi.SPI`), pixel data is streamed as memoryview slices
+without copies.
 
 References: ILI9486 datasheet (command set). This is not an exhaustive implementation; it provides
-basic init, set window, fill rectangle, and draw_rgb565_buffer operations useful for our UI.
+basic init, set window, fill rectangle, draw_rgb565_buffer and vertical scrolling operations
+useful for our UI.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from typing import Any, Optional
+
+from .rgb565 import rgb565_to_be_bytes, rgb_to_rgb565
+
+
+# MADCTL for each clockwise rotation (same sequence as fbtft's rotate=), relative to the
+# orientation the panel is wired for at rotation 0: MY=0x80, MX=0x40, MV=0x20, BGR=0x08
+ROTATION_MADCTL = {0: 0x48, 90: 0x28, 180: 0x88, 270: 0xE8}
+
+
+def madctl_for(rotation: int, mirror_x: bool = False, mirror_y: bool = False) -> int:
+    """MADCTL value for a rotation plus optional on-screen mirroring."""
+    if rotation not in ROTATION_MADCTL:
+        raise ValueError(f"Unsupported rotation {rotation}; use 0, 90, 180 or 270")
+    madctl = ROTATION_MADCTL[rotation]
+    # With MV set the address axes are exchanged, so screen x is the row order
+    swapped = bool(madctl & ILI9486.MADCTL_MV)
+    if mirror_x:
+        madctl ^= ILI9486.MADCTL_MY if swapped else ILI9486.MADCTL_MX
+    if mirror_y:
+        madctl ^= ILI9486.MADCTL_MX if swapped else ILI9486.MADCTL_MY
+    return madctl
 
 
 @dataclass
 class ILIConfig:
+    # Geometry at rotation 0; width and height swap for 90 and 270
     width: int = 480
     height: int = 320
     rotation: int = 0
+    mirror_x: bool = False
+    mirror_y: bool = False
 
 
 class ILI9486:
@@ -28,39 +55,73 @@ class ILI9486:
     CMD_CASET = 0x2A
     CMD_RASET = 0x2B
     CMD_RAMWR = 0x2C
+    CMD_RAMRD = 0x2E
     CMD_DISPON = 0x29
+    CMD_VSCRDEF = 0x33
+    CMD_VSCRSADD = 0x37
+
+    # MADCTL bits
+    MADCTL_MY = 0x80
+    MADCTL_MX = 0x40
+    MADCTL_MV = 0x20
+    MADCTL_BGR = 0x08
 
     def __init__(self, spi, dc_pin=None, reset_pin=None, config: Optional[ILIConfig] = None):
-        """spi: object with xfer2(bytes) -> bytes and attribute `available`"""
+        """spi: object with xfer2(bytes) -> bytes and attribute `available`; an optional
+        writebytes2(buffer) is preferred for bulk writes"""
         self.spi = spi
         self.dc = dc_pin
         self.reset = reset_pin
         self.config = config or ILIConfig()
+        self.madctl = madctl_for(self.config.rotation, self.config.mirror_x, self.config.mirror_y)
         self.initialized = False
 
+    @property
+    def width(self) -> int:
+        return self.config.height if self.config.rotation in (90, 270) else self.config.width
+
+    @property
+    def height(self) -> int:
+        return self.config.width if self.config.rotation in (90, 270) else self.config.height
+
     # Low-level helpers
     def _write_cmd(self, cmd: int) -> None:
         # DC low
         self._set_dc(False)
         self._spi_xfer(bytes([cmd]))
 
-    def _write_data(self, data: bytes) -> None:
+    def _write_data(self, data: Any) -> None:
         # DC high
         self._set_dc(True)
-        # Chunk data into reasonable sizes
-        for i in range(0, len(data), 4096):
-            chunk = data[i : i + 4096]
-            self._spi_xfer(bytes(chunk))
+        if not getattr(self.spi, "available", False):
+            raise RuntimeError("SPI not available")
+        write = getattr(self.spi, "writebytes2", None)
+        if write is not None:
+            # Write-only bulk path; the SPI wrapper chunks to the kernel bufsiz
+            write(data)
+            return
+        # xfer2-only SPI objects: chunk with zero-copy slices
+        mv = memoryview(data).cast("B")
+        step = getattr(self.spi, "bufsiz", 4096)
+        for i in range(0, len(mv), step):
+            self.spi.xfer2(mv[i : i + step])
 
     def _spi_xfer(self, b: bytes) -> None:
         if not getattr(self.spi, "available", False):
             raise RuntimeError("SPI not available")
+        write = getattr(self.spi, "writebytes2", None)
+        if write is not None:
+            write(b)
+            return
         # xfer2 returns bytes; we ignore return value
         self.spi.xfer2(b)
 
     def _set_dc(self, high: bool) -> None:
-        # If a real GPIO pin is provided, we'd toggle it; in tests we ignore it
-        pass
+        # If a real GPIO pin is provided, we'd toggle it; in tests we ignore it.
+        # Buses that model the D/C line (latency_harness.PhotonSPI) are told its level.
+        set_dc = getattr(self.spi, "set_dc", None)
+        if set_dc is not None:
+            set_dc(high)
 
     def reset_display(self) -> None:
         # Toggle reset pin if provided
@@ -77,7 +138,7 @@ class ILI9486:
         self._write_data(bytes([0x55]))  # 16-bit
         # Memory access control (orientation)
         self._write_cmd(self.CMD_MADCTL)
-        self._write_data(bytes([0x48]))
+        self._write_data(bytes([self.madctl]))
         self._write_cmd(self.CMD_DISPON)
         self.initialized = True
 
@@ -91,16 +152,95 @@ class ILI9486:
         data = y0.to_bytes(2, "big") + y1.to_bytes(2, "big")
         self._write_data(data)
 
-    def write_pixels_rgb565(self, pixels: Sequence[int], width: int, height: int) -> None:
+    def set_rotation(self, rotation: int, mirror_x: bool = False, mirror_y: bool = False) -> None:
+        """Rotate (clockwise) and mirror in the controller; window coordinates follow
+        `width` x `height` afterwards. Any hardware scroll is reset."""
+        madctl = madctl_for(rotation, mirror_x, mirror_y)
+        self.config.rotation = rotation
+        self.config.mirror_x = mirror_x
+        self.config.mirror_y = mirror_y
+        self.madctl = madctl
+        if self.initialized:
+            self._write_cmd(self.CMD_MADCTL)
+            self._write_data(bytes([madctl]))
+            self.reset_scroll()
+
+    @property
+    def can_scroll(self) -> bool:
+        """Vertical scrolling moves GRAM rows, which are display rows only without MV."""
+        return not self.madctl & self.MADCTL_MV
+
+    def define_scroll_area(self, top_fixed: int, scroll_height: int, bottom_fixed: int) -> None:
+        # VSCRDEF: top fixed, scrolling and bottom fixed line counts (must sum to the GRAM height)
+        self._write_cmd(self.CMD_VSCRDEF)
+        self._write_data(
+            top_fixed.to_bytes(2, "big") + scroll_height.to_bytes(2, "big") + bottom_fixed.to_bytes(2, "big")
+        )
+
+    def set_scroll_start(self, line: int) -> None:
+        # VSCRSADD: GRAM line shown at the top of the scrolling area
+        self._write_cmd(self.CMD_VSCRSADD)
+        self._write_data(line.to_bytes(2, "big"))
+
+    def reset_scroll(self) -> None:
+        # The whole GRAM height scrolls, unshifted (the power-on state)
+        rows = self.config.height
+        self.define_scroll_area(0, rows, 0)
+        self.set_scroll_start(0)
+
+    def set_scroll(self, y0: int, y1: int, offset: int) -> None:
+        """Scroll band [y0, y1) so display row y0 + r shows memory row y0 + (r + offset) % (y1 - y0).
+
+        Rows are in window (set_window) coordinates; with MY set the band and the
+        direction are mirrored into GRAM order.
+        """
+        vsa = y1 - y0
+        if self.madctl & self.MADCTL_MY:
+            top, bottom = self.config.height - y1, y0
+            start = top + (-offset) % vsa
+        else:
+            top, bottom = y0, self.config.height - y1
+            start = top + offset % vsa
+        self.define_scroll_area(top, vsa, bottom)
+        self.set_scroll_start(start)
+
+    def write_pixels_rgb565(self, pixels: Any, width: int, height: int) -> None:
         """Write a buffer of RGB565 pixel values to the current window.
-        pixels: iterable of 16-bit integers in 0xRRGG format (RGB565)
+        pixels: 16-bit RGB565 values — a NumPy uint16 array, array('H'), any buffer of
+        native-endian 16-bit words, or a sequence of ints
         """
-        # Convert to bytes big-endian
-        b = bytearray()
-        for p in pixels:
-            b += p.to_bytes(2, "big")
+        # Convert to big-endian wire bytes in one vectorized pass
+        data = rgb565_to_be_bytes(pixels)
         self._write_cmd(self.CMD_RAMWR)
-        self._write_data(bytes(b))
+        self._write_data(data)
+
+    def draw_rgb565_buffer(self, x: int, y: int, w: int, h: int, data) -> None:
+        """Stream a w*h block of big-endian RGB565 bytes to the panel at (x, y).
+
+        `data` may be any bytes-like object; it is sent as-is without conversion.
+        """
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self._write_cmd(self.CMD_RAMWR)
+        self._write_data(data)
+
+    def read_rgb565(self, x: int, y: int, w: int, h: int) -> bytes:
+        """Read a window back from GRAM (RAMRD) as big-endian RGB565 bytes.
+
+        Only meaningful on boards with MISO wired to the controller; keep the window
+        small enough for one transfer. The controller answers with a dummy byte and
+        then 18-bit pixels, one byte per channel.
+        """
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self._write_cmd(self.CMD_RAMRD)
+        self._set_dc(True)
+        n = w * h
+        raw = bytes(self.spi.xfer2(bytes(1 + 3 * n)))[1:]
+        out = bytearray(2 * n)
+        for i in range(n):
+            word = rgb_to_rgb565(raw[3 * i], raw[3 * i + 1], raw[3 * i + 2])
+            out[2 * i] = word >> 8
+            out[2 * i + 1] = word & 0xFF
+        return bytes(out)
 
     def fill_rect(self, x: int, y: int, w: int, h: int, color_rgb565: int) -> None:
         x0, y0, x1, y1 = x, y, x + w - 1, y + h - 1
@@ -0,0 +1,241 @@
+"""Input-to-photon latency measurement
+
+Measures how long an input takes to reach the panel: from the moment a synthetic input
+is injected (through `KeyboardInput.simulate` or `GPIOInput._invoke`, exactly where
+real button callbacks enter) via `AppManager.handle_input`, the next render and the
+display flush, to the completion of the RAMWR transfer carrying the new pixels.
+
+Frames are tagged in the pixels themselves. A `ProbeApp` counts the inputs it receives
+and paints the count as the colour of a small marker square; `PhotonSPI` is a fake bus
+that decodes the ILI9486 command stream (it is told the D/C level by the driver),
+tracks the CASET/PASET window and, when a RAMWR data block covers the marker, records
+when that block finished with the count it carries. No loop internals are involved, so
+the same measurement works for the event-driven `HardwareInterface.run` and for the
+old fixed-tick loop (`mode="fixed"`), with or without the async flush worker.
+
+    python -m pipboy.interface.latency_harness --samples 50 --mode both
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from .frame_stats import RingStat
+from .ili9486_driver import ILI9486
+
+MARKER = 4
+
+
+class PhotonSPI:
+    """Fake SPI bus for an ILI9486 that timestamps marker pixels as they are written.
+
+    Transfers take `bytes * 8 / speed_hz` seconds of real time (0 disables that), so
+    flush cost shows up in the measurement like it would on the wire.
+    """
+
+    def __init__(self, marker: tuple[int, int], speed_hz: float = 32e6, clock: Callable[[], float] = time.perf_counter):
+        self.available = True
+        self.bufsiz = 65536
+        self.marker = marker
+        self.speed_hz = speed_hz
+        self.clock = clock
+        self._dc = True
+        self._cmd: Optional[int] = None
+        self._params = bytearray()
+        self._window = (0, 0, 0, 0)
+        self._ramwr_offset = 0
+        self._cond = threading.Condition()
+        # marker value -> time the RAMWR block carrying it completed
+        self.seen: dict[int, float] = {}
+        self.bytes_written = 0
+
+    def set_dc(self, high: bool) -> None:
+        self._dc = high
+
+    def xfer2(self, data: Any) -> bytes:
+        self.writebytes2(data)
+        return bytes(len(memoryview(data).cast("B")))
+
+    def writebytes2(self, data: Any) -> None:
+        mv = memoryview(data).cast("B")
+        if self.speed_hz:
+            deadline = self.clock() + len(mv) * 8 / self.speed_hz
+            while self.clock() < deadline:
+                time.sleep(max(0.0, min(0.001, deadline - self.clock())))
+        self.bytes_written += len(mv)
+        if not self._dc:
+            self._cmd = mv[0] if len(mv) else None
+            self._params = bytearray()
+            self._ramwr_offset = 0
+            return
+        if self._cmd in (ILI9486.CMD_CASET, ILI9486.CMD_RASET):
+            self._params += mv
+            if len(self._params) >= 4:
+                lo = int.from_bytes(self._params[0:2], "big")
+                hi = int.from_bytes(self._params[2:4], "big")
+                x0, x1, y0, y1 = self._window
+                if self._cmd == ILI9486.CMD_CASET:
+                    self._window = (lo, hi, y0, y1)
+                else:
+                    self._window = (x0, x1, lo, hi)
+        elif self._cmd == ILI9486.CMD_RAMWR:
+            self._check_marker(mv)
+
+    def _check_marker(self, mv: memoryview) -> None:
+        x0, x1, y0, y1 = self._window
+        mx, my = self.marker
+        start = self._ramwr_offset
+        self._ramwr_offset += len(mv)
+        if not (x0 <= mx <= x1 and y0 <= my <= y1):
+            return
+        off = ((my - y0) * (x1 - x0 + 1) + (mx - x0)) * 2 - start
+        if 0 <= off and off + 2 <= len(mv):
+            value = int.from_bytes(mv[off : off + 2], "big") & 0x7FFF
+            with self._cond:
+                self.seen.setdefault(value, self.clock())
+                self._cond.notify_all()
+
+    def wait_for(self, value: int, timeout: float) -> Optional[float]:
+        """Time the marker first showed `value`, waiting up to `timeout` seconds."""
+        with self._cond:
+            self._cond.wait_for(lambda: value in self.seen, timeout)
+            return self.seen.get(value)
+
+
+class ProbeApp:
+    """Counts "select" inputs and paints the count into the marker square."""
+
+    name = "Probe"
+
+    def __init__(self, marker: tuple[int, int]):
+        self.marker = marker
+        self.count = 0
+
+    def render(self, ctx: Any) -> None:
+        ctx.draw_text(10, 60, f"inputs: {self.count}")
+        # Bit 15 set keeps the marker distinct from a black background
+        ctx.fill_rect(self.marker[0], self.marker[1], MARKER, MARKER, 0x8000 | (self.count & 0x7FFF))
+
+    def handle_input(self, event: Any) -> None:
+        if event == "select":
+            self.count += 1
+
+
+@dataclass
+class LatencyResult:
+    mode: str
+    source: str
+    # Seconds from injection to the marker's RAMWR completing
+    samples: List[float] = field(default_factory=list)
+    missed: int = 0
+
+    def summary(self) -> dict[str, float]:
+        ring = RingStat(max(1, len(self.samples)))
+        for v in self.samples:
+            ring.add(v)
+        return ring.summary()
+
+    def format(self) -> str:
+        s = self.summary()
+        return (f"{self.mode:<9} {self.source:<8} n={len(self.samples):<4} missed={self.missed:<3} "
+                + "  ".join(f"{k} {s[k] * 1000:7.2f} ms" for k in ("p50", "p95", "p99", "max")))
+
+
+def measure_latency(
+    mode: str = "scheduler",
+    source: str = "keyboard",
+    samples: int = 30,
+    tick: float = 0.5,
+    max_fps: float = 30.0,
+    speed_hz: float = 32e6,
+    async_flush: bool = False,
+    timeout: float = 3.0,
+    seed: int = 0,
+) -> LatencyResult:
+    """Inject `samples` inputs and collect their input-to-photon latencies.
+
+    mode: "scheduler" runs `HardwareInterface.run`; "fixed" renders every `tick`
+    seconds like the original loop. source: "keyboard" (`KeyboardInput.simulate`) or
+    "gpio" (`GPIOInput._invoke`, as a rotary push).
+    """
+    from .app_manager import AppManager
+    from .gpio_input import GPIOInput, KeyboardInput
+    from .hardware_interface import HardwareInterface
+    from .ili9486_display import ILI9486Config, ILI9486Display
+
+    config = ILI9486Config(async_flush=async_flush)
+    marker = (config.width - MARKER, config.height - MARKER)
+    spi = PhotonSPI(marker, speed_hz=speed_hz)
+    display = ILI9486Display(config, spi=spi)
+    probe = ProbeApp(marker)
+    if source == "gpio":
+        inputs: Any = GPIOInput(mapping={"select": None})
+        inject = lambda: inputs._invoke("rot_push")  # noqa: E731
+    else:
+        inputs = KeyboardInput()
+        inject = lambda: inputs.simulate("select")  # noqa: E731
+    hw = HardwareInterface(display, inputs, AppManager([probe], feedback_duration=0), max_fps=max_fps)
+
+    stop = threading.Event()
+    if mode == "fixed":
+        def loop() -> None:
+            hw.initialize()
+            while not stop.is_set():
+                hw.run_once()
+                time.sleep(tick)
+    else:
+        loop = hw.run
+    thread = threading.Thread(target=loop, name="pipboy-latency", daemon=True)
+    thread.start()
+
+    result = LatencyResult(mode, source)
+    rng = random.Random(seed)
+    try:
+        # The first frame (count 0) means the loop is up
+        spi.wait_for(0, timeout)
+        for i in range(1, samples + 1):
+            t_in = time.perf_counter()
+            inject()
+            t_out = spi.wait_for(i, timeout)
+            if t_out is None:
+                result.missed += 1
+                # Resynchronise on whatever count the probe reached
+                spi.wait_for(probe.count & 0x7FFF, timeout)
+                continue
+            result.samples.append(t_out - t_in)
+            # Land the next input at a random phase of the loop
+            time.sleep(rng.uniform(0, tick if mode == "fixed" else 2.0 / max_fps))
+    finally:
+        stop.set()
+        hw.stop()
+        thread.join(tick + timeout)
+        display.close()
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> List[LatencyResult]:
+    parser = argparse.ArgumentParser(description="Measure input-to-photon latency with a simulated panel")
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--mode", choices=("scheduler", "fixed", "both"), default="both")
+    parser.add_argument("--source", choices=("keyboard", "gpio"), default="gpio")
+    parser.add_argument("--tick", type=float, default=0.5, help="Fixed-tick loop period in seconds")
+    parser.add_argument("--max-fps", type=float, default=30.0)
+    parser.add_argument("--speed", type=float, default=32e6, help="Simulated SPI clock in Hz (0: instant)")
+    parser.add_argument("--async-flush", action="store_true")
+    args = parser.parse_args(argv)
+
+    modes = ("fixed", "scheduler") if args.mode == "both" else (args.mode,)
+    results = []
+    for mode in modes:
+        result = measure_latency(mode, args.source, args.samples, args.tick, args.max_fps, args.speed, args.async_flush)
+        print(result.format())
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Headless offscreen display backend
+
+Renders into an in-memory `Framebuffer` with the same drawing interface as the panel
+backends (`draw_text`, `clear`, `update`, ...), so `AppManager.render` runs unchanged
+without Tk, an X server or hardware. Frames are exported as PNG snapshots, either on
+demand with `snapshot()` or every `snapshot_every` frames from `update()`, which
+makes it usable for CI, benchmarks and remote diagnostics.
+
+The PNG encoder is the standard library only (zlib + a CRC per chunk); pixels are
+expanded from RGB565 to 8-bit RGB when a snapshot is taken, never while drawing.
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from .framebuffer import Framebuffer
+from .rgb565 import rgb565_to_rgb888
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(width: int, height: int, rgb: bytes, level: int = 6) -> bytes:
+    """Encode packed 8-bit RGB rows as a PNG (colour type 2, no row filtering)."""
+    row = width * 3
+    if len(rgb) != row * height:
+        raise ValueError(f"expected {row * height} bytes of RGB, got {len(rgb)}")
+    raw = bytearray((row + 1) * height)
+    src = memoryview(rgb)
+    # Each scanline is prefixed with filter type 0, which the zeroed buffer already holds
+    for y in range(height):
+        d = y * (row + 1) + 1
+        raw[d : d + row] = src[y * row : (y + 1) * row]
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(bytes(raw), level))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def write_png(path: str | Path, width: int, height: int, rgb: bytes, level: int = 6) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_png(width, height, rgb, level))
+    return path
+
+
+@dataclass
+class OffscreenConfig:
+    width: int = 480
+    height: int = 320
+    background: str = "#001100"
+    text_scale: int = 1
+    font: str = "builtin"
+    font_size: int = 0
+    # Where snapshots go; "" uses the current directory
+    snapshot_dir: str = ""
+    # Write a snapshot every N frames from update(); 0 only on demand
+    snapshot_every: int = 0
+    snapshot_prefix: str = "frame"
+    # zlib level for snapshots (1 is fastest)
+    png_level: int = 6
+
+
+class OffscreenDisplay(Framebuffer):
+    def __init__(self, config: OffscreenConfig | None = None):
+        self.config = config or OffscreenConfig()
+        super().__init__(self.config.width, self.config.height, background=self.config.background)
+        self.text_scale = self.config.text_scale
+        self.font = self.config.font
+        self.font_size = self.config.font_size or None
+        self.initialized = False
+        self.frame_count = 0
+        self.last_snapshot: Path | None = None
+        self.last_flush_rects: list[tuple[int, int, int, int]] = []
+
+    def initialize(self) -> None:
+        self.clear()
+        self.initialized = True
+
+    def update(self) -> None:
+        # Nothing to transfer: record the damage, count the frame, maybe snapshot it
+        self.last_flush_rects = self.damage.coalesce() if self.damage else []
+        self.damage.clear()
+        self.frame_count += 1
+        every = self.config.snapshot_every
+        if every and self.frame_count % every == 0:
+            self.snapshot()
+
+    def to_rgb(self) -> bytes:
+        """The current frame as packed 8-bit RGB, row-major."""
+        return rgb565_to_rgb888(self.buffer, self.byteorder)
+
+    def snapshot(self, path: str | Path | None = None) -> Path:
+        """Write the current frame as a PNG and return its path.
+
+        Without `path` the file is named `<prefix>_<frame number>.png` in
+        `snapshot_dir`.
+        """
+        if path is None:
+            name = f"{self.config.snapshot_prefix}_{self.frame_count:06d}.png"
+            path = Path(self.config.snapshot_dir or ".") / name
+        self.last_snapshot = write_png(path, self.width, self.height, self.to_rgb(), self.config.png_level)
+        return self.last_snapshot
+
+    def get_last_frame(self) -> memoryview:
+        """Read-only view of the framebuffer (big-endian RGB565, row-major)."""
+        return self._mv.toreadonly()
+
+    def close(self) -> None:
+        pass
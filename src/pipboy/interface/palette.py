@@ -0,0 +1,95 @@
+"""Compiled UI colours
+
+A theme in the config is a dict of '#rrggbb' strings (`fg`, `bg`, `feedback_fg`,
+optionally `dim_fg` for inactive tabs). `Palette.from_theme` parses it once into
+everything the renderers need per frame: Tk colour strings, RGB565 words for the
+framebuffer displays, and a `PULSE_STEPS`-entry table for the tab feedback pulse,
+so a pulse frame is a table lookup rather than colour arithmetic. Switching themes
+means building a new palette.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from .rgb565 import rgb_to_rgb565
+
+# Entries in one pulse period; at 30 fps and a 0.5 s pulse 16 frames are drawn
+PULSE_STEPS = 32
+
+DEFAULT_THEME = {"fg": "#99ff66", "bg": "#001100", "feedback_fg": "#ffff66"}
+
+
+def parse_hex(color: str) -> Tuple[int, int, int]:
+    h = color.lstrip("#")
+    if len(h) == 3:
+        h = "".join(ch * 2 for ch in h)
+    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+
+
+def to_hex(rgb: Tuple[int, int, int]) -> str:
+    return "#%02x%02x%02x" % rgb
+
+
+def blend(a: Tuple[int, int, int], b: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
+    """Linear blend of two RGB triples by `factor` in [0, 1]."""
+    return tuple(int(x + (y - x) * factor) for x, y in zip(a, b, strict=True))  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class Palette:
+    fg: str
+    bg: str
+    # Inactive tab labels
+    dim: str
+    feedback: str
+    fg565: int
+    bg565: int
+    dim565: int
+    feedback565: int
+    # One sine period of the fg/feedback blend, as Tk strings and RGB565 words: from
+    # the midpoint up to feedback (1/4), back through the midpoint down to fg (3/4)
+    pulse: Tuple[str, ...]
+    pulse565: Tuple[int, ...]
+
+    @classmethod
+    def from_theme(cls, theme: Optional[dict] = None, steps: int = PULSE_STEPS) -> "Palette":
+        theme = {**DEFAULT_THEME, **{k: v for k, v in (theme or {}).items() if v}}
+        fg = parse_hex(theme["fg"])
+        bg = parse_hex(theme["bg"])
+        feedback = parse_hex(theme["feedback_fg"])
+        # Inactive tabs default to two thirds of fg (#66aa44 for the green theme)
+        dim = parse_hex(theme["dim_fg"]) if theme.get("dim_fg") else blend((0, 0, 0), fg, 2 / 3)
+        pulse = [blend(fg, feedback, 0.5 * (1 + math.sin(2 * math.pi * k / steps))) for k in range(steps)]
+        return cls(
+            # Colours given by the theme are kept as written; Tk takes them as-is
+            fg=theme["fg"],
+            bg=theme["bg"],
+            dim=theme.get("dim_fg") or to_hex(dim),
+            feedback=theme["feedback_fg"],
+            fg565=rgb_to_rgb565(*fg),
+            bg565=rgb_to_rgb565(*bg),
+            dim565=rgb_to_rgb565(*dim),
+            feedback565=rgb_to_rgb565(*feedback),
+            pulse=tuple(to_hex(c) for c in pulse),
+            pulse565=tuple(rgb_to_rgb565(*c) for c in pulse),
+        )
+
+    @classmethod
+    def from_config(cls, config: Any, steps: int = PULSE_STEPS) -> "Palette":
+        """The palette of the config's selected theme."""
+        if not isinstance(config, dict):
+            return cls.from_theme(None, steps)
+        theme = (config.get("themes") or {}).get(config.get("theme", "green"))
+        return cls.from_theme(theme if isinstance(theme, dict) else None, steps)
+
+    def pulse_at(self, phase: float) -> str:
+        """Pulse colour at `phase` in [0, 1) of the feedback period."""
+        return self.pulse[int(phase * len(self.pulse)) % len(self.pulse)]
+
+    def pulse565_at(self, phase: float) -> int:
+        return self.pulse565[int(phase * len(self.pulse565)) % len(self.pulse565)]
+
+
+DEFAULT_PALETTE = Palette.from_theme()
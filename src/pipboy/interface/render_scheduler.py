@@ -0,0 +1,109 @@
+"""Event-driven frame scheduling for HardwareInterface
+
+Rather than rendering on a fixed tick, the render loop blocks in `wait()` until a frame
+is actually due:
+  - `invalidate()`: something changed (input, an app's own state); thread-safe, so
+    GPIO callbacks and background workers can call it
+  - repeating timers (`set_timer`), e.g. the current app's `refresh_interval`
+  - one-shot wakeups (`wake_at` / `wake_in`), e.g. the end of the tab feedback pulse
+
+Frames are spaced at least `1 / max_fps` apart, so a burst of input coalesces into
+one frame instead of a queue. With nothing pending the loop sleeps until the next
+event (or `idle_timeout`, if set), which keeps idle CPU near zero while input still
+shows up on the next frame.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+
+class RenderScheduler:
+    def __init__(self, max_fps: float = 30.0, idle_timeout: Optional[float] = None):
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        # The first frame is always due
+        self._pending = True
+        # name -> (interval, next due time)
+        self._timers: dict[str, tuple[float, float]] = {}
+        self._wake_at: Optional[float] = None
+        self._last_frame = float("-inf")
+        self._stopping = False
+        self.frames = 0
+        self.wakeups = 0
+
+    def invalidate(self) -> None:
+        """Request a frame as soon as the frame-rate cap allows."""
+        with self._cond:
+            self._pending = True
+            self._cond.notify_all()
+
+    def set_timer(self, name: str, interval: Optional[float]) -> None:
+        """Render every `interval` seconds; None or 0 removes the timer.
+
+        Re-arming a timer with its current interval keeps its phase.
+        """
+        with self._cond:
+            if not interval or interval <= 0:
+                self._timers.pop(name, None)
+                return
+            current = self._timers.get(name)
+            if current is not None and current[0] == interval:
+                return
+            self._timers[name] = (interval, time.monotonic() + interval)
+            self._cond.notify_all()
+
+    def wake_at(self, when: float) -> None:
+        """Render once at monotonic time `when` (the earliest request wins)."""
+        with self._cond:
+            if self._wake_at is None or when < self._wake_at:
+                self._wake_at = when
+                self._cond.notify_all()
+
+    def wake_in(self, delay: float) -> None:
+        self.wake_at(time.monotonic() + delay)
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def _next_due(self) -> Optional[float]:
+        times = [due for _, due in self._timers.values()]
+        if self._wake_at is not None:
+            times.append(self._wake_at)
+        return min(times) if times else None
+
+    def wait(self) -> bool:
+        """Block until the next frame is due. Returns False once stopped."""
+        with self._cond:
+            while not self._stopping:
+                now = time.monotonic()
+                next_due = self._next_due()
+                if self._pending or (next_due is not None and next_due <= now):
+                    earliest = self._last_frame + self.min_interval
+                    if now >= earliest:
+                        self._consume(now)
+                        return True
+                    self._cond.wait(earliest - now)
+                elif next_due is not None:
+                    self._cond.wait(next_due - now)
+                elif not self._cond.wait(self.idle_timeout):
+                    # Nothing happened for idle_timeout: render anyway as a safety net
+                    self._pending = True
+                self.wakeups += 1
+            return False
+
+    def _consume(self, now: float) -> None:
+        self._pending = False
+        for name, (interval, due) in list(self._timers.items()):
+            if due <= now:
+                # Skip missed periods rather than rendering them back to back
+                due += interval * (int((now - due) / interval) + 1)
+                self._timers[name] = (interval, due)
+        if self._wake_at is not None and self._wake_at <= now:
+            self._wake_at = None
+        self._last_frame = now
+        self.frames += 1
@@ -0,0 +1,202 @@
+"""RGB565 colour helpers shared by the framebuffer display backends
+"""
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional
+    np = None
+
+
+def rgb_to_rgb565(r: int, g: int, b: int) -> int:
+    """Pack 8-bit RGB components into a 16-bit RGB565 word."""
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+
+def rgb565_to_rgb(c: int) -> tuple[int, int, int]:
+    """Expand an RGB565 word to 8-bit RGB, replicating high bits into the low ones."""
+    r = (c >> 11) & 0x1F
+    g = (c >> 5) & 0x3F
+    b = c & 0x1F
+    return (r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)
+
+
+@lru_cache(maxsize=256)
+def _parse_hex(h: str) -> int:
+    h = h.lstrip("#")
+    if len(h) == 3:
+        h = "".join(ch * 2 for ch in h)
+    return rgb_to_rgb565(int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+
+
+def to_rgb565(color: Any) -> int:
+    """Convert a colour to an RGB565 word.
+
+    Accepts an int (taken as RGB565 already), a '#rrggbb' / '#rgb' string or an
+    (r, g, b) tuple of 8-bit components.
+    """
+    if isinstance(color, int):
+        return color & 0xFFFF
+    if isinstance(color, str):
+        return _parse_hex(color)
+    r, g, b = color[:3]
+    return rgb_to_rgb565(int(r), int(g), int(b))
+
+
+def rgb565_to_be_bytes(pixels: Any) -> memoryview:
+    """Return 16-bit RGB565 pixel values as big-endian (panel wire order) bytes.
+
+    `pixels` may be a NumPy array, any buffer-protocol object holding native-endian
+    16-bit words (array('H'), memoryview, bytes, bytearray) or a plain sequence of
+    ints. The swap is a single vectorized pass; on big-endian hosts and for arrays
+    already stored as '>u2' the input is returned without copying.
+    """
+    if np is not None and isinstance(pixels, np.ndarray):
+        arr = np.ascontiguousarray(pixels.astype(">u2", copy=False))
+        return memoryview(arr).cast("B")
+    try:
+        mv = memoryview(pixels).cast("B")
+    except TypeError:
+        # Plain sequence of ints: the array is already a private copy
+        a = array("H", pixels)
+        if sys.byteorder == "little":
+            a.byteswap()
+        return memoryview(a).cast("B")
+    if sys.byteorder == "big":
+        return mv
+    a = array("H")
+    a.frombytes(mv)
+    a.byteswap()
+    return memoryview(a).cast("B")
+
+
+# Per-channel lookup tables for packing 8-bit channels into the RGB565 high/low bytes
+_LUT_R_HI = [v & 0xF8 for v in range(256)]
+_LUT_G_HI = [v >> 5 for v in range(256)]
+_LUT_G_LO = [(v & 0x1C) << 3 for v in range(256)]
+_LUT_B_LO = [v >> 3 for v in range(256)]
+_LUT_L_HI = [(v & 0xF8) | (v >> 5) for v in range(256)]
+_LUT_L_LO = [((v & 0x1C) << 3) | (v >> 3) for v in range(256)]
+
+
+def image_size(img: Any) -> tuple[int, int]:
+    """Return (width, height) of a PIL image or NumPy array."""
+    if np is not None and isinstance(img, np.ndarray):
+        return int(img.shape[1]), int(img.shape[0])
+    return img.size
+
+
+def _array_to_rgb565(arr: Any, byteorder: str) -> bytes:
+    dtype = ">u2" if byteorder == "big" else "<u2"
+    if arr.ndim == 2:
+        if arr.dtype == np.uint16:
+            # Already RGB565 words
+            return arr.astype(dtype).tobytes()
+        arr = arr[..., None].repeat(3, axis=2)
+    r = arr[..., 0].astype(np.uint16)
+    g = arr[..., 1].astype(np.uint16)
+    b = arr[..., 2].astype(np.uint16)
+    word = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    return word.astype(dtype).tobytes()
+
+
+def image_to_rgb565(img: Any, byteorder: str = "big") -> bytes:
+    """Convert a PIL image (RGB/RGBA/L/...) or NumPy array to packed RGB565 bytes.
+
+    Arrays may be HxWx3/4 uint8, HxW uint8 greyscale or HxW uint16 RGB565 words.
+    Conversion is vectorized: NumPy bit packing when available, otherwise PIL
+    lookup tables that build the high and low bytes as two 'L' planes and
+    interleave them with an 'LA' merge. Alpha is dropped.
+    """
+    if np is not None and isinstance(img, np.ndarray):
+        return _array_to_rgb565(img, byteorder)
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    if np is not None:
+        return _array_to_rgb565(np.asarray(img), byteorder)
+    from PIL import Image, ImageChops
+
+    if img.mode == "L":
+        hi = img.point(_LUT_L_HI)
+        lo = img.point(_LUT_L_LO)
+    else:
+        r, g, b = img.split()
+        # The packed bit fields don't overlap, so a clipped add is an OR
+        hi = ImageChops.add(r.point(_LUT_R_HI), g.point(_LUT_G_HI))
+        lo = ImageChops.add(g.point(_LUT_G_LO), b.point(_LUT_B_LO))
+    planes = (hi, lo) if byteorder == "big" else (lo, hi)
+    return Image.merge("LA", planes).tobytes()
+
+
+class RGB565ImageCache:
+    """Small LRU of converted images keyed by object identity.
+
+    Meant for static assets (icons, backgrounds) drawn every frame. Entries hold a
+    reference to the source image so its id cannot be reused while cached; mutate a
+    cached image in place and the stale conversion is served, so call `discard()`.
+    """
+
+    def __init__(self, maxsize: int = 32, byteorder: str = "big"):
+        self.maxsize = maxsize
+        self.byteorder = byteorder
+        self._entries: "OrderedDict[int, tuple[Any, bytes]]" = OrderedDict()
+
+    def get(self, img: Any) -> bytes:
+        key = id(img)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is img:
+            self._entries.move_to_end(key)
+            return entry[1]
+        data = image_to_rgb565(img, self.byteorder)
+        self._entries[key] = (img, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return data
+
+    def discard(self, img: Any) -> None:
+        self._entries.pop(id(img), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# RGB565 word -> 3 bytes of 8-bit RGB, built on first use of the pure-Python path
+_RGB888_TABLE: list[bytes] | None = None
+
+
+def rgb565_to_rgb888(buf: Any, byteorder: str = "big") -> bytes:
+    """Expand packed RGB565 bytes to packed 8-bit RGB (3 bytes per pixel).
+
+    The inverse of `image_to_rgb565`, with the same bit replication as
+    `rgb565_to_rgb`. Vectorized with NumPy when available, otherwise a table lookup
+    per pixel.
+    """
+    if np is not None:
+        words = np.frombuffer(buf, dtype=">u2" if byteorder == "big" else "<u2").astype(np.uint16)
+        r = (words >> 11) & 0x1F
+        g = (words >> 5) & 0x3F
+        b = words & 0x1F
+        out = np.empty((len(words), 3), dtype=np.uint8)
+        out[:, 0] = (r << 3) | (r >> 2)
+        out[:, 1] = (g << 2) | (g >> 4)
+        out[:, 2] = (b << 3) | (b >> 2)
+        return out.tobytes()
+    global _RGB888_TABLE
+    if _RGB888_TABLE is None:
+        _RGB888_TABLE = [bytes(rgb565_to_rgb(c)) for c in range(65536)]
+    words = array("H")
+    words.frombytes(memoryview(buf).cast("B"))
+    if (byteorder == "big") != (sys.byteorder == "big"):
+        words.byteswap()
+    table = _RGB888_TABLE
+    return b"".join([table[c] for c in words])
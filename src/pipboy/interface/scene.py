@@ -0,0 +1,316 @@
+"""Retained scene graph for framebuffer rendering
+
+Instead of redrawing the whole screen every frame, UI elements (tab labels, app text,
+rectangles) are persistent `Node`s grouped into `Layer`s. Changing a node's properties
+marks it dirty; `Scene.paint()` then erases the area the node covered, redraws the
+nodes overlapping that area and leaves everything else alone. A frame where nothing
+changed touches no pixels and produces no damage, so static chrome is free.
+
+Apps written against the immediate `ctx.draw_text(...)` API keep working through
+`SceneContext`: each call updates an automatically keyed node (by call order), and
+nodes not drawn in a frame are removed. Apps may also keep their own keyed nodes
+with `ctx.text(key, ...)` / `ctx.rect(key, ...)`, which persist until removed.
+
+Painting needs a `Framebuffer`-like target (`fill_rect`, `draw_text`, `text_size`,
+`epoch`); when the target is cleared or resized behind the scene's back its `epoch`
+moves and the next paint starts from scratch. Scrolling (`SceneContext.scroll_region`)
+doesn't: the scene moves its nodes along with the pixels, and only nodes cut by the
+band's edges are painted again.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+Rect = tuple[int, int, int, int]
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def _scrolled(r: Rect, y0: int, y1: int, dy: int) -> Rect | None:
+    """Where the pixels of `r` are after rows [y0, y1) moved up by `dy` (None: gone)."""
+    x, y, w, h = r
+    top, bottom = y, y + h
+    spans = []
+    if top < y0:
+        spans.append((top, min(bottom, y0)))
+    if bottom > y1:
+        spans.append((max(top, y1), bottom))
+    a, b = max(top, y0) - dy, min(bottom, y1) - dy
+    a, b = max(a, y0), min(b, y1)
+    if a < b:
+        spans.append((a, b))
+    if not spans:
+        return None
+    a, b = min(s[0] for s in spans), max(s[1] for s in spans)
+    return x, a, w, b - a
+
+
+class Node:
+    """A drawable element: kind "text" or "rect" plus its properties."""
+
+    __slots__ = ("key", "kind", "props", "dirty", "drawn")
+
+    def __init__(self, key: str, kind: str, props: dict):
+        self.key = key
+        self.kind = kind
+        self.props = props
+        self.dirty = True
+        # Area covered on the target by the last paint; None if not on screen
+        self.drawn: Rect | None = None
+
+    def set(self, **props: Any) -> bool:
+        """Update properties; returns True (and marks the node dirty) if any changed."""
+        changed = False
+        for k, v in props.items():
+            if k not in self.props or self.props[k] != v:
+                self.props[k] = v
+                changed = True
+        if changed:
+            self.dirty = True
+        return changed
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.props[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def bounds(self, target: Any) -> Rect:
+        p = self.props
+        if self.kind == "text":
+            w, h = target.text_size(p["text"], p.get("scale"), p.get("font"), p.get("size"))
+            return p["x"], p["y"], w, h
+        return p["x"], p["y"], p["w"], p["h"]
+
+    def draw(self, target: Any) -> None:
+        p = self.props
+        if self.kind == "text":
+            target.draw_text(p["x"], p["y"], p["text"], fg=p.get("fg", "#99ff66"), scale=p.get("scale"),
+                             bg=p.get("bg"), font=p.get("font"), size=p.get("size"))
+        else:
+            target.fill_rect(p["x"], p["y"], p["w"], p["h"], p["fill"])
+
+
+class Layer:
+    """An ordered group of nodes, shown or hidden together."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nodes: dict[str, Node] = {}
+        self._visible = True
+        # Visibility changed since the last paint
+        self.toggled = False
+        # Areas of removed nodes still to be erased
+        self.removed: list[Rect] = []
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        if value != self._visible:
+            self._visible = value
+            self.toggled = not self.toggled
+
+    def _upsert(self, key: str, kind: str, props: dict) -> Node:
+        node = self.nodes.get(key)
+        if node is None or node.kind != kind:
+            if node is not None:
+                self.remove(key)
+            node = self.nodes[key] = Node(key, kind, props)
+        else:
+            node.set(**props)
+        return node
+
+    def text(self, key: str, x: int, y: int, text: str, fg: Any = "#99ff66", **props: Any) -> Node:
+        return self._upsert(key, "text", {"x": x, "y": y, "text": str(text), "fg": fg, **props})
+
+    def rect(self, key: str, x: int, y: int, w: int, h: int, fill: Any) -> Node:
+        return self._upsert(key, "rect", {"x": x, "y": y, "w": w, "h": h, "fill": fill})
+
+    def remove(self, key: str) -> None:
+        node = self.nodes.pop(key, None)
+        if node is not None and node.drawn is not None:
+            self.removed.append(node.drawn)
+
+    def clear(self) -> None:
+        for key in list(self.nodes):
+            self.remove(key)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes.values())
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+class Scene:
+    def __init__(self, background: Any = None):
+        self.layers: dict[str, Layer] = {}
+        # Erase colour; None uses the target's background
+        self.background = background
+        self._target: Any = None
+        self._epoch: Any = None
+        # Nodes drawn by the last paint, for stats and tests
+        self.painted = 0
+
+    def layer(self, name: str) -> Layer:
+        """Return the named layer, creating it on top of the existing ones."""
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = self.layers[name] = Layer(name)
+        return layer
+
+    def invalidate(self) -> None:
+        """Repaint everything on the next paint."""
+        self._target = None
+
+    def scroll(self, y0: int, y1: int, dy: int) -> None:
+        """Follow the target's `scroll_region(y0, y1, dy)`.
+
+        Nodes inside the band move with their pixels and stay clean; nodes cut by the
+        band's edges (or scrolled out of it) are erased where their pixels now are and
+        painted again.
+        """
+        if y1 <= y0 or dy == 0:
+            return
+        for layer in self.layers.values():
+            layer.removed = [r for r in (_scrolled(r, y0, y1, dy) for r in layer.removed) if r is not None]
+            for node in layer:
+                r = node.drawn
+                if r is None or r[1] + r[3] <= y0 or r[1] >= y1:
+                    continue
+                moved = (r[0], r[1] - dy, r[2], r[3])
+                node.drawn = _scrolled(r, y0, y1, dy)
+                if node.drawn == moved and r[1] >= y0 and r[1] + r[3] <= y1:
+                    if not node.dirty:
+                        node.props["y"] -= dy
+                else:
+                    node.dirty = True
+
+    def _full_repaint(self, target: Any) -> None:
+        target.clear(self.background)
+        for layer in self.layers.values():
+            layer.toggled = False
+            layer.removed.clear()
+            for node in layer:
+                node.drawn = None
+                if layer.visible:
+                    node.draw(target)
+                    node.drawn = node.bounds(target)
+                    self.painted += 1
+                node.dirty = False
+
+    def paint(self, target: Any) -> list[Rect]:
+        """Bring `target` up to date with the scene; returns the erased areas."""
+        self.painted = 0
+        if target is not self._target or getattr(target, "epoch", None) != self._epoch:
+            self._full_repaint(target)
+            self._target = target
+            self._epoch = getattr(target, "epoch", None)
+            return [(0, 0, target.width, target.height)]
+
+        # Areas whose contents are stale: where changed nodes were and will be
+        regions: list[Rect] = []
+        for layer in self.layers.values():
+            regions.extend(layer.removed)
+            layer.removed.clear()
+            if layer.toggled and not layer.visible:
+                for node in layer:
+                    if node.drawn is not None:
+                        regions.append(node.drawn)
+                        node.drawn = None
+            elif layer.visible:
+                for node in layer:
+                    if node.dirty or layer.toggled:
+                        if node.drawn is not None:
+                            regions.append(node.drawn)
+                        node.drawn = node.bounds(target)
+                        regions.append(node.drawn)
+                        node.dirty = True
+            layer.toggled = False
+        if not regions:
+            return regions
+
+        bg = target.background if self.background is None else self.background
+        for x, y, w, h in regions:
+            target.fill_rect(x, y, w, h, bg)
+        # Redraw in z-order everything the erase touched, not just what changed. Text
+        # cells are opaque, so a redrawn node also drags in the nodes overlapping it.
+        nodes = [node for layer in self.layers.values() if layer.visible for node in layer]
+        stale = list(regions)
+        redraw = [node.dirty for node in nodes]
+        grown = True
+        while grown:
+            grown = False
+            for i, node in enumerate(nodes):
+                if not redraw[i] and node.drawn is not None and any(_overlaps(node.drawn, r) for r in stale):
+                    redraw[i] = grown = True
+                    stale.append(node.drawn)
+        for node, flag in zip(nodes, redraw):
+            if flag:
+                node.draw(target)
+                node.dirty = False
+                self.painted += 1
+        return regions
+
+
+class SceneContext:
+    """Rendering context handed to apps; records drawing into a `Layer`.
+
+    `draw_text` / `fill_rect` calls become nodes keyed by call order and live for one
+    frame (see `begin` / `end`). Other attributes are read from the underlying
+    context, so apps can still query `width`, `height` and the like.
+    """
+
+    def __init__(self, layer: Layer, ctx: Any, scene: Scene | None = None):
+        self.layer = layer
+        self.ctx = ctx
+        # Told about scrolls of `ctx`, so they don't cost a repaint
+        self.scene = scene
+        self._count = 0
+        self._auto: set[str] = set()
+
+    def begin(self) -> None:
+        self._count = 0
+        self._seen: set[str] = set()
+
+    def end(self) -> None:
+        for key in self._auto - self._seen:
+            self.layer.remove(key)
+        self._auto = self._seen
+
+    def _auto_key(self) -> str:
+        key = f"#{self._count}"
+        self._count += 1
+        self._seen.add(key)
+        return key
+
+    def draw_text(self, x: int, y: int, text: str, fg: Any = "#99ff66", **props: Any) -> None:
+        if "color" in props:
+            fg = props.pop("color")
+        self.layer.text(self._auto_key(), x, y, text, fg, **props)
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: Any) -> None:
+        self.layer.rect(self._auto_key(), x, y, w, h, color)
+
+    def text(self, key: str, x: int, y: int, text: str, fg: Any = "#99ff66", **props: Any) -> Node:
+        return self.layer.text(key, x, y, text, fg, **props)
+
+    def rect(self, key: str, x: int, y: int, w: int, h: int, fill: Any) -> Node:
+        return self.layer.rect(key, x, y, w, h, fill)
+
+    def remove(self, key: str) -> None:
+        self.layer.remove(key)
+
+    def scroll_region(self, y0: int, y1: int, dy: int, fill: Any = None) -> None:
+        self.ctx.scroll_region(y0, y1, dy, fill)
+        if self.scene is not None:
+            y0, y1 = max(0, y0), min(self.ctx.height, y1)
+            self.scene.scroll(y0, y1, dy)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.ctx, name)
@@ -1,7 +1,51 @@
 from __future__ import annotations
 
+import logging
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Canvas tag on every icon bar item; raised above the rest of the UI after each render
+ICON_TAG = "iconbar"
+
+# Icons always offered in the bar besides the apps' own
+DEFAULT_ICONS = ["Camera", "FileManager", "Lights", "Fan", "Display", "exit", "clock", "debug", "radio", "settings"]
+
+
+def _rows(n: int, rows: int) -> List[int]:
+    base, extra = divmod(n, rows)
+    return [base + (1 if i < extra else 0) for i in range(rows)]
+
+
+def layout_icon_bar(names: List[str], width: int, height: int, size: int) -> List[Tuple[str, int, int]]:
+    """Place icons in 2 or 3 bottom rows, evenly spaced per row.
+
+    Returns (name, x, y) with (x, y) the bottom centre of each icon.
+    """
+    n = len(names)
+    if not n:
+        return []
+    padding = max(8, size // 3)
+    bottom_padding = size // 2 + 6
+    row_spacing = size + max(8, size // 3)
+    # Prefer 2 rows unless too many icons; use a third row if they'd be crowded
+    rows = 2 if n <= 8 else 3
+    counts = _rows(n, rows)
+    if rows < 3 and width / (max(counts) + 1) < size + padding:
+        rows = 3
+        counts = _rows(n, rows)
+    counts = [c for c in counts if c]
+
+    placed = []
+    names = iter(names)
+    for r, count in enumerate(counts):
+        gap = width / (count + 1)
+        y = int(height - bottom_padding - r * row_spacing)
+        for c in range(count):
+            placed.append((next(names), int((c + 1) * gap), y))
+    return placed
 
 
 def attach_icon_support(ui: Any) -> None:
@@ -10,6 +54,10 @@ def attach_icon_support(ui: Any) -> None:
     This function is intentionally non-invasive: it adds a `_load_icons` method
     and a property `app_manager` with a setter that triggers icon loading when
     the app list is assigned (tests set `tk.app_manager = AppManager(...)`).
+
+    The icon bar is laid out when the canvas reports its size (`<Configure>`) and
+    when the app list changes. Items are kept and moved between layouts, and the
+    bar is kept on top by raising its tag after each render.
     """
     # Avoid attaching multiple times
     if getattr(ui, "_icon_support_attached", False):
@@ -22,8 +70,18 @@ def attach_icon_support(ui: Any) -> None:
     # src_icons is the package-local resources/icons
     src_icons = Path(__file__).parent.parent / "resources" / "icons"
 
+    # Visible outlines around each icon, to check placement on remote screenshots
+    debug_markers = bool(os.environ.get("PIPBOY_ICON_DEBUG")) or Path.home().joinpath(
+        "diagnostics", "icon_debug_on"
+    ).exists()
+
+    ui._icon_items = []
+    ui._icon_layout = None
+    ui.icon_size = getattr(ui, "icon_size", 24)  # default icon size (px) on Pi/desktop
+
     def _load_icons():
         try:
+            from .icon_cache import IconCache
             from .icon_utils import find_or_create_icon
         except Exception:
             ui._icons = {}
@@ -36,340 +94,110 @@ def attach_icon_support(ui: Any) -> None:
             except Exception:
                 apps = []
         # Always ensure the common icons are present
-        targets = sorted(set(apps + ["Camera", "FileManager", "Lights", "Fan", "Display", "exit", "clock", "debug",
-            "radio", "settings"]))
-        for name in targets:
+        for name in sorted(set(apps + DEFAULT_ICONS)):
             p = find_or_create_icon(name, [src_icons, repo_icons])
-            if p is None:
-                continue
-            ui._icons[name] = str(p)
-
-        # Prepare image cache and rendering helpers
-        ui._tk_images = {}
-        ui._icon_items = []
-        ui.icon_size = getattr(ui, 'icon_size', 24)  # default icon size (px) on Pi/desktop
-
-        def _get_tk_image(path: str, size: int):
-            # Return a tkinter-compatible PhotoImage sized to (size, size). Prefer pre-resized
-            # assets in resources/icons/<size>/ if they exist to avoid runtime scaling overhead.
-            try:
-                from PIL import Image, ImageTk
-            except Exception:
-                Image = None
-                ImageTk = None
-            try:
-                p = Path(path)
-                pre = p.parent / str(size) / p.name
-                if pre.exists():
-                    use_path = str(pre)
-                else:
-                    use_path = path
-                if Image is not None:
-                    img = Image.open(use_path).convert('RGBA')
-                    img = img.resize((size, size), Image.LANCZOS)
-                    tkimg = ImageTk.PhotoImage(img)
-                else:
-                    # fallback: use tkinter.PhotoImage and rely on subsample (approximate)
-                    import tkinter as tk
-                    tkimg = tk.PhotoImage(file=use_path)
-                    # try integer subsample to make it reasonably small
-                    try:
-                        w = tkimg.width()
-                        if w > size:
-                            subs = max(1, int(round(w / size)))
-                            tkimg = tkimg.subsample(subs, subs)
-                    except Exception:
-                        pass
-                return tkimg
-            except Exception:
-                return None
+            if p is not None:
+                ui._icons[name] = str(p)
+        # Pre-resized copies, loaded once per (icon, size); share the tab icons' cache
+        if getattr(ui, "_icon_cache", None) is None:
+            ui._icon_cache = getattr(getattr(ui, "icons", None), "cache", None) or IconCache()
+        # Force a fresh layout for the new icon set
+        ui._icon_layout = None
+        logger.debug("Loaded icons: %s", ui._icons)
+
+    def _canvas_size(canvas, event=None) -> Tuple[int, int]:
+        if event is not None and getattr(event, "width", 0) > 1:
+            return int(event.width), int(event.height)
+        # Test doubles record their constructor kwargs; real canvases report their size
+        kwargs = getattr(canvas, "kwargs", None)
+        if isinstance(kwargs, dict):
+            return int(kwargs.get("width", 800)), int(kwargs.get("height", 600))
+        try:
+            w, h = canvas.winfo_width(), canvas.winfo_height()
+            if w > 1 and h > 1:
+                return int(w), int(h)
+            return int(canvas.cget("width")), int(canvas.cget("height"))
+        except Exception:
+            return 800, 600
 
-        def _render_icon_bar():
-            # Distribute icons into 2 or 3 rows, evenly spaced per row, fixed 12x12 icons
+    def _icon_size(width: int) -> int:
+        # Explicit sizes: PIPBOY_ICON_SIZE env var, or ui.icon_size with ui.icon_size_force
+        env_size = os.environ.get("PIPBOY_ICON_SIZE")
+        size = None
+        if env_size:
             try:
-                canvas = getattr(ui, 'canvas', None)
-                if canvas is None:
-                    return
-
-                # Resolve canvas size
-                try:
-                    width = int(canvas.kwargs.get('width', 800))
-                except Exception:
-                    try:
-                        width = int(canvas.master.winfo_width())
-                    except Exception:
-                        width = 800
-                try:
-                    height = int(canvas.kwargs.get('height', 600))
-                except Exception:
-                    try:
-                        height = int(canvas.master.winfo_height())
-                    except Exception:
-                        height = 600
-
-                names = list(ui._icons.keys())
-                if not names:
-                    return
-
-                n = len(names)
-                # debug: log canvas and icon counts
-                try:
-                    print(f"render_icon_bar: canvas={width}x{height} n={n}")
-                except Exception:
-                    pass
-
-                # Icon size: autoscale by default; allow forced user override with ui.icon_size_force=True
-                user_size = getattr(ui, 'icon_size', None)
-                force_user = bool(getattr(ui, 'icon_size_force', False))
-                # allow env var override for quick testing on Pi: PIPBOY_ICON_SIZE
-                try:
-                    import os
-                    env_size = os.environ.get('PIPBOY_ICON_SIZE')
-                except Exception:
-                    env_size = None
-                if env_size:
-                    try:
-                        size = int(env_size)
-                        mode = 'env'
-                    except Exception:
-                        size = 24
-                        mode = 'auto'
-                elif user_size and force_user:
-                    try:
-                        size = int(user_size)
-                        mode = 'forced'
-                    except Exception:
-                        size = 24
-                        mode = 'auto'
-                else:
-                    # heuristic: ~width/80 gives ~24px on 1920px wide screens
-                    # use a larger minimum so icons are readable on small canvases
-                    try:
-                        min_size = 18
-                        size = max(min_size, min(48, max(1, int(width)) // 80))
-                    except Exception:
-                        size = 24
-                    mode = 'auto'
-                try:
-                    print(f"Icon render size chosen={size} mode={mode} (env_size={env_size} user_size={user_size} force_user={force_user}) width={width} height={height}")
-                except Exception:
-                    pass
-                padding = max(8, size // 3)
-                bottom_padding = size // 2 + 6
-                row_spacing = size + max(8, size // 3)
-
-                # Prefer 2 rows unless too many icons; allow up to 3 rows
-                rows = 2 if n <= 8 else 3
-
-                # Distribute icons across rows as evenly as possible
-                base = n // rows
-                extra = n % rows
-                counts = [(base + (1 if i < extra else 0)) for i in range(rows)]
-
-                # If any row would have 0 items, reduce rows accordingly
-                while rows > 1 and counts[-1] == 0:
-                    rows -= 1
-                    base = n // rows
-                    extra = n % rows
-                    counts = [(base + (1 if i < extra else 0)) for i in range(rows)]
-
-                # Clear previous icon items
-                try:
-                    for item in getattr(ui, '_icon_items', []):
-                        try:
-                            canvas.delete(item)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                ui._icon_items = []
-                ui._tk_images = ui._tk_images or {}
-
-                # Layout each row centered horizontally with even spacing
-                index = 0
-                y0 = height - bottom_padding
-                for r in range(rows):
-                    count = counts[r]
-                    if count == 0:
-                        continue
-                    # gap between centers
-                    gap = width / (count + 1)
-                    # ensure minimal spacing
-                    min_gap = size + padding
-                    if gap < min_gap and rows < 3:
-                        # try more rows to reduce crowding
-                        rows = min(3, rows + 1)
-                        base = n // rows
-                        extra = n % rows
-                        counts = [(base + (1 if i < extra else 0)) for i in range(rows)]
-                        # restart layout
-                        index = 0
-                        y0 = height - bottom_padding
-                        continue
-
-                    # determine vertical position for this row (stack from bottom upwards)
-                    y = int(y0 - r * row_spacing)
-                    for c in range(count):
-                        name = names[index]
-                        index += 1
-                        x = int((c + 1) * gap)
-                        path = ui._icons.get(name)
-                        if path is None:
-                            continue
-                        key = (path, size)
-                        img = ui._tk_images.get(key)
-                        if img is None:
-                            img = _get_tk_image(path, size)
-                            if img is None:
-                                continue
-                            ui._tk_images[key] = img
-                        try:
-                            # log image size if possible for debugging layout
-                            try:
-                                iw = img.width() if hasattr(img, 'width') else None
-                                ih = img.height() if hasattr(img, 'height') else None
-                            except Exception:
-                                iw = ih = None
-                            try:
-                                print(f"Placing icon '{name}' at ({x},{y}) img_size={iw}x{ih} target={size}")      
-                            except Exception:
-                                pass
-                            item = canvas.create_image(x, y, image=img, anchor='s')
-                            ui._icon_items.append(item)
-                                try:
-                                    # ensure icons are on top and log their actual bounding box
-                                    canvas.tag_raise(item)
-                                    bbox = canvas.bbox(item)
-                                    print(f"Icon bbox for '{name}': {bbox}")
-                                except Exception:
-                                    pass
-                                # Optional: draw visible debug markers when env var set so we can
-                                # visually verify position/size on remote Pi screenshots
-                                try:
-                                    import os
-                                    from pathlib import Path
-                                    debug_on = os.environ.get('PIPBOY_ICON_DEBUG') or Path.home().joinpath('diagnostics','icon_debug_on').exists()
-                                    if debug_on:
-                                        try:
-                                            # small rectangle above anchor point (anchor='s')
-                                            r = canvas.create_rectangle(x - size//2, y - size, x + size//2, y, outline='red', width=1)
-                                            t = canvas.create_text(x, y - size - 6, text=name[:1], fill='red')
-                                            # keep debug items separate
-                                            ui._icon_debug_items = getattr(ui, '_icon_debug_items', [])
-                                            ui._icon_debug_items.extend([r, t])
-                                            canvas.tag_raise(r)
-                                            canvas.tag_raise(t)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-
-        # Schedule re-render attempts until icons are actually placed on canvas
+                size = int(env_size)
+            except ValueError:
+                size = None
+        elif getattr(ui, "icon_size_force", False):
+            try:
+                size = int(ui.icon_size)
+            except (TypeError, ValueError):
+                size = None
+        if size is None:
+            # heuristic: ~width/80 gives ~24px on 1920px wide screens, 18px minimum
+            size = max(18, min(48, max(1, int(width)) // 80))
+        from .icon_cache import snap_size
+
+        # Only cached sizes are drawn, so a new layout never resamples
+        return snap_size(size, ui._icon_cache.sizes)
+
+    def _render_icon_bar(event=None):
+        canvas = getattr(ui, "canvas", None)
+        if canvas is None or not getattr(ui, "_icons", None):
+            return
         try:
-            canvas = getattr(ui, 'canvas', None)
-            if canvas is not None and hasattr(canvas.master, 'after'):
-                # bind once to respond to resizes
-                try:
-                    if not getattr(ui, '_icon_bind_set', False):
-                        try:
-                            canvas.bind('<Configure>', lambda e: ui._render_icon_bar())
-                        except Exception:
-                            pass
-                        ui._icon_bind_set = True
-                except Exception:
-                    pass
-
-                def _attempt_render(attempts=[0]):
-                    try:
-                        ui._render_icon_bar()
-                        attempts[0] += 1
-                        # If items placed, print success and stop retrying
-                        if getattr(ui, '_icon_items', None) and len(ui._icon_items) >= len(ui._icons):
-                            try:
-                                print(f"Icon render succeeded after {attempts[0]} attempts")
-                            except Exception:
-                                pass
-                            # Try to capture the canvas contents to a local PNG for reliable debugging
-                            try:
-                                from pathlib import Path
-                                diag = Path.home() / 'diagnostics'
-                                diag.mkdir(parents=True, exist_ok=True)
-                                ps_path = str(diag / 'pipboy_canvas.ps')
-                                png_path = str(diag / 'pipboy_canvas_internal.png')
-                                try:
-                                    canvas.postscript(file=ps_path, colormode='color')
-                                    # Try to convert via PIL (requires Ghostscript or ImageMagick fallback)        
-                                    try:
-                                        from PIL import Image
-                                        img = Image.open(ps_path)
-                                        img.save(png_path)
-                                    except Exception:
-                                        import subprocess
-                                        try:
-                                            subprocess.run(['convert', ps_path, png_path], check=True)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-                            return
-                        if attempts[0] < 20:
-                            try:
-                                canvas.master.after(250, _attempt_render)
-                            except Exception:
-                                pass
-                    except Exception:
-                        # schedule again in case layout wasn't ready
-                        try:
-                            if attempts[0] < 20:
-                                canvas.master.after(250, _attempt_render)
-                        except Exception:
-                            pass
-                try:
-                    canvas.master.after(250, _attempt_render)
-                except Exception:
-                    pass
+            width, height = _canvas_size(canvas, event)
+            size = _icon_size(width)
+            names = list(ui._icons.keys())
+            layout = (width, height, size, tuple(names))
+            if layout == ui._icon_layout:
+                return
+            ui._icon_layout = layout
+
+            from .tk_items import RetainedCanvas
+
+            layer = getattr(ui, "_icon_layer", None)
+            if layer is None or layer.canvas is not canvas:
+                layer = ui._icon_layer = RetainedCanvas(canvas, tag=ICON_TAG)
+            layer.begin()
+            for name, x, y in layout_icon_bar(names, width, height, size):
+                img = ui._icon_cache.photo(Path(ui._icons[name]), size)
+                if img is None:
+                    continue
+                layer.image(f"icon:{name}", x, y, image=img, anchor="s")
+                if debug_markers:
+                    layer.rect(f"icon-debug:{name}", x - size // 2, y - size, x + size // 2, y, outline="red", width=1)
+                    layer.text(f"icon-label:{name}", x, y - size - 6, text=name[:1], fill="red")
+            layer.end()
+            ui._icon_items = [key for key in (f"icon:{n}" for n in names) if key in layer]
+            raise_icons()
+        except Exception as e:
+            # never let icon layout break the UI
+            logger.debug("Icon bar layout failed: %s", e)
+
+    def raise_icons():
+        """Keep the icon bar above everything else on the canvas."""
+        try:
+            ui.canvas.tag_raise(ICON_TAG)
         except Exception:
             pass
 
-        # Print a small summary for logs
+    ui._load_icons = _load_icons
+    ui._render_icon_bar = _render_icon_bar
+    ui._raise_icons = raise_icons
+
+    # Lay out again whenever the canvas is mapped or resized
+    canvas = getattr(ui, "canvas", None)
+    if canvas is not None and not getattr(ui, "_icon_bind_set", False):
         try:
-            print("Loaded icons:", {k: v for k, v in ui._icons.items()})
-            # Schedule short-lived periodic raises so icons remain on top after they are placed
-            try:
-                def _raise_once():
-                    try:
-                        if getattr(ui, '_icon_items', None):
-                            for it in ui._icon_items:
-                                try:
-                                    canvas.tag_raise(it)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
-                def _schedule_raise(count=[0]):
-                    try:
-                        _raise_once()
-                    except Exception:
-                        pass
-                    count[0] += 1
-                    if count[0] < 30:
-                        try:
-                            canvas.master.after(1000, _schedule_raise)
-                        except Exception:
-                            pass
-                try:
-                    canvas.master.after(1000, _schedule_raise)
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            canvas.bind("<Configure>", _render_icon_bar, add="+")
+        except TypeError:
+            # Test doubles without `add`
+            canvas.bind("<Configure>", _render_icon_bar)
         except Exception:
             pass
-
-    # Attach the loader
-    ui._load_icons = _load_icons
+        ui._icon_bind_set = True
 
     # If the instance already set app_manager in its constructor, move it into
     # our internal storage so the property behaves the same as before.
@@ -385,10 +213,7 @@ def attach_icon_support(ui: Any) -> None:
     # Load icons immediately (defaults + app names if present) and render the bar
     try:
         ui._load_icons()
-        try:
-            ui._render_icon_bar()
-        except Exception:
-            pass
+        ui._render_icon_bar()
     except Exception:
         pass
 
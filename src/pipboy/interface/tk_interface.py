@@ -1,4 +1,14 @@
 """Tk-based UI for development and testing (desktop fallback)
+
+Frames are drawn on demand: at `animation_fps` only while the tab feedback pulse runs
+or the current app sets `animating`, every `refresh_interval` for apps that change on
+their own, and otherwise only when an input binding, an app's `invalidate()` or a
+config reload (F5) asks for one. Idle, the Tk loop just sleeps in `mainloop`.
+
+Redraws requested from other threads (background updates) reach the Tk thread through
+`after()` with a threaded Tcl, and otherwise through a pipe watched by a Tk file
+handler. Only where neither works (no file handlers on Windows) is there a poll, and
+only while the update thread runs.
 """
 # Minimal, testable Tk interface used for dev mode
 from __future__ import annotations
@@ -7,29 +17,29 @@ import tkinter as tk
 from pathlib import Path
 import yaml
 from typing import Any
-import math
-
+import os
+import threading
+import time
 
-def _hex_to_rgb(h: str) -> tuple[int, int, int]:
-    h = h.lstrip('#')
-    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-
-
-def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-    return '#%02x%02x%02x' % rgb
+from .icon_cache import IconSet
+from .palette import DEFAULT_PALETTE, Palette, blend, parse_hex, to_hex
+from .tk_items import RetainedCanvas
 
 
 def _blend_hex(h1: str, h2: str, factor: float) -> str:
     """Linearly blend two hex colors by factor in [0,1]."""
-    r1, g1, b1 = _hex_to_rgb(h1)
-    r2, g2, b2 = _hex_to_rgb(h2)
-    r = int(r1 + (r2 - r1) * factor)
-    g = int(g1 + (g2 - g1) * factor)
-    b = int(b1 + (b2 - b1) * factor)
-    return _rgb_to_hex((r, g, b))
+    return to_hex(blend(parse_hex(h1), parse_hex(h2), factor))
 
 
 class TkInterface:
+    # Frame rate while something animates (ui.animation_fps overrides)
+    ANIMATION_FPS = 30.0
+    # Without a threaded Tcl or file handlers, redraws requested by worker threads are
+    # picked up by polling at this interval (ms) while the update thread runs
+    IDLE_POLL_MS = 250
+    # Tab icons are drawn left of the label, which starts 24 px in
+    TAB_ICON_SIZE = 18
+
     def __init__(self, config_path: Path, sensors: dict | None = None, fullscreen: bool | None = None):
         """Tk-based development interface.
 
@@ -46,6 +56,18 @@ class TkInterface:
         # Increase canvas to 800x600 (user requested)
         self.canvas = tk.Canvas(self.root, width=800, height=600, bg="#001100")
         self.canvas.pack()
+        # Canvas items are created once per element and updated in place
+        self.items = RetainedCanvas(self.canvas)
+        self._canvas_bg = "#001100"
+        # Pending root.after() for the next frame, and when it fires (monotonic)
+        self._after_id = None
+        self._after_due = float("inf")
+        # A redraw was requested from a thread that can't call into Tk
+        self._dirty = False
+        self._tk_thread = threading.current_thread()
+        # (read, write) ends of the wakeup pipe, see _open_wakeup
+        self._wakeup: tuple[int, int] | None = None
+        self.updates = None
         self.root.update()
         self.load_config()
         # Place tabs/icons at the bottom by default, allow config override
@@ -71,7 +93,6 @@ class TkInterface:
                     pass
 
         # Load available icons (best-effort) from either src/resources/icons or repo-root resources/icons
-        self.icons: dict[str, Any] = {}
         self._load_icons()
 
 
@@ -89,36 +110,25 @@ class TkInterface:
             # Ignore if binding not supported in test environments
             pass
 
+        try:
+            self.animation_fps = float(ui_conf.get("animation_fps", self.ANIMATION_FPS))
+        except (TypeError, ValueError):
+            self.animation_fps = self.ANIMATION_FPS
+
         # Touch gesture state
         self._touch_start = None
         self._touch_last = None
-        # Create app manager with basic apps; inject sensors into EnvironmentApp
-        from pipboy.app.file_manager import FileManagerApp
-        from pipboy.app.map import MapApp
-        from pipboy.app.environment import EnvironmentApp
-        from pipboy.app.clock import ClockApp
-        from pipboy.app.radio import RadioApp
-        from pipboy.app.update import UpdateApp
-        from pipboy.app.debug import DebugApp
-        from pipboy.app.settings import SettingsApp
-        from pipboy.app.exit_app import ExitApp
+        # Create app manager from the app registry; apps are built on first selection
+        from pipboy.app.registry import DEV_APPS, app_names, create_apps
         from .app_manager import AppManager
 
-        theme = self.config.get("themes", {}).get(self.config.get("theme", "green"), {})
-        fb_color = theme.get("feedback_fg", "#ffff66")
-        fb_duration = theme.get("feedback_duration", 0.5)
-
-        self.app_manager = AppManager([
-            FileManagerApp(),
-            MapApp(),
-            EnvironmentApp(sensors=self.sensors),
-            ClockApp(),
-            RadioApp(),
-            UpdateApp(),
-            DebugApp(),
-            SettingsApp(),
-            ExitApp(),
-        ], feedback_color=fb_color, feedback_duration=fb_duration)
+        theme = self.config.get("themes", {}).get(self.config.get("theme", "green"), {}) or {}
+
+        self.app_manager = AppManager(
+            create_apps(app_names(self.config, DEV_APPS), {"sensors": self.sensors}),
+            feedback_duration=theme.get("feedback_duration", 0.5),
+            palette=Palette.from_config(self.config),
+        )
 
     def load_config(self) -> None:
         try:
@@ -127,12 +137,128 @@ class TkInterface:
         except Exception:
             self.config = {"theme": "green"}
 
+    def reload_config(self) -> None:
+        """Re-read the config file (theme, feedback style) and redraw."""
+        self.load_config()
+        theme = self.config.get("themes", {}).get(self.config.get("theme", "green"), {}) or {}
+        am = self.app_manager
+        am.palette = Palette.from_config(self.config)
+        am._feedback_duration = theme.get("feedback_duration", am._feedback_duration)
+        self.request_redraw()
+
+    def request_redraw(self) -> None:
+        """Draw a frame as soon as Tk is idle. Safe to call from any thread."""
+        if threading.current_thread() is self._tk_thread:
+            self._schedule(0)
+            return
+        self._dirty = True
+        if self._threaded_tcl():
+            try:
+                # A threaded Tcl runs this on the Tk thread
+                self.root.after(0, self._schedule, 0)
+            except Exception:
+                pass
+        elif self._wakeup is not None:
+            try:
+                os.write(self._wakeup[1], b"\0")
+            except OSError:
+                # Pipe full: a wakeup is already pending
+                pass
+
+    def _threaded_tcl(self) -> bool:
+        try:
+            return bool(self.root.tk.call("info", "exists", "tcl_platform(threaded)"))
+        except Exception:
+            return False
+
+    def _schedule(self, delay_ms: int, callback: Any = None) -> None:
+        """Run `_tick` (or `callback`) in `delay_ms`, unless a frame is already due sooner."""
+        due = time.monotonic() + delay_ms / 1000.0
+        if self._after_id is not None:
+            if self._after_due <= due:
+                return
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_due = due
+        self._after_id = self.root.after(delay_ms, callback or self._tick)
+
+    def _next_delay(self, pulsed: bool = False) -> int | None:
+        """Milliseconds until the next frame is needed on its own, None if never.
+
+        `pulsed`: the frame just drawn showed the feedback pulse. It needs a
+        follow-up even if the pulse ended while it was drawn, to restore the tab.
+        """
+        am = self.app_manager
+        if pulsed or am._is_feedback_active() or getattr(am.current, "animating", False):
+            return max(1, int(1000 / self.animation_fps))
+        interval = am.refresh_interval() if hasattr(am, "refresh_interval") else None
+        if interval:
+            return max(1, int(interval * 1000))
+        return None
+
+    def _open_wakeup(self) -> None:
+        """Watch a pipe that request_redraw writes to from other threads (non-threaded Tcl)."""
+        if self._threaded_tcl() or self._wakeup is not None:
+            return
+        r, w = os.pipe()
+        try:
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            self.root.tk.createfilehandler(r, tk.READABLE, self._on_wakeup)
+        except Exception:
+            # No Tk file handlers (Windows): fall back to polling
+            os.close(r)
+            os.close(w)
+            return
+        self._wakeup = (r, w)
+
+    def _close_wakeup(self) -> None:
+        if self._wakeup is None:
+            return
+        r, w = self._wakeup
+        self._wakeup = None
+        try:
+            self.root.tk.deletefilehandler(r)
+        except Exception:
+            pass
+        os.close(r)
+        os.close(w)
+
+    def _on_wakeup(self, fd: int, mask: int) -> None:
+        try:
+            while os.read(fd, 512):
+                pass
+        except OSError:
+            pass
+        if self._dirty:
+            self._schedule(0)
+
+    def _needs_poll(self) -> bool:
+        """Whether redraws from other threads can only be noticed by polling."""
+        if self._wakeup is not None or self._threaded_tcl():
+            return False
+        return bool(getattr(self.updates, "running", False))
+
+    def _poll(self) -> None:
+        """Idle poll for redraws requested off the Tk thread (see _needs_poll)."""
+        if self._dirty:
+            self._tick()
+            return
+        self._after_id = None
+        self._after_due = float("inf")
+        if self._needs_poll():
+            self._schedule(self.IDLE_POLL_MS, self._poll)
+
     def _load_icons(self) -> None:
-        """Load app icons from resources/icons (best-effort).
+        """Find app icons in resources/icons (best-effort).
 
         Search both src/resources/icons and repo-root resources/icons so user-supplied
-        icons placed at project root are discovered.
+        icons placed at project root are discovered. Images are loaded from the
+        pre-resized icon cache the first time a tab draws them.
         """
+        paths: dict[str, Path] = {}
         try:
             candidates = [
                 Path(__file__).parent.parent.parent / "resources" / "icons",
@@ -141,68 +267,93 @@ class TkInterface:
             for base in candidates:
                 if base.exists() and base.is_dir():
                     for p in base.glob("*.png"):
-                        try:
-                            self.icons[p.stem] = tk.PhotoImage(file=str(p))
-                        except Exception:
-                            # ignore images that fail to load
-                            pass
+                        paths[p.stem] = p
         except Exception:
             # Don't fail UI for missing icons
             pass
+        self.icons = IconSet(paths, self.TAB_ICON_SIZE)
+
+    def draw_text(self, x: int, y: int, text: str, fg: str = "#99ff66", key: str | None = None) -> None:
+        self.items.text(key, x, y, anchor="nw", text=text, fill=fg, font=("Courier", 12))
 
-    def draw_text(self, x: int, y: int, text: str, fg: str = "#99ff66") -> None:
-        self.canvas.create_text(x, y, anchor="nw", text=text, fill=fg, font=("Courier", 12))
+    def draw_image(self, x: int, y: int, image: Any, anchor: str = "nw", key: str | None = None) -> None:
+        self.items.image(key, x, y, image=image, anchor=anchor)
 
     def _tick(self):
-        # Render once per tick with optional pulse feedback when app_manager indicates
-        theme = self.config.get("themes", {}).get(self.config.get("theme", "green"))
-        fg = theme.get("fg", "#99ff66") if theme else "#99ff66"
-        bg = theme.get("bg", "#001100") if theme else "#001100"
-        fb_color = theme.get("feedback_fg", "#ffff66") if theme else "#ffff66"
-        fb_duration = theme.get("feedback_duration", 0.5) if theme else 0.5
-
-        self.canvas.config(bg=bg)
-        self.canvas.delete("all")
+        # Render one frame with optional pulse feedback when app_manager indicates
+        self._after_id = None
+        self._after_due = float("inf")
+        self._dirty = False
+        palette = getattr(self.app_manager, "palette", None)
+        if not isinstance(palette, Palette):
+            palette = DEFAULT_PALETTE
+        bg = palette.bg
+
+        if bg != self._canvas_bg:
+            self.canvas.config(bg=bg)
+            self._canvas_bg = bg
+        created = self.items.created
+        self.items.begin()
         # Title (green) per user's request
-        self.draw_text(10, 10, "PiPIPBOY", fg="#99ff66")
+        self.draw_text(10, 10, "PiPIPBOY", fg="#99ff66", key="title")
 
         # Draw a tab bar background (top or bottom depending on config)
         try:
             w = self.canvas.winfo_width() or 800
             h = self.canvas.winfo_height() or 600
             if getattr(self, "tab_at_bottom", False):
-                self.canvas.create_rectangle(0, h - 36, w, h, fill=bg, outline=bg)
+                self.items.rect("tabbar", 0, h - 36, w, h, lower=True, fill=bg, outline=bg)
             else:
-                self.canvas.create_rectangle(0, 0, w, 36, fill=bg, outline=bg)
+                self.items.rect("tabbar", 0, 0, w, 36, lower=True, fill=bg, outline=bg)
         except Exception:
             pass
 
-        # If feedback is active, compute pulsing blend between fg and fb_color
-        if self.app_manager._is_feedback_active():
-            # phase in [0,1)
-            phase = self.app_manager.feedback_phase()
-            # create a smooth pulse (sinusoidal)
-            pulse = 0.5 * (1 + math.sin(2 * math.pi * phase))
-            current_fg = _blend_hex(fg, fb_color, pulse)
-            # override drawing of tab labels by temporarily storing original draw_text
-            self._tab_fg_override = current_fg
+        # If feedback is active, pulse the selected tab between fg and feedback colour
+        pulsed = self.app_manager._is_feedback_active()
+        if pulsed:
+            # phase in [0,1) indexes the palette's precomputed pulse table
+            self._tab_fg_override = palette.pulse_at(self.app_manager.feedback_phase())
             # render tabs and apps
             self.app_manager.render(self)
             self._tab_fg_override = None
         else:
             # delegate rendering normally
             self.app_manager.render(self)
-
-        # schedule next tick; use theme speed or default
-        self.root.after(int(fb_duration * 1000 / 10) or 100, self._tick)
+        # Drop items of elements not drawn this frame
+        self.items.end()
+        if self.items.created != created:
+            # New items stack on top; keep the icon bar (tk_icons_patch) above them
+            raise_icons = getattr(self, "_raise_icons", None)
+            if raise_icons is not None:
+                raise_icons()
+
+        # Only come back on our own while something animates or refreshes itself
+        delay = self._next_delay(pulsed)
+        if delay is not None:
+            self._schedule(delay)
+        elif self._needs_poll():
+            self._schedule(self.IDLE_POLL_MS, self._poll)
 
     def run(self) -> None:
         # Bind keys for switching
         self.root.bind("<Left>", lambda e: self.app_manager.handle_input("prev"))
         self.root.bind("<Right>", lambda e: self.app_manager.handle_input("next"))
         self.root.bind("<Return>", lambda e: self.app_manager.handle_input("select"))
+        self.root.bind("<F5>", lambda e: self.reload_config())
+        # Input, app invalidate() and background updates all end up here
+        self.app_manager.on_invalidate = self.request_redraw
+        # Sensor polling for SelfUpdatingApps, off the Tk thread
+        from .update_scheduler import UpdateScheduler
+
+        self._open_wakeup()
+        self.updates = UpdateScheduler(self.app_manager)
+        self.updates.start()
         self._tick()
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.updates.stop()
+            self._close_wakeup()
 
     # Touch / click handlers
     def _tab_index_at(self, x: int, y: int) -> int | None:
@@ -210,25 +361,15 @@ class TkInterface:
 
         Supports tabs at the top (y in 0..36) or bottom (y in canvas_height-36..canvas_height).
         """
-        try:
-            if getattr(self, "tab_at_bottom", False):
+        at_bottom = bool(getattr(self, "tab_at_bottom", False))
+        h = None
+        if at_bottom:
+            try:
                 h = self.canvas.winfo_height() or 480
-                if not (h - 36 <= y <= h):
-                    return None
-            else:
-                if not (0 <= y <= 36):
-                    return None
-        except Exception:
-            # If we can't query canvas size, fall back to top behavior
-            if not (0 <= y <= 36):
-                return None
-
-        idx = (x - 10) // 60
-        if idx < 0:
-            return None
-        if idx >= len(self.app_manager.apps):
-            return None
-        return int(idx)
+            except Exception:
+                # If we can't query canvas size, fall back to top behavior
+                at_bottom = False
+        return self.app_manager.tab_index_at(x, y, height=h, at_bottom=at_bottom)
 
     def _on_click(self, event) -> None:
         try:
@@ -0,0 +1,118 @@
+"""Retained Tk canvas items
+
+`RetainedCanvas` keeps one canvas item per logical element instead of deleting and
+recreating everything each frame. Elements are addressed by a key, which is also the
+item's tag; drawing an element whose key already exists updates the item in place
+(`coords` when it moved, `itemconfig` for the options that changed) and does nothing
+when it is unchanged. Frames are bracketed by `begin()` / `end()`; `end()` deletes the
+items of elements that weren't drawn in between.
+
+Callers that have no natural key (e.g. `AppManager` drawing into `TkInterface`) pass
+`key=None` and get a per-kind draw-order key ("text#0", "text#1", ...), like
+`SceneContext` does for the framebuffer.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+# Default tag shared by a layer's items, so they can be raised or lowered together
+TAG = "retained"
+
+
+class _Item:
+    __slots__ = ("id", "kind", "coords", "opts")
+
+    def __init__(self, id: Any, kind: str, coords: Tuple, opts: Dict[str, Any]):
+        self.id = id
+        self.kind = kind
+        self.coords = coords
+        self.opts = opts
+
+
+class RetainedCanvas:
+    def __init__(self, canvas: Any, tag: str = TAG):
+        self.canvas = canvas
+        # Group tag on every item of this layer
+        self.tag = tag
+        self._items: Dict[str, _Item] = {}
+        self._seen: set[str] = set()
+        self._auto: Dict[str, int] = {}
+        # Whether the last _draw created its item
+        self._fresh = False
+        # Canvas operations issued, for benchmarks and tests
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+
+    def begin(self) -> None:
+        self._seen = set()
+        self._auto = {}
+
+    def end(self) -> None:
+        for key in [k for k in self._items if k not in self._seen]:
+            self.remove(key)
+
+    def text(self, key: Optional[str], x: float, y: float, **opts: Any) -> Any:
+        return self._draw("text", key, (x, y), opts)
+
+    def rect(self, key: Optional[str], x0: float, y0: float, x1: float, y1: float, lower: bool = False, **opts: Any) -> Any:
+        """A rectangle; `lower` puts a newly created one below everything else."""
+        item = self._draw("rectangle", key, (x0, y0, x1, y1), opts)
+        if lower and self._fresh:
+            try:
+                self.canvas.tag_lower(item)
+            except Exception:
+                pass
+        return item
+
+    def image(self, key: Optional[str], x: float, y: float, **opts: Any) -> Any:
+        return self._draw("image", key, (x, y), opts)
+
+    def remove(self, key: str) -> None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            try:
+                self.canvas.delete(item.id)
+            except Exception:
+                pass
+            self.deleted += 1
+
+    def clear(self) -> None:
+        for key in list(self._items):
+            self.remove(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _draw(self, kind: str, key: Optional[str], coords: Tuple, opts: Dict[str, Any]) -> Any:
+        if key is None:
+            n = self._auto.get(kind, 0)
+            self._auto[kind] = n + 1
+            key = f"{kind}#{n}"
+        self._seen.add(key)
+        self._fresh = False
+        item = self._items.get(key)
+        if item is not None and item.kind != kind:
+            self.remove(key)
+            item = None
+        if item is None:
+            create = getattr(self.canvas, f"create_{kind}")
+            item_id = create(*coords, tags=(key, self.tag), **opts)
+            self._items[key] = _Item(item_id, kind, coords, opts)
+            self.created += 1
+            self._fresh = True
+            return item_id
+        if coords != item.coords:
+            self.canvas.coords(item.id, *coords)
+            item.coords = coords
+            self.updated += 1
+        if opts != item.opts:
+            changed = {k: v for k, v in opts.items() if item.opts.get(k, object()) != v}
+            if changed:
+                self.canvas.itemconfig(item.id, **changed)
+            item.opts = opts
+            self.updated += 1
+        return item.id
@@ -0,0 +1,128 @@
+"""Background data updates for SelfUpdatingApp
+
+Apps that poll slow sources (I2C sensors, the RTC, GPS) implement `needs_update()` /
+`update()`. `UpdateScheduler` calls `update()` on a worker thread, every
+`update_interval` seconds per app, so sensor I/O never runs inside a frame. Only the
+visible app is updated unless it sets `update_when_hidden`; an app becoming visible
+is updated straight away if it is due.
+
+`update()` runs concurrently with `render()`, so apps build their new state aside and
+publish it with a single attribute assignment; render then sees either the old or
+the new state, never a half-written one. After an update of the visible app,
+`app.invalidate()` asks the render loop for a frame.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateScheduler:
+    def __init__(self, app_manager: Any, default_interval: float = 1.0):
+        self.app_manager = app_manager
+        self.default_interval = default_interval
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        # id(app) -> monotonic time of its last update
+        self._last: dict[int, float] = {}
+        self.updates = 0
+        self.errors: dict[str, int] = {}
+
+    def interval_for(self, app: Any) -> float:
+        return getattr(app, "update_interval", None) or self.default_interval
+
+    def _visible(self) -> Any:
+        # Not `app_manager.current`: that builds a placeholder app, which is the render
+        # thread's job
+        apps = self.app_manager.apps
+        index = getattr(self.app_manager, "index", 0)
+        return apps[index] if 0 <= index < len(apps) else None
+
+    def _eligible(self, app: Any, current: Any) -> bool:
+        # Registry placeholders not built yet have nothing to update
+        if getattr(app, "lazy", False) or not hasattr(app, "update"):
+            return False
+        if app is not current and not getattr(app, "update_when_hidden", False):
+            return False
+        try:
+            return bool(app.needs_update()) if hasattr(app, "needs_update") else False
+        except Exception:
+            return False
+
+    def _due(self, now: float) -> tuple[list[Any], Optional[float]]:
+        current = self._visible()
+        due, next_due = [], None
+        for app in self.app_manager.apps:
+            if not self._eligible(app, current):
+                continue
+            when = self._last.get(id(app), float("-inf")) + self.interval_for(app)
+            if when <= now:
+                due.append(app)
+                when = now + self.interval_for(app)
+            next_due = when if next_due is None else min(next_due, when)
+        return due, next_due
+
+    def _update(self, app: Any) -> None:
+        self._last[id(app)] = time.monotonic()
+        try:
+            app.update()
+        except Exception as e:
+            name = getattr(app, "name", "?")
+            self.errors[name] = self.errors.get(name, 0) + 1
+            logger.debug("Update of %s failed: %s", name, e)
+            return
+        self.updates += 1
+        if app is self._visible():
+            invalidate = getattr(app, "invalidate", None)
+            if invalidate is not None:
+                invalidate()
+
+    def run_pending(self) -> list[str]:
+        """Run the updates that are due now, on the calling thread; returns app names."""
+        due, _ = self._due(time.monotonic())
+        for app in due:
+            self._update(app)
+        return [getattr(app, "name", "?") for app in due]
+
+    def wake(self) -> None:
+        """Re-check what is due, e.g. after the visible app changed."""
+        with self._cond:
+            self._cond.notify_all()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="pipboy-updates", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                due, next_due = self._due(time.monotonic())
+                if not due:
+                    timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+                    self._cond.wait(timeout)
+                    continue
+            # Update outside the lock so wake()/stop() never wait on sensor I/O
+            for app in due:
+                self._update(app)
@@ -115,10 +115,17 @@ def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser()
     parser.add_argument("--dev", action="store_true", help="Run in desktop dev mode (Tk)")
     parser.add_argument("--profile", type=str, default=None, help="Hardware profile name (e.g., 'freenove')")
+    parser.add_argument("--tune-spi", action="store_true", help="Measure the fastest stable SPI settings and save them to hardware.tuned.yaml")
     args = parser.parse_args(argv)
 
     ensure_config()
 
+    if args.tune_spi:
+        from .driver import spi_tuning
+
+        spi_tuning.main(["--config", str(CONFIG_PATH)])
+        return
+
     dev_mode = args.dev or (not is_raspberry_pi())
 
     # Initialize common sensors (I2C-backed and serial GPS)
@@ -162,61 +169,43 @@ def main(argv: list[str] | None = None):
         # Choose pin factory before importing hardware interfaces
         # Import real hardware interfaces and wire them to an AppManager
         try:
-            from .interface.ili9486_display import ILI9486Display
             from .interface.gpio_input import GPIOInput
             from .interface.app_manager import AppManager
             from .interface.hardware_interface import HardwareInterface
-            from .app.file_manager import FileManagerApp
-            from .app.map import MapApp
-            from .app.environment import EnvironmentApp
-            from .app.clock import ClockApp
-            from .app.radio import RadioApp
-            from .app.update import UpdateApp
-            from .app.debug import DebugApp
-            # Extended device apps
-            from .app.fan import FanApp
-            from .app.camera import CameraApp
-            from .app.lights import LightsApp
-            from .app.display import DisplayApp
+            from .interface.palette import Palette
+            from .app.registry import HARDWARE_APPS, app_names, create_apps
+
+            try:
+                config = yaml.safe_load(CONFIG_PATH.read_text()) or {}
+            except Exception:
+                config = {}
+            # Apps are imported and built when their tab is first selected; the
+            # context is read at that point, so the display can be added below
+            app_context = {"sensors": sensors}
+            app_manager = AppManager(
+                create_apps(app_names(config, HARDWARE_APPS), app_context),
+                palette=Palette.from_config(config),
+            )
 
             # Support hardware profiles (e.g., freenove) for pre-wired setups
             profile = args.profile
             if profile == "freenove":
                 from .driver.freenove_case import create_hardware
 
-                app_manager = AppManager([
-                    FileManagerApp(),
-                    FanApp(),
-                    CameraApp(),
-                    LightsApp(),
-                    DisplayApp(),
-                    MapApp(sensors=sensors),
-                    EnvironmentApp(sensors=sensors),
-                    ClockApp(sensors=sensors),
-                    RadioApp(),
-                    UpdateApp(),
-                    DebugApp(),
-                ])
                 hw = create_hardware(app_manager)
+                # Rotation requests from the Display app go to the panel
+                app_context["display"] = hw.display
                 # hw.peripherals available to apps via app_manager.peripherals
                 hw.run()
             else:
-                display = ILI9486Display()
+                from .interface.display_factory import create_display
+                from .interface.hardware_profile_pi5 import load_profile
+
+                display_conf = config.get("display", {}) if isinstance(config, dict) else {}
+                # display.type picks the backend (ili9486 SPI or a kernel fbdev)
+                display = create_display(display_conf, profile=load_profile(str(CONFIG_PATH)))
+                app_context["display"] = display
                 inputs = GPIOInput()
-                apps = [
-                    FileManagerApp(),
-                    FanApp(),
-                    CameraApp(),
-                    LightsApp(),
-                    DisplayApp(),
-                    MapApp(sensors=sensors),
-                    EnvironmentApp(sensors=sensors),
-                    ClockApp(sensors=sensors),
-                    RadioApp(),
-                    UpdateApp(),
-                    DebugApp(),
-                ]
-                app_manager = AppManager(apps)
                 hw = HardwareInterface(display, inputs, app_manager)
                 hw.run()
         except Exception as e:
@@ -0,0 +1,60 @@
+import sys
+
+from pipboy.app.registry import DEV_APPS, HARDWARE_APPS, AppSpec, LazyApp, app_names, create_apps
+from pipboy.interface.app_manager import AppManager
+
+
+def _drop(module):
+    sys.modules.pop(module, None)
+
+
+def test_apps_are_imported_on_first_selection():
+    for mod in ("pipboy.app.radio", "pipboy.app.debug"):
+        _drop(mod)
+    am = AppManager(create_apps(["FileManager", "Radio", "Debug"]))
+    assert [a.name for a in am.apps] == ["FileManager", "Radio", "Debug"]
+    assert all(isinstance(a, LazyApp) for a in am.apps)
+    assert "pipboy.app.radio" not in sys.modules
+
+    assert am.current.name == "FileManager"
+    assert not isinstance(am.apps[0], LazyApp)
+    assert "pipboy.app.radio" not in sys.modules
+
+    am.next()
+    radio = am.current
+    assert "pipboy.app.radio" in sys.modules
+    assert type(radio).__name__ == "RadioApp"
+    assert am.current is radio
+    assert isinstance(am.apps[2], LazyApp)
+    assert "pipboy.app.debug" not in sys.modules
+
+
+def test_context_is_read_when_the_app_is_built():
+    context = {"sensors": {"rtc": None}}
+    am = AppManager(create_apps(["FileManager", "Display", "Environment"], context))
+    context["display"] = display = object()
+    am.select(1)
+    assert am.current.controller is display
+    am.select(2)
+    assert am.current.sensors == {"rtc": None}
+
+
+def test_failed_load_shows_error_once():
+    drawn = []
+
+    class Ctx:
+        def draw_text(self, x, y, text, *a, **k):
+            drawn.append(text)
+
+    am = AppManager([LazyApp(AppSpec("Broken", ".no_such_module:App"), {})])
+    am.render(Ctx())
+    assert isinstance(am.current, LazyApp)
+    assert am.health[0].errors == 1
+    assert any("Broken unavailable" in t for t in drawn)
+
+
+def test_config_app_list_and_unknown_names():
+    assert app_names({}, DEV_APPS) == list(DEV_APPS)
+    assert app_names({"apps": ["Clock", "Nope"]}, HARDWARE_APPS) == ["Clock", "Nope"]
+    apps = create_apps(app_names({"apps": ["Clock", "Nope"]}, HARDWARE_APPS), lazy=False)
+    assert [type(a).__name__ for a in apps] == ["ClockApp"]
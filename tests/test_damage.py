@@ -0,0 +1,58 @@
+from pipboy.interface.damage import DamageTracker
+
+
+class FakeSPI:
+    def __init__(self):
+        self.available = True
+        self.sent = []
+
+    def xfer2(self, b: bytes):
+        self.sent.append(bytes(b))
+        return b
+
+
+class TickingApp:
+    name = "Clock"
+
+    def __init__(self):
+        self.t = 0
+
+    def render(self, ctx):
+        ctx.draw_text(10, 80, f"12:00:{self.t:02d}")
+
+
+def test_tracker_merges_close_rects_and_bounds_count():
+    t = DamageTracker(480, 320, max_rects=2)
+    t.add(0, 0, 10, 10)
+    t.add(10, 0, 10, 10)  # adjacent: merged for free
+    t.add(200, 200, 5, 5)
+    t.add(400, 10, 5, 5)
+    rects = t.coalesce()
+    assert len(rects) <= 2
+    assert (0, 0, 20, 10) in rects or any(r[0] == 0 and r[2] >= 20 for r in rects)
+
+
+def test_tracker_clips_and_ignores_contained():
+    t = DamageTracker(100, 100)
+    t.add(-10, -10, 20, 20)
+    t.add(2, 2, 3, 3)
+    t.add(200, 200, 5, 5)
+    assert t.rects() == [(0, 0, 10, 10)]
+
+
+def test_clock_tick_is_a_partial_flush():
+    from pipboy.interface.app_manager import AppManager
+    from pipboy.interface.hardware_interface import HardwareInterface
+    from pipboy.interface.ili9486_display import ILI9486Display
+
+    spi = FakeSPI()
+    disp = ILI9486Display(spi=spi)
+    app = TickingApp()
+    hw = HardwareInterface(disp, None, AppManager([app]))
+    hw.initialize()
+    hw.run_once()
+    assert disp.last_flush_bytes == 480 * 320 * 2
+
+    app.t += 1
+    hw.run_once()
+    assert 0 < disp.last_flush_bytes < 16 * 1024
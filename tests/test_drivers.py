@@ -32,3 +32,31 @@ def test_sensors_read(monkeypatch):
 
     g = GPS()
     assert not g.read_fix().valid
+
+
+def test_spi_writebytes2_chunks_without_copy(monkeypatch):
+    import types
+
+    class FakeSpiDev:
+        def __init__(self):
+            self.writes = []
+
+        def open(self, bus, device):
+            pass
+
+        def writebytes2(self, buf):
+            self.writes.append(buf)
+
+    fake = types.SimpleNamespace(SpiDev=FakeSpiDev)
+    monkeypatch.setitem(sys.modules, "spidev", fake)
+    from pipboy.driver.spi import SPI
+
+    s = SPI()
+    assert s.available
+    s.bufsiz = 1000
+    data = bytearray(2500)
+    s.writebytes2(data)
+    writes = s._spidev.writes
+    assert [len(w) for w in writes] == [1000, 1000, 500]
+    # Slices are views onto the caller's buffer, not copies
+    assert all(isinstance(w, memoryview) and w.obj is data for w in writes)
@@ -0,0 +1,74 @@
+import pytest
+
+from pipboy.interface.display_factory import create_display
+from pipboy.interface.fbdev_display import FBDevConfig, FBDevDisplay
+
+
+def _fake_fb(tmp_path, width, height, stride):
+    path = tmp_path / "fb1"
+    path.write_bytes(b"\xaa" * (stride * height))
+    return path
+
+
+def _px(raw, stride, x, y):
+    off = y * stride + x * 2
+    return int.from_bytes(raw[off : off + 2], "little")
+
+
+def test_flush_copies_dirty_spans_into_mapping(tmp_path):
+    # Device lines padded past width * 2, as some drivers do
+    path = _fake_fb(tmp_path, 32, 16, 80)
+    d = FBDevDisplay(FBDevConfig(device=str(path), width=32, height=16, stride=80, background="#000000"))
+    d.initialize()
+    d.update()
+    raw = path.read_bytes()
+    assert _px(raw, 80, 31, 15) == 0
+    # Padding is never written
+    assert raw[64:80] == b"\xaa" * 16
+    d.fill_rect(4, 4, 3, 2, 0xF800)
+    d.update()
+    raw = path.read_bytes()
+    assert _px(raw, 80, 4, 4) == 0xF800 and _px(raw, 80, 6, 5) == 0xF800
+    assert _px(raw, 80, 7, 4) == 0
+    assert d.last_flush_bytes == 3 * 2 * 2
+    d.close()
+
+
+def test_identical_frame_touches_nothing(tmp_path):
+    path = _fake_fb(tmp_path, 64, 32, 128)
+    d = FBDevDisplay(FBDevConfig(device=str(path), width=64, height=32))
+    d.initialize()
+    d.draw_text(0, 0, "HELLO")
+    d.update()
+    d.clear()
+    d.draw_text(0, 0, "HELLO")
+    d.update()
+    assert d.last_flush_rects == [] and d.last_flush_bytes == 0
+    d.close()
+
+
+def test_missing_device_degrades_gracefully(tmp_path):
+    d = FBDevDisplay(FBDevConfig(device=str(tmp_path / "nope"), width=8, height=8))
+    d.initialize()
+    d.draw_text(0, 0, "x")
+    d.update()
+    assert d.last_flush_bytes == 0
+
+
+def test_factory_selects_backend(tmp_path):
+    path = _fake_fb(tmp_path, 16, 8, 32)
+    d = create_display({"type": "fbdev", "device": str(path), "width": 16, "height": 8, "rotation": 0})
+    assert isinstance(d, FBDevDisplay) and d.byteorder == "little"
+    from pipboy.interface.ili9486_display import ILI9486Display
+
+    class Profile:
+        spi_bus = 1
+        spi_device = 0
+        spi_speed_hz = 24_000_000
+        spi_chunk_size = 8192
+
+    d = create_display({"type": "ili9486", "rotation": 90, "dc_pin": 24}, profile=Profile())
+    assert isinstance(d, ILI9486Display)
+    assert (d.config.spi_bus, d.config.spi_speed_hz, d.width) == (1, 24_000_000, 320)
+    with pytest.raises(ValueError):
+        create_display({"type": "vga"})
@@ -0,0 +1,119 @@
+import threading
+
+
+class GatedSPI:
+    """Fake bulk SPI whose pixel writes block until released."""
+
+    def __init__(self):
+        self.available = True
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+        self.payloads = []
+
+    def xfer2(self, b):
+        return b
+
+    def writebytes2(self, buf):
+        if len(buf) > 8:
+            self.started.set()
+            self.gate.wait(5)
+            self.payloads.append(bytes(buf))
+
+
+def _make_display(spi):
+    from pipboy.interface.ili9486_display import ILI9486Config, ILI9486Display
+
+    d = ILI9486Display(ILI9486Config(width=32, height=16, async_flush=True), spi=spi)
+    d.initialize()
+    return d
+
+
+def test_update_returns_while_transfer_runs_and_drops_stale_frames():
+    spi = GatedSPI()
+    d = _make_display(spi)
+    try:
+        spi.gate.clear()
+        d.update()  # full frame goes to the worker and blocks there
+        assert spi.started.wait(5)
+
+        d.fill_rect(0, 0, 4, 4, 0xF800)
+        d.update()  # worker busy: dropped, damage kept
+        assert d.frames_dropped == 1
+        assert d.damage
+
+        # Drawing into the back buffer doesn't disturb the frame in flight
+        d.fill_rect(0, 0, 32, 16, 0x07E0)
+        spi.gate.set()
+        assert d._worker.wait_idle(5)
+        assert spi.payloads[0][:2] != b"\x07\xe0"
+
+        d.update()
+        assert d._worker.wait_idle(5)
+        assert not d.damage
+        assert spi.payloads[-1][:2] == b"\x07\xe0"
+    finally:
+        d.close()
+
+
+def test_front_buffer_only_receives_presented_regions():
+    spi = GatedSPI()
+    d = _make_display(spi)
+    try:
+        d.update()
+        assert d._worker.wait_idle(5)
+        d.fill_rect(2, 2, 3, 3, 0xFFFF)
+        d.update()
+        assert d._worker.wait_idle(5)
+        assert d.last_flush_rects == [(2, 2, 3, 3)]
+        assert bytes(d._front) == bytes(d.buffer)
+        assert len(spi.payloads[-1]) == 3 * 3 * 2
+    finally:
+        d.close()
+
+
+def test_flush_stats_count_completed_transfers_only():
+    from pipboy.interface.app_manager import AppManager
+    from pipboy.interface.hardware_interface import HardwareInterface
+
+    class Blink:
+        name = "Blink"
+        on = False
+
+        def render(self, ctx):
+            ctx.fill_rect(0, 0, 4, 4, 0xFFFF if self.on else 0)
+
+    spi = GatedSPI()
+    d = _make_display(spi)
+    app = Blink()
+    hw = HardwareInterface(d, None, AppManager([app]))
+    try:
+        def flushes():
+            series = hw.stats.summary()["series"]
+            return series["flush"]["count"] if "flush" in series else 0
+
+        hw.run_once()
+        assert d._worker.wait_idle(5)
+        assert flushes() == 1
+        # Unchanged frames transfer nothing and add no samples
+        for _ in range(3):
+            hw.run_once()
+        assert d._worker.wait_idle(5)
+        assert flushes() == 1 and d.last_flush_seconds == 0.0
+
+        # A frame dropped while the worker is busy is counted when a transfer finishes
+        spi.gate.clear()
+        spi.started.clear()
+        app.on = True
+        hw.run_once()
+        assert spi.started.wait(5)
+        app.on = False
+        hw.run_once()
+        assert d.frames_dropped == 1
+        assert flushes() == 1
+        spi.gate.set()
+        assert d._worker.wait_idle(5)
+        assert flushes() == 2
+        assert hw.stats.summary()["series"]["flush_bytes"]["max"] > 0
+    finally:
+        d.close()
@@ -0,0 +1,84 @@
+from pipboy.interface.frame_diff import TileDiffer
+from pipboy.interface.ili9486_display import ILI9486Config, ILI9486Display
+
+
+class FakeSPI:
+    def __init__(self):
+        self.available = True
+        self.sent = []
+
+    def xfer2(self, b):
+        self.sent.append(bytes(b))
+        return b
+
+
+def _set(buf, width, x, y, word=0xFFFF):
+    off = (y * width + x) * 2
+    buf[off : off + 2] = word.to_bytes(2, "big")
+
+
+def test_first_diff_is_everything_then_only_changes():
+    d = TileDiffer(64, 48)
+    buf = bytearray(64 * 48 * 2)
+    assert d.diff(buf) == [(0, 0, 64, 48)]
+    d.commit(buf, [(0, 0, 64, 48)])
+    assert d.diff(buf) == []
+    _set(buf, 64, 20, 5)
+    assert d.diff(buf) == [(16, 0, 32, 16)]
+    assert d.tiles_changed == 1
+
+
+def test_adjacent_tiles_merge_into_spans():
+    d = TileDiffer(64, 48)
+    buf = bytearray(64 * 48 * 2)
+    d.commit(buf, [(0, 0, 64, 48)])
+    for x, y in ((1, 1), (17, 1), (1, 17), (17, 17), (60, 40)):
+        _set(buf, 64, x, y)
+    assert sorted(d.diff(buf)) == [(0, 0, 32, 32), (48, 32, 64, 48)]
+
+
+def test_hints_limit_comparison_and_clip_output():
+    d = TileDiffer(64, 48)
+    buf = bytearray(64 * 48 * 2)
+    d.commit(buf, [(0, 0, 64, 48)])
+    _set(buf, 64, 3, 3)
+    _set(buf, 64, 40, 40)
+    assert d.diff(buf, [(2, 2, 5, 5)]) == [(2, 2, 5, 5)]
+    assert d.tiles_compared == 1
+    d.invalidate(50, 0, 4, 4)
+    assert (50, 0, 54, 4) in d.diff(buf, [])
+
+
+def test_identical_redraw_sends_nothing():
+    spi = FakeSPI()
+    disp = ILI9486Display(spi=spi)
+    disp.initialize()
+    disp.update()
+
+    def frame(label):
+        spi.sent.clear()
+        disp.clear()
+        disp.draw_text(10, 10, label, fg="#99ff66")
+        disp.draw_text(10, 40, "static line", fg="#99ff66")
+        disp.update()
+
+    frame("STAT")
+    assert disp.last_flush_bytes > 0
+    frame("STAT")
+    assert disp.last_flush_rects == [] and spi.sent == []
+    frame("DATA")
+    assert disp.last_flush_rects and all(r[1] < 40 for r in disp.last_flush_rects)
+    assert disp.last_flush_bytes <= 4 * 6 * 7 * 2
+
+
+def test_diff_can_be_disabled():
+    disp = ILI9486Display(ILI9486Config(diff_tile=0), spi=FakeSPI())
+    disp.initialize()
+    disp.update()
+    disp.clear()
+    disp.draw_text(0, 0, "A")
+    disp.update()
+    disp.clear()
+    disp.draw_text(0, 0, "A")
+    disp.update()
+    assert disp.differ is None and disp.last_flush_bytes == 6 * 7 * 2
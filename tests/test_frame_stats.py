@@ -0,0 +1,73 @@
+import io
+import os
+import signal
+import time
+
+import pytest
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.frame_stats import FrameStats, RingStat
+from pipboy.interface.hardware_interface import HardwareInterface
+from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay
+
+
+def test_ring_keeps_last_samples_and_percentiles():
+    r = RingStat(size=100)
+    for v in range(1, 251):
+        r.add(float(v))
+    assert r.count == 250
+    assert r.values() == [float(v) for v in range(151, 251)]
+    assert r.percentiles(50, 95, 99) == [200.0, 245.0, 249.0]
+    assert r.summary()["max"] == 250.0
+    assert RingStat().percentiles(50) == [0.0]
+
+
+def test_run_once_records_phases_and_errors():
+    class Slow:
+        name = "Slow"
+
+        def render(self, ctx):
+            time.sleep(0.005)
+            ctx.draw_text(0, 60, "x")
+
+    class Broken:
+        name = "Broken"
+
+        def render(self, ctx):
+            raise RuntimeError("boom")
+
+    d = OffscreenDisplay(OffscreenConfig(width=100, height=80))
+    am = AppManager([Slow(), Broken()])
+    hw = HardwareInterface(d, None, am)
+    for _ in range(3):
+        hw.run_once()
+    am.next()
+    hw.run_once()
+    s = hw.stats.summary()
+    assert s["frames"] == 4
+    for name in ("clear", "render", "update", "frame", "app:Slow", "app:Broken"):
+        assert name in s["series"]
+    assert s["series"]["app:Slow"]["count"] == 3
+    assert s["series"]["app:Slow"]["p50"] >= 0.005
+    assert s["series"]["render"]["p99"] >= s["series"]["app:Slow"]["p50"]
+    assert s["errors"] == {"render": 1}
+    assert "RuntimeError: boom" in hw.stats.format()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="no SIGUSR1")
+def test_sigusr1_dumps(monkeypatch):
+    stats = FrameStats()
+    stats.record("frame", 0.002)
+    stats.record("flush_bytes", 4096)
+    out = io.StringIO()
+    monkeypatch.setattr(stats, "dump", lambda out_=None: FrameStats.dump(stats, out))
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert stats.install_signal_handler()
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.01)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+    text = out.getvalue()
+    assert "frame (ms)" in text and "2.00" in text
+    assert "flush_bytes (B)" in text and "4096" in text
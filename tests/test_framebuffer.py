@@ -0,0 +1,40 @@
+from pipboy.interface.framebuffer import Framebuffer
+from pipboy.interface.rgb565 import to_rgb565, rgb565_to_rgb
+
+
+def _px(fb, x, y):
+    off = y * fb.stride + x * 2
+    return int.from_bytes(fb.buffer[off : off + 2], fb.byteorder)
+
+
+def test_color_conversion():
+    assert to_rgb565("#ff0000") == 0xF800
+    assert to_rgb565("#0f0") == 0x07E0
+    assert to_rgb565((0, 0, 255)) == 0x001F
+    assert to_rgb565(0x1234) == 0x1234
+    assert rgb565_to_rgb(0xFFFF) == (255, 255, 255)
+
+
+def test_clear_and_fill_rect_clip():
+    fb = Framebuffer(16, 8, background="#ffffff")
+    fb.clear()
+    assert _px(fb, 15, 7) == 0xFFFF
+    fb.fill_rect(-2, 6, 4, 10, 0x07E0)
+    assert _px(fb, 0, 6) == 0x07E0 and _px(fb, 1, 7) == 0x07E0
+    assert _px(fb, 2, 6) == 0xFFFF and _px(fb, 0, 5) == 0xFFFF
+
+
+def test_little_endian_buffer():
+    fb = Framebuffer(4, 4, byteorder="little")
+    fb.draw_pixel(1, 1, 0xF800)
+    assert fb.buffer[4 * 2 + 2 : 4 * 2 + 4] == b"\x00\xf8"
+
+
+def test_draw_text_and_blit():
+    fb = Framebuffer(32, 16)
+    fb.draw_text(0, 0, "I", fg=0xFFFF)
+    # 'I' has a full vertical stroke in column 2
+    assert all(_px(fb, 2, y) == 0xFFFF for y in range(7))
+    assert _px(fb, 0, 3) == 0
+    fb.blit_rgb565(30, 14, 2, 2, b"\x12\x34" * 4)
+    assert _px(fb, 31, 15) == 0x1234
@@ -0,0 +1,62 @@
+import pytest
+
+from pipboy.interface.framebuffer import Framebuffer
+from pipboy.interface.glyph_atlas import GlyphAtlas, find_font
+
+
+def _px(fb, x, y):
+    off = y * fb.stride + x * 2
+    return int.from_bytes(fb.buffer[off : off + 2], fb.byteorder)
+
+
+def test_strip_is_rasterized_once_per_key():
+    atlas = GlyphAtlas()
+    a = atlas.strip("builtin", 8, "#ffffff", 0)
+    assert atlas.strip("builtin", 8, 0xFFFF, "#000") is a
+    assert atlas.hits == 1 and atlas.misses == 1
+    assert atlas.strip("builtin", 8, "#ff0000", 0) is not a
+    assert a.measure("AB") == (12, 7)
+
+
+def test_lru_eviction_by_count_and_bytes():
+    atlas = GlyphAtlas(max_strips=2)
+    first = atlas.strip("builtin", 8, 1, 0)
+    atlas.strip("builtin", 8, 2, 0)
+    atlas.strip("builtin", 8, 1, 0)  # refresh
+    atlas.strip("builtin", 8, 3, 0)
+    assert len(atlas) == 2
+    assert atlas.strip("builtin", 8, 1, 0) is first
+    small = GlyphAtlas(max_bytes=first.nbytes)
+    small.strip("builtin", 8, 1, 0)
+    small.strip("builtin", 8, 2, 0)
+    assert len(small) == 1
+
+
+def test_framebuffer_text_matches_font_and_paints_cell_background():
+    fb = Framebuffer(32, 16, background=0x0001)
+    fb.draw_text(0, 0, "I", fg=0xFFFF)
+    # 'I' has a full vertical stroke in column 2
+    assert all(_px(fb, 2, y) == 0xFFFF for y in range(7))
+    assert _px(fb, 0, 3) == 0x0001
+    assert fb.damage.rects() == [(0, 0, 6, 7)]
+
+
+def test_scaled_and_clipped_text():
+    fb = Framebuffer(20, 10)
+    fb.draw_text(-6, 2, "AI", fg=0xFFFF, scale=2)
+    # 'A' is half clipped; 'I' starts at x=6 after a 12px advance, stroke at column 2*2
+    assert _px(fb, 6 + 4, 2) == 0xFFFF and _px(fb, 6 + 5, 9) == 0xFFFF
+    fb.draw_text(15, 8, "W", fg=0xFFFF)
+    assert fb.damage.rects()[-1][2:] == (20, 10)
+
+
+def test_truetype_font_from_path():
+    pytest.importorskip("PIL.ImageFont")
+    path = find_font("DejaVuSansMono")
+    if path is None:
+        pytest.skip("DejaVu fonts not installed")
+    fb = Framebuffer(64, 32)
+    fb.draw_text(0, 0, "H", fg="#ffffff", font=str(path), size=16)
+    strip = fb.glyphs.strip(str(path), 16, "#ffffff", 0)
+    assert strip.height >= 16
+    assert any(_px(fb, x, y) == 0xFFFF for x in range(8) for y in range(16))
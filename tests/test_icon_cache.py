@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from pipboy.interface.icon_cache import IconCache, IconSet, snap_size
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _icon(path, color=(255, 0, 0, 255)):
+    Image.new("RGBA", (64, 64), color).save(path)
+    return path
+
+
+def test_snap_size():
+    assert snap_size(30) == 24
+    assert snap_size(48) == 48
+    assert snap_size(200) == 48
+    assert snap_size(5) == 12
+
+
+def test_build_once_and_rebuild_on_mtime(tmp_path):
+    src = _icon(tmp_path / "camera.png")
+    cache = IconCache(tmp_path / "cache", sizes=(12, 24))
+    built = cache.build(src)
+    assert set(built) == {12, 24} and cache.resized == 2
+    with Image.open(built[24]) as img:
+        assert img.size == (24, 24)
+
+    assert cache.build(src) == built and cache.resized == 2
+    assert cache.resolve(src, 12) == built[12]
+
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    rebuilt = cache.build(src)
+    assert cache.resized == 4 and rebuilt[12] != built[12]
+    assert not built[12].exists()
+    assert sorted(p.name for p in (tmp_path / "cache" / "12").iterdir()) == [rebuilt[12].name]
+
+
+def test_hand_made_sizes_win(tmp_path):
+    src = _icon(tmp_path / "fan.png")
+    (tmp_path / "24").mkdir()
+    pre = _icon(tmp_path / "24" / "fan.png", (0, 255, 0, 255))
+    cache = IconCache(tmp_path / "cache")
+    assert cache.resolve(src, 24) == pre
+    assert cache.resized == 0
+
+
+def test_icon_set_is_lazy(tmp_path):
+    cache = IconCache(tmp_path / "cache")
+    icons = IconSet({"camera": _icon(tmp_path / "camera.png")}, 18, cache)
+    assert "camera" in icons and "fan" not in icons
+    assert cache.resized == 0
@@ -41,3 +41,54 @@ def test_set_window_and_fill_rect():
     assert b"\x2C" in data
     # Pixel bytes include 0xF8 (first byte of 0xF800)
     assert b"\xF8" in data
+
+
+def test_write_pixels_accepts_buffers():
+    from array import array
+
+    from pipboy.interface.ili9486_driver import ILI9486
+
+    expected = b"\xf8\x00\x07\xe0\x00\x1f"
+    inputs = [
+        [0xF800, 0x07E0, 0x001F],
+        array("H", [0xF800, 0x07E0, 0x001F]),
+        memoryview(array("H", [0xF800, 0x07E0, 0x001F])),
+        array("H", [0xF800, 0x07E0, 0x001F]).tobytes(),
+    ]
+    try:
+        import numpy as np
+
+        inputs.append(np.array([0xF800, 0x07E0, 0x001F], dtype=np.uint16))
+        inputs.append(np.array([0xF800, 0x07E0, 0x001F], dtype=">u2"))
+    except ImportError:
+        pass
+    for pixels in inputs:
+        spi = FakeSPI()
+        d = ILI9486(spi)
+        d.write_pixels_rgb565(pixels, 3, 1)
+        assert spi.sent[0] == b"\x2C"
+        assert _concat_sent(spi)[1:] == expected
+
+
+class FakeBulkSPI(FakeSPI):
+    def __init__(self):
+        super().__init__()
+        self.bulk = []
+
+    def writebytes2(self, buf):
+        self.bulk.append(buf)
+
+
+def test_display_flush_uses_zero_copy_bulk_writes():
+    from pipboy.interface.ili9486_display import ILI9486Display
+
+    spi = FakeBulkSPI()
+    d = ILI9486Display(spi=spi)
+    d.initialize()
+    spi.bulk.clear()
+    d.update()
+    # Full-frame flush goes out as a single view onto the framebuffer
+    frames = [b for b in spi.bulk if len(b) == 480 * 320 * 2]
+    assert len(frames) == 1
+    assert isinstance(frames[0], memoryview) and frames[0].obj is d.buffer
+    assert not spi.sent
@@ -14,8 +14,26 @@ def test_ili_flushes_to_spi():
     spi = FakeSPI()
     d = ILI9486Display(spi=spi)
     d.initialize()
-    d.draw_text(0, 0, "HELLO SPI")
+    spi.sent.clear()
+    d.draw_text(0, 0, "HELLO SPI", fg="#ffffff")
     d.update()
-    # SPI should have been called with bytes containing the text
-    all_bytes = b"".join(spi.sent)
-    assert b"HELLO SPI" in all_bytes
+    # Frame is streamed as window + RAMWR + raw RGB565 pixels
+    assert b"\x2C" in spi.sent
+    pixels = b"".join(spi.sent[spi.sent.index(b"\x2C") + 1 :])
+    assert len(pixels) == 480 * 320 * 2
+    assert b"\xff\xff" in pixels
+
+
+def test_ili_framebuffer_is_preallocated():
+    from pipboy.interface.ili9486_display import ILI9486Display
+
+    d = ILI9486Display()
+    buf = d.buffer
+    d.clear()
+    d.draw_text(10, 10, "Clock", fg="#99ff66")
+    d.fill_rect(0, 0, 4, 4, 0xF800)
+    d.update()
+    assert d.buffer is buf
+    assert len(buf) == 480 * 320 * 2
+    # Top-left pixel red, big-endian
+    assert buf[0:2] == b"\xf8\x00"
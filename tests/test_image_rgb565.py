@@ -0,0 +1,82 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+
+class FakeSPI:
+    def __init__(self):
+        self.available = True
+        self.sent = []
+
+    def xfer2(self, b):
+        self.sent.append(bytes(b))
+        return b
+
+
+def _sample():
+    img = Image.new("RGB", (3, 2))
+    img.putdata([(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255), (0, 0, 0), (18, 52, 86)])
+    return img
+
+
+EXPECTED = b"\xf8\x00\x07\xe0\x00\x1f\xff\xff\x00\x00\x11\xaa"
+
+
+def test_image_to_rgb565_with_and_without_numpy(monkeypatch):
+    from pipboy.interface import rgb565
+
+    img = _sample()
+    assert rgb565.image_to_rgb565(img) == EXPECTED
+    assert rgb565.image_to_rgb565(img.convert("RGBA")) == EXPECTED
+    monkeypatch.setattr(rgb565, "np", None)
+    assert rgb565.image_to_rgb565(img) == EXPECTED
+    grey = Image.new("L", (1, 1), 0x80)
+    assert rgb565.image_to_rgb565(grey) == rgb565.to_rgb565((0x80, 0x80, 0x80)).to_bytes(2, "big")
+
+
+def test_numpy_array_input():
+    np = pytest.importorskip("numpy")
+    from pipboy.interface.rgb565 import image_to_rgb565
+
+    arr = np.asarray(_sample())
+    assert image_to_rgb565(arr) == EXPECTED
+    assert image_to_rgb565(arr, byteorder="little")[:2] == b"\x00\xf8"
+
+
+def test_cache_is_keyed_by_identity():
+    from pipboy.interface.rgb565 import RGB565ImageCache
+
+    cache = RGB565ImageCache(maxsize=1)
+    a, b = _sample(), _sample()
+    first = cache.get(a)
+    assert cache.get(a) is first
+    cache.get(b)
+    assert len(cache) == 1
+    assert cache.get(a) is not first
+
+
+def test_spi_bus_display_draw_image_and_fill():
+    from pipboy.driver.spi_bus import ILI9486Display
+
+    spi = FakeSPI()
+    d = ILI9486Display(spi, width=4, height=4)
+    with pytest.raises(RuntimeError):
+        d.fill("#ff0000")
+    d.init()
+    spi.sent.clear()
+    d.draw_image(_sample(), x=2, y=3, cache=True)
+    # Clipped to 2x1 visible pixels: red, green
+    assert spi.sent[-1] == b"\xf8\x00\x07\xe0"
+    spi.sent.clear()
+    d.fill("#0000ff")
+    assert b"\x2c" in spi.sent
+    assert b"".join(spi.sent[spi.sent.index(b"\x2c") + 1 :]) == b"\x00\x1f" * 16
+
+
+def test_framebuffer_draw_image():
+    from pipboy.interface.framebuffer import Framebuffer
+
+    fb = Framebuffer(4, 4)
+    fb.draw_image(_sample(), x=1, y=1)
+    assert fb.buffer[(1 * 4 + 1) * 2 : (1 * 4 + 2) * 2] == b"\xf8\x00"
+    assert fb.damage.rects() == [(1, 1, 4, 3)]
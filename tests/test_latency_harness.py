@@ -0,0 +1,27 @@
+from pipboy.interface.ili9486_driver import ILI9486
+from pipboy.interface.latency_harness import PhotonSPI, measure_latency
+
+
+def test_photon_spi_decodes_marker_from_ramwr():
+    spi = PhotonSPI(marker=(5, 2), speed_hz=0)
+    panel = ILI9486(spi)
+    panel.initialize()
+    # 8x4 window at (2, 1): the marker is pixel (3, 1) of the block
+    data = bytearray(8 * 4 * 2)
+    off = (1 * 8 + 3) * 2
+    data[off : off + 2] = (0x8000 | 7).to_bytes(2, "big")
+    panel.draw_rgb565_buffer(2, 1, 8, 4, bytes(data))
+    assert 7 in spi.seen
+    # Blocks not covering the marker are ignored
+    panel.draw_rgb565_buffer(0, 0, 2, 2, bytes([0x80, 9] * 4))
+    assert 9 not in spi.seen
+
+
+def test_scheduler_beats_fixed_tick():
+    fixed = measure_latency("fixed", "gpio", samples=8, tick=0.1, speed_hz=0)
+    sched = measure_latency("scheduler", "keyboard", samples=8, max_fps=100, speed_hz=0)
+    assert fixed.missed == 0 and sched.missed == 0
+    assert len(sched.samples) == 8
+    # Relative to the fixed-tick run measured here, so a slow machine slows both:
+    # the fixed loop adds on average half a tick of waiting on top of the same work
+    assert sched.summary()["p50"] < fixed.summary()["p50"]
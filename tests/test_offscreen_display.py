@@ -0,0 +1,83 @@
+import struct
+import zlib
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.display_factory import create_display
+from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay, encode_png
+from pipboy.interface.rgb565 import rgb565_to_rgb888
+
+
+def _decode_png(data):
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(data):
+        (n,) = struct.unpack(">I", data[pos : pos + 4])
+        kind, body = data[pos + 4 : pos + 8], data[pos + 8 : pos + 8 + n]
+        (crc,) = struct.unpack(">I", data[pos + 8 + n : pos + 12 + n])
+        assert crc == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b"") + body
+        pos += 12 + n
+    w, h, depth, ctype = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, ctype) == (8, 2) and b"IEND" in chunks
+    raw = zlib.decompress(chunks[b"IDAT"])
+    row = w * 3
+    assert all(raw[y * (row + 1)] == 0 for y in range(h))
+    pixels = b"".join(raw[y * (row + 1) + 1 : (y + 1) * (row + 1)] for y in range(h))
+    return w, h, pixels
+
+
+def _px(rgb, w, x, y):
+    o = (y * w + x) * 3
+    return tuple(rgb[o : o + 3])
+
+
+def test_snapshot_round_trips_pixels(tmp_path):
+    d = OffscreenDisplay(OffscreenConfig(width=20, height=10, background="#000000"))
+    d.initialize()
+    d.fill_rect(2, 3, 4, 2, "#ff0000")
+    d.draw_pixel(19, 9, "#ffffff")
+    d.update()
+    path = d.snapshot(tmp_path / "f.png")
+    w, h, rgb = _decode_png(path.read_bytes())
+    assert (w, h) == (20, 10)
+    assert _px(rgb, w, 2, 3) == (255, 0, 0) and _px(rgb, w, 5, 4) == (255, 0, 0)
+    assert _px(rgb, w, 6, 4) == (0, 0, 0)
+    assert _px(rgb, w, 19, 9) == (255, 255, 255)
+
+
+def test_snapshot_every_n_frames(tmp_path):
+    d = OffscreenDisplay(OffscreenConfig(width=8, height=8, snapshot_dir=str(tmp_path), snapshot_every=3))
+    d.initialize()
+    for i in range(7):
+        d.clear()
+        d.draw_text(0, 0, str(i))
+        d.update()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["frame_000003.png", "frame_000006.png"]
+    assert d.last_snapshot == tmp_path / "frame_000006.png"
+
+
+def test_renders_app_manager_headless():
+    class App:
+        name = "Stat"
+
+        def render(self, ctx):
+            ctx.draw_text(10, 80, "HP 100")
+
+    d = create_display({"type": "offscreen", "text_scale": 2})
+    assert isinstance(d, OffscreenDisplay)
+    d.initialize()
+    AppManager([App()]).render(d)
+    d.update()
+    assert d.last_flush_rects and d.frame_count == 1
+    fg = _px(d.to_rgb(), d.width, 0, 0)
+    assert fg == _px(rgb565_to_rgb888(bytes(d.rect_bytes(0, 0, 1, 1))), 1, 0, 0)
+
+
+def test_rgb888_expansion_matches_both_byte_orders():
+    words = [0x0000, 0xF800, 0x07E0, 0x001F, 0xFFFF, 0x1234]
+    be = b"".join(w.to_bytes(2, "big") for w in words)
+    le = b"".join(w.to_bytes(2, "little") for w in words)
+    out = rgb565_to_rgb888(be)
+    assert out == rgb565_to_rgb888(le, "little")
+    assert out[:15] == bytes([0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 255, 255])
+    assert encode_png(2, 3, bytes(18))[:8] == b"\x89PNG\r\n\x1a\n"
@@ -0,0 +1,72 @@
+import math
+
+import pytest
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.palette import PULSE_STEPS, Palette, blend
+from pipboy.interface.rgb565 import to_rgb565
+from pipboy.interface.tk_interface import _blend_hex
+
+
+def test_green_theme_matches_the_legacy_colours():
+    p = Palette.from_config({"theme": "green", "themes": {"green": {"fg": "#99ff66", "bg": "#001100"}}})
+    assert (p.fg, p.dim, p.feedback, p.bg) == ("#99ff66", "#66aa44", "#ffff66", "#001100")
+    assert p.fg565 == to_rgb565("#99ff66") and p.dim565 == to_rgb565("#66aa44")
+    assert p.bg565 == to_rgb565("#001100")
+
+
+def test_pulse_table_is_the_sinusoidal_blend():
+    p = Palette.from_theme({"fg": "#000000", "feedback_fg": "#ffffff"})
+    assert len(p.pulse) == len(p.pulse565) == PULSE_STEPS
+    for k in (0, 5, PULSE_STEPS // 4, PULSE_STEPS - 1):
+        factor = 0.5 * (1 + math.sin(2 * math.pi * k / PULSE_STEPS))
+        assert p.pulse_at(k / PULSE_STEPS) == _blend_hex("#000000", "#ffffff", factor)
+        assert p.pulse565[k] == to_rgb565(p.pulse[k])
+    assert p.pulse_at(0.25) == "#ffffff"
+
+
+def test_app_manager_tab_colours_follow_palette():
+    class App:
+        def __init__(self, name):
+            self.name = name
+
+        def render(self, ctx):
+            pass
+
+    drawn = {}
+
+    class Ctx:
+        def draw_text(self, x, y, text, fg=None):
+            drawn[text] = fg
+
+    amber = Palette.from_theme({"fg": "#ffd24d", "bg": "#1a0f00"})
+    am = AppManager([App("A"), App("B")], feedback_duration=0, palette=amber)
+    am.render(Ctx())
+    assert drawn == {"A": "#ffd24d", "B": amber.dim}
+    assert am._tab_fg(1, False, rgb565=True) == amber.dim565
+
+
+def test_framebuffer_frames_use_the_palette_background_and_pulse():
+    from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay
+
+    class App:
+        name = "A"
+
+        def render(self, ctx):
+            ctx.draw_text(10, 60, "body")
+
+    amber = Palette.from_theme({"fg": "#ffd24d", "bg": "#1a0f00", "feedback_fg": "#ffffff"})
+    d = OffscreenDisplay(OffscreenConfig(width=120, height=80))
+    am = AppManager([App()], feedback_duration=10.0, palette=amber)
+    am.render(d)
+    assert d.background == amber.bg565
+    assert bytes(d.buffer[-2:]) == amber.bg565.to_bytes(2, d.byteorder)
+
+    am.feedback()
+    am.feedback_phase = lambda: 0.25
+    assert am._tab_fg(0, True, rgb565=True) == amber.pulse565_at(0.25) == amber.feedback565
+
+
+def test_blend_rejects_mismatched_colours():
+    with pytest.raises(ValueError):
+        blend((0, 0, 0), (255, 255), 0.5)
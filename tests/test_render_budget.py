@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay
+
+
+class Ctx:
+    def __init__(self):
+        self.drawn = []
+
+    def draw_text(self, x, y, text, fg=None):
+        self.drawn.append(text)
+
+
+class Sluggish:
+    name = "Slow"
+    refresh_interval = 0.1
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.renders = 0
+        self.fail = False
+
+    def render(self, ctx):
+        self.renders += 1
+        if self.fail:
+            raise RuntimeError("render broke")
+        time.sleep(self.delay)
+        ctx.draw_text(0, 60, f"frame {self.renders}")
+
+    def handle_input(self, event):
+        pass
+
+
+def test_repeated_overruns_demote_and_replay_cached_frame():
+    app = Sluggish()
+    am = AppManager([app], frame_budget=0.005, demoted_interval=10.0)
+    for _ in range(AppManager.OVERRUN_LIMIT):
+        am.render(Ctx())
+    h = am.health[0]
+    assert h.demoted and h.overruns == 3
+    assert am.refresh_interval() == 10.0
+
+    ctx = Ctx()
+    am.render(ctx)
+    assert app.renders == 3 and h.skipped == 1
+    assert "frame 3" in ctx.drawn  # last frame shown again
+    # Nothing was rendered, so there is no app render to time
+    assert am.last_app_render is None
+
+    # Input to the app gets it rendered right away
+    am.handle_input("select")
+    am.render(Ctx())
+    assert app.renders == 4
+
+
+def test_demoted_app_recovers_once_fast():
+    app = Sluggish()
+    am = AppManager([app], frame_budget=0.005, demoted_interval=0.0)
+    for _ in range(3):
+        am.render(Ctx())
+    assert am.health[0].demoted
+    app.delay = 0
+    for _ in range(AppManager.RECOVER_AFTER):
+        am.render(Ctx())
+    assert not am.health[0].demoted
+    assert am.refresh_interval() == 0.1
+
+
+def test_failed_render_keeps_last_frame():
+    app = Sluggish(delay=0)
+    am = AppManager([app])
+    am.render(Ctx())
+    app.fail = True
+    ctx = Ctx()
+    with pytest.raises(RuntimeError):
+        am.render(ctx)
+    assert am.health[0].errors == 1
+    assert "frame 1" in ctx.drawn
+
+
+def test_skipped_render_leaves_scene_untouched():
+    d = OffscreenDisplay(OffscreenConfig(width=120, height=80))
+    app = Sluggish()
+    am = AppManager([app], frame_budget=0.005, demoted_interval=10.0)
+    for _ in range(3):
+        am.render(d)
+    before = bytes(d.buffer)
+    d.damage.clear()
+    am.render(d)
+    assert app.renders == 3
+    assert bytes(d.buffer) == before and not d.damage
@@ -0,0 +1,134 @@
+import threading
+import time
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.gpio_input import KeyboardInput
+from pipboy.interface.hardware_interface import HardwareInterface
+from pipboy.interface.render_scheduler import RenderScheduler
+
+
+def _wait_in_thread(sched):
+    done = threading.Event()
+    threading.Thread(target=lambda: (sched.wait(), done.set()), daemon=True).start()
+    return done
+
+
+def test_idle_sleeps_until_invalidated():
+    sched = RenderScheduler(max_fps=1000)
+    assert sched.wait()  # first frame is always due
+    done = _wait_in_thread(sched)
+    assert not done.wait(0.15)
+    t0 = time.monotonic()
+    sched.invalidate()
+    assert done.wait(1.0)
+    assert time.monotonic() - t0 < 0.05
+
+
+def test_frame_rate_cap_coalesces_invalidations():
+    sched = RenderScheduler(max_fps=20)
+    sched.wait()
+    t0 = time.monotonic()
+    for _ in range(10):
+        sched.invalidate()
+    sched.wait()
+    assert time.monotonic() - t0 >= 0.045
+    assert sched.frames == 2
+
+
+def test_timers_and_one_shot_wakeups():
+    sched = RenderScheduler(max_fps=1000)
+    sched.wait()
+    sched.set_timer("app", 0.03)
+    t0 = time.monotonic()
+    for _ in range(3):
+        assert sched.wait()
+    assert 0.08 <= time.monotonic() - t0 < 0.5
+    sched.set_timer("app", None)
+    sched.wake_in(0.02)
+    assert sched.wait()
+    assert not _wait_in_thread(sched).wait(0.1)
+    sched.stop()
+    assert sched.wait() is False
+
+
+def test_hardware_loop_renders_on_input_only():
+    class Display:
+        def __init__(self):
+            self.frames = 0
+
+        def initialize(self):
+            pass
+
+        def clear(self):
+            pass
+
+        def draw_text(self, *a, **k):
+            pass
+
+        def update(self):
+            self.frames += 1
+
+    class App:
+        def __init__(self, name):
+            self.name = name
+
+        def render(self, ctx):
+            pass
+
+    disp = Display()
+    inputs = KeyboardInput()
+    am = AppManager([App("A"), App("B")], feedback_duration=0.05)
+    hw = HardwareInterface(disp, inputs, am, max_fps=200)
+    t = threading.Thread(target=hw.run, daemon=True)
+    t.start()
+    time.sleep(0.2)
+    idle_frames = disp.frames
+    assert idle_frames == 1
+
+    t0 = time.monotonic()
+    inputs.simulate("next")
+    while disp.frames == idle_frames and time.monotonic() - t0 < 1.0:
+        time.sleep(0.001)
+    assert time.monotonic() - t0 < 0.05
+    assert am.index == 1
+    # Frames while the feedback pulse runs (capped by max_fps), then idle again
+    time.sleep(0.2)
+    pulse_frames = disp.frames - idle_frames
+    assert 2 < pulse_frames <= 0.05 * 200 + 3
+    time.sleep(0.1)
+    assert disp.frames == idle_frames + pulse_frames
+    hw.stop()
+    t.join(1.0)
+    assert not t.is_alive()
+
+
+def test_pulse_ending_during_flush_still_restores_the_tab():
+    class SlowDisplay:
+        def clear(self):
+            pass
+
+        def draw_text(self, *a, **k):
+            pass
+
+        def update(self):
+            # The feedback pulse runs out while this frame is being flushed
+            time.sleep(0.03)
+
+    class App:
+        name = "A"
+
+        def render(self, ctx):
+            pass
+
+    am = AppManager([App()], feedback_duration=0.02)
+    hw = HardwareInterface(SlowDisplay(), None, am, max_fps=1000)
+    hw.scheduler.wait()
+    am.feedback()
+    hw.run_once()
+    assert am.feedback_remaining() == 0
+    hw._schedule_next()
+    assert hw.scheduler._pending
+    assert hw.scheduler.wait()
+    hw.run_once()
+    hw._schedule_next()
+    assert not hw.scheduler._pending
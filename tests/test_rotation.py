@@ -0,0 +1,106 @@
+import pytest
+
+from pipboy.interface.ili9486_display import ILI9486Config, ILI9486Display
+from pipboy.interface.ili9486_driver import ILI9486, ILIConfig, madctl_for
+
+
+class FakeSPI:
+    def __init__(self):
+        self.available = True
+        self.sent = []
+
+    def xfer2(self, b):
+        self.sent.append(bytes(b))
+        return b
+
+
+def _madctl_writes(spi):
+    return [spi.sent[i + 1] for i, b in enumerate(spi.sent[:-1]) if b == b"\x36"]
+
+
+def test_madctl_table_and_mirroring():
+    assert [madctl_for(r) for r in (0, 90, 180, 270)] == [0x48, 0x28, 0x88, 0xE8]
+    assert madctl_for(0, mirror_x=True) == 0x08
+    # With MV set, on-screen x is the row order
+    assert madctl_for(90, mirror_x=True) == 0xA8
+    assert madctl_for(90, mirror_y=True) == 0x68
+    with pytest.raises(ValueError):
+        madctl_for(45)
+
+
+def test_driver_geometry_and_madctl_follow_rotation():
+    spi = FakeSPI()
+    panel = ILI9486(spi, config=ILIConfig(rotation=90))
+    assert (panel.width, panel.height) == (320, 480)
+    panel.initialize()
+    assert _madctl_writes(spi) == [b"\x28"]
+    spi.sent.clear()
+    panel.set_rotation(180)
+    assert _madctl_writes(spi) == [b"\x88"]
+    assert (panel.width, panel.height) == (480, 320)
+    assert panel.can_scroll
+
+
+def test_display_rotation_resizes_and_resends():
+    spi = FakeSPI()
+    d = ILI9486Display(ILI9486Config(rotation=90), spi=spi)
+    assert (d.width, d.height) == (320, 480)
+    assert len(d.buffer) == 320 * 480 * 2
+    d.initialize()
+    d.update()
+    d.fill_rect(0, 0, 4, 4, 0xFFFF)
+    d.update()
+    assert d.last_flush_bytes == 4 * 4 * 2
+    spi.sent.clear()
+    d.set_rotation(270)
+    assert _madctl_writes(spi) == [b"\xe8"]
+    d.clear()
+    d.update()
+    assert d.last_flush_bytes == 320 * 480 * 2
+    d.set_rotation(0)
+    assert (d.width, d.height) == (480, 320)
+    d.clear()
+    d.update()
+    assert d.last_flush_bytes == 480 * 320 * 2
+    # Every rect stays inside the rotated window
+    assert all(x + w <= 480 and y + h <= 320 for x, y, w, h in d.last_flush_rects)
+
+
+def test_touch_maps_into_rotated_screen():
+    d = ILI9486Display(ILI9486Config(rotation=90))
+    assert d.touch_to_screen(0, 0) == (319, 0)
+    assert d.touch_to_screen(479, 319) == (0, 479)
+    d.set_rotation(180)
+    assert d.touch_to_screen(0, 0) == (479, 319)
+    d.set_rotation(270, mirror_x=True)
+    assert d.touch_to_screen(0, 0) == (319, 479)
+
+
+def test_touch_hits_tabs_after_rotation():
+    from pipboy.app.display import DisplayApp
+    from pipboy.interface.app_manager import AppManager
+    from pipboy.interface.hardware_interface import HardwareInterface
+
+    class Named:
+        def __init__(self, name):
+            self.name = name
+            self.events = []
+
+        def handle_input(self, evt):
+            self.events.append(evt)
+
+    d = ILI9486Display(ILI9486Config(rotation=180))
+    apps = [Named("A"), Named("B"), DisplayApp(controller=d)]
+    am = AppManager(apps)
+    hw = HardwareInterface(d, None, am)
+    # Screen (75, 5) is the second tab; at 180 degrees the raw touch is mirrored
+    hw.handle_touch(479 - 75, 319 - 5)
+    assert am.index == 1
+    hw.handle_touch(479 - 200, 319 - 200)
+    assert apps[1].events == [{"type": "touch", "x": 200, "y": 200}]
+    assert apps[2].handle_input({"rotate": 90}) is True
+    # Deferred to the render thread: the buffer isn't swapped under a frame
+    assert (d.width, d.height) == (480, 320)
+    hw.run_once()
+    assert (d.width, d.height) == (320, 480)
+    assert len(d.buffer) == 320 * 480 * 2
@@ -0,0 +1,166 @@
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.hardware_interface import HardwareInterface
+from pipboy.interface.offscreen_display import OffscreenConfig, OffscreenDisplay
+from pipboy.interface.scene import Scene
+
+
+class TextApp:
+    def __init__(self, name, lines):
+        self.name = name
+        self.lines = lines
+
+    def render(self, ctx):
+        for i, line in enumerate(self.lines):
+            ctx.draw_text(10, 60 + i * 10, line)
+
+
+def _display():
+    d = OffscreenDisplay(OffscreenConfig(width=200, height=120))
+    d.initialize()
+    return d
+
+
+def _fresh(apps, index):
+    # Reference frame drawn from scratch by a new manager
+    d = _display()
+    am = AppManager(apps, feedback_duration=0)
+    am.index = index
+    am.render(d)
+    return bytes(d.buffer)
+
+
+def test_steady_state_frame_touches_nothing():
+    d = _display()
+    am = AppManager([TextApp("A", ["HP 100", "AP 50"]), TextApp("B", ["x"])], feedback_duration=0)
+    am.render(d)
+    d.update()
+    am.render(d)
+    assert not d.damage and am.scene.painted == 0
+
+
+def test_changed_text_repaints_only_its_node():
+    d = _display()
+    app = TextApp("A", ["HP 100", "AP 50"])
+    am = AppManager([app, TextApp("B", ["x"])], feedback_duration=0)
+    am.render(d)
+    d.update()
+    app.lines = ["HP 99", "AP 50"]
+    am.render(d)
+    assert am.scene.painted == 1
+    (x0, y0, x1, y1), = d.damage.rects()
+    assert y0 == 60 and y1 - y0 < 10
+    assert bytes(d.buffer) == _fresh([TextApp("A", ["HP 99", "AP 50"]), TextApp("B", ["x"])], 0)
+
+    # Dropped lines are erased
+    app.lines = ["HP 99"]
+    am.render(d)
+    assert bytes(d.buffer) == _fresh([TextApp("A", ["HP 99"]), TextApp("B", ["x"])], 0)
+
+
+def test_switching_apps_matches_full_redraw():
+    d = _display()
+    apps = [TextApp("A", ["alpha", "beta"]), TextApp("B", ["gamma"])]
+    am = AppManager(apps, feedback_duration=0)
+    am.render(d)
+    am.next()
+    am.render(d)
+    assert bytes(d.buffer) == _fresh(apps, 1)
+    am.prev()
+    am.render(d)
+    assert bytes(d.buffer) == _fresh(apps, 0)
+
+
+def test_overlapping_nodes_keep_z_order():
+    d = _display()
+    scene = Scene()
+    base, top = scene.layer("base"), scene.layer("top")
+    base.rect("bg", 0, 0, 50, 20, "#ff0000")
+    top.text("label", 10, 5, "HI", "#ffffff")
+    scene.paint(d)
+    base.rect("bg", 0, 0, 50, 20, "#0000ff")
+    scene.paint(d)
+    assert scene.painted == 2
+
+    ref = _display()
+    ref.fill_rect(0, 0, 50, 20, "#0000ff")
+    ref.draw_text(10, 5, "HI", fg="#ffffff")
+    assert bytes(d.buffer) == bytes(ref.buffer)
+
+    # A clear behind the scene's back forces a full repaint
+    d.clear()
+    scene.paint(d)
+    assert bytes(d.buffer) == bytes(ref.buffer)
+
+
+def test_hardware_loop_skips_clear_for_retained_rendering():
+    class Inputs:
+        def on(self, name, handler):
+            pass
+
+    d = _display()
+    cleared = []
+    d.clear = lambda *a: cleared.append(a)
+    hw = HardwareInterface(d, Inputs(), AppManager([TextApp("A", ["x"])]))
+    hw.run_once()
+    hw.run_once()
+    assert cleared == [(None,)]  # only the scene's initial full repaint
+
+
+
+def test_shorter_text_with_bg_leaves_no_column_behind():
+    class BgApp:
+        name = "Bg"
+
+        def __init__(self):
+            self.text = "WWWW"
+
+        def render(self, ctx):
+            ctx.draw_text(10, 60, self.text, bg="#ff0000")
+
+    d = _display()
+    assert d.text_size("WWWW") == d.glyphs.strip(d.font, 8, 0, 0).measure("WWWW")
+    app = BgApp()
+    am = AppManager([app], feedback_duration=0)
+    am.render(d)
+    app.text = "WW"
+    am.render(d)
+    fresh = BgApp()
+    fresh.text = "WW"
+    assert bytes(d.buffer) == _fresh([fresh], 0)
+
+
+def test_scroll_moves_nodes_instead_of_repainting():
+    class LogApp:
+        name = "Log"
+
+        def __init__(self):
+            self.first = 0
+            self.scroll = 0
+
+        def render(self, ctx):
+            if self.scroll:
+                ctx.scroll_region(60, 120, 10 * self.scroll)
+                for k in range(self.first - self.scroll, self.first):
+                    ctx.remove(f"line{k}")
+                self.scroll = 0
+            for i in range(6):
+                k = self.first + i
+                ctx.text(f"line{k}", 10, 60 + i * 10, f"entry {k}")
+            # Straddles the bottom of the band, so the scroll cuts it
+            ctx.text("footer", 120, 116, "end")
+
+    d = _display()
+    app = LogApp()
+    am = AppManager([app], feedback_duration=0)
+    am.render(d)
+    d.update()
+    epoch = d.epoch
+    app.first, app.scroll = 1, 1
+    am.render(d)
+    # Only the newly exposed line and the cut footer are drawn; the other five
+    # lines moved with the scroll
+    assert d.epoch == epoch
+    assert am.scene.painted == 2
+    fresh = LogApp()
+    fresh.first = 1
+    assert bytes(d.buffer) == _fresh([fresh], 0)
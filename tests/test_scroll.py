@@ -0,0 +1,114 @@
+import random
+
+from pipboy.interface.ili9486_display import ILI9486Config, ILI9486Display
+from pipboy.interface.ili9486_driver import ILI9486, ILIConfig
+
+
+class FakeSPI:
+    def __init__(self):
+        self.available = True
+        self.sent = []
+
+    def xfer2(self, b):
+        self.sent.append(bytes(b))
+        return b
+
+
+class FakePanel:
+    """Models panel memory plus the vertical scroll mapping of the controller."""
+
+    def __init__(self, width, height, can_scroll=True):
+        self.width = width
+        self.gram = [bytearray(width * 2) for _ in range(height)]
+        self.can_scroll = can_scroll
+        self.scroll = None
+        self.bytes = 0
+
+    def set_scroll(self, y0, y1, offset):
+        self.scroll = (y0, y1, offset)
+
+    def draw_rgb565_buffer(self, x, y, w, h, data):
+        mv = memoryview(data)
+        for r in range(h):
+            self.gram[y + r][x * 2 : (x + w) * 2] = mv[r * w * 2 : (r + 1) * w * 2]
+        self.bytes += len(mv)
+
+    def shown(self):
+        rows = []
+        for r in range(len(self.gram)):
+            g = r
+            if self.scroll is not None:
+                y0, y1, off = self.scroll
+                if y0 <= r < y1:
+                    g = y0 + (r - y0 + off) % (y1 - y0)
+            rows.append(bytes(self.gram[g]))
+        return b"".join(rows)
+
+
+def _display(can_scroll=True):
+    d = ILI9486Display(ILI9486Config(width=8, height=16, background=0), spi=FakeSPI())
+    d.initialize()
+    d.panel = FakePanel(8, 16, can_scroll)
+    d.damage.add_full()
+    d.update()
+    for y in range(16):
+        d.fill_rect(0, y, 8, 1, y + 1)
+    d.update()
+    return d
+
+
+def test_hardware_scroll_sends_only_exposed_rows():
+    d = _display()
+    d.panel.bytes = 0
+    d.scroll_region(2, 14, 3)
+    d.fill_rect(0, 11, 8, 3, 0x100)
+    d.update()
+    assert d.panel.bytes == 3 * 8 * 2
+    assert d.panel.scroll == (2, 14, 3)
+    assert d.panel.shown() == bytes(d.buffer)
+    assert int.from_bytes(d.buffer[2 * 16 : 2 * 16 + 2], "big") == 6
+
+
+def test_scroll_sequence_matches_framebuffer():
+    rnd = random.Random(3)
+    d = _display()
+    for _ in range(40):
+        y0 = rnd.randrange(0, 8)
+        y1 = rnd.randrange(y0 + 1, 17)
+        d.scroll_region(y0, y1, rnd.randint(-6, 6))
+        d.fill_rect(rnd.randrange(8), rnd.randrange(16), 3, 2, rnd.randrange(1, 0xFFFF))
+        if rnd.random() < 0.7:
+            d.update()
+            assert d.panel.shown() == bytes(d.buffer)
+
+
+def test_software_fallback_resends_band():
+    d = _display(can_scroll=False)
+    d.panel.bytes = 0
+    d.scroll_region(2, 14, -2)
+    d.update()
+    assert d.panel.bytes == 12 * 8 * 2
+    assert d.panel.scroll is None
+    assert d.panel.shown() == bytes(d.buffer)
+
+
+def test_incremental_clear_follows_scrolled_content():
+    d = _display()
+    d.clear()
+    d.fill_rect(0, 10, 2, 2, 0xFFFF)
+    d.scroll_region(0, 16, 4)
+    d.clear()
+    assert not any(d.buffer)
+
+
+def test_driver_scroll_commands():
+    spi = FakeSPI()
+    panel = ILI9486(spi, config=ILIConfig(width=480, height=320))
+    panel.set_scroll(40, 300, 5)
+    assert spi.sent == [b"\x33", bytes([0, 40, 1, 4, 0, 20]), b"\x37", bytes([0, 45])]
+    spi.sent.clear()
+    panel.madctl = ILI9486.MADCTL_MY | ILI9486.MADCTL_BGR
+    panel.set_scroll(40, 300, 5)
+    assert spi.sent == [b"\x33", bytes([0, 20, 1, 4, 0, 40]), b"\x37", (20 + 255).to_bytes(2, "big")]
+    panel.madctl |= ILI9486.MADCTL_MV
+    assert not panel.can_scroll
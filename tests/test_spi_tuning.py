@@ -0,0 +1,63 @@
+import yaml
+
+from pipboy.driver.spi_tuning import FakeSPI, main, tune_spi
+from pipboy.interface.hardware_profile_pi5 import load_profile
+from pipboy.interface.ili9486_driver import ILI9486
+
+
+def test_sweep_picks_fastest_stable_setting():
+    spi = FakeSPI(max_stable_hz=20_000_000, max_bufsiz=8192)
+    panel = ILI9486(spi)
+    result = tune_spi(spi, panel, speeds=[8_000_000, 16_000_000, 20_000_000, 32_000_000, 48_000_000], chunks=[1024, 4096, 8192, 65536])
+    assert result.method == "loopback" and result.verified
+    assert result.speed_hz == 20_000_000
+    # Fewer, larger transfers win; 65536 is above the bus limit and never tried
+    assert result.chunk_size == 8192
+    assert {s.chunk_size for s in result.samples} == {1024, 4096, 8192}
+    # The sweep stops after the first speed where every chunk size fails
+    assert max(s.speed_hz for s in result.samples) == 32_000_000
+    assert all(s.ok is False for s in result.samples if s.speed_hz == 32_000_000)
+
+
+def test_unverifiable_bus_is_reported():
+    class WriteOnly(FakeSPI):
+        def xfer2(self, data):
+            super().xfer2(data)
+            return bytes(len(memoryview(data).cast("B")))
+
+    spi = WriteOnly()
+    result = tune_spi(spi, ILI9486(spi), speeds=[8_000_000, 16_000_000], chunks=[4096])
+    assert result.method is None and not result.verified
+    assert result.speed_hz == 16_000_000
+
+
+def test_readback_conversion():
+    class ReadSPI:
+        available = True
+
+        def __init__(self):
+            self.sent = []
+
+        def xfer2(self, data):
+            self.sent.append(bytes(data))
+            if len(data) == 7:
+                # dummy byte + two RGB666 pixels: red, blue
+                return b"\x00\xfc\x00\x00\x00\x00\xfc"
+            return data
+
+    panel = ILI9486(ReadSPI())
+    assert panel.read_rgb565(0, 0, 2, 1) == b"\xf8\x00\x00\x1f"
+    assert b"\x2e" in panel.spi.sent
+
+
+def test_cli_persists_into_profile(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    text = "# my settings\ntheme: green   # keep\nhardware:\n  spi_bus: 1\n  spi_speed_hz: 8000000\n"
+    cfg.write_text(text)
+    result = main(["--fake", "--config", str(cfg), "--speeds", "8e6,16e6", "--chunks", "4096", "--repeats", "1"])
+    # The config is left exactly as written; tuned values live beside it
+    assert cfg.read_text() == text
+    assert yaml.safe_load((tmp_path / "hardware.tuned.yaml").read_text())["spi_speed_hz"] == result.speed_hz == 16_000_000
+    profile = load_profile(str(cfg))
+    assert profile.spi_bus == 1 and profile.spi_chunk_size == 4096
+    assert profile.spi_speed_hz == 16_000_000
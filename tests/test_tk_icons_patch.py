@@ -0,0 +1,91 @@
+from pipboy.interface.tk_icons_patch import ICON_TAG, attach_icon_support, layout_icon_bar
+
+
+class FakeCanvas:
+    def __init__(self, width=800, height=600):
+        self.kwargs = {"width": width, "height": height}
+        self.bindings = {}
+        self.items = {}
+        self.next_id = 1
+        self.created = 0
+        self.raised = []
+
+    def bind(self, name, fn, add=None):
+        self.bindings.setdefault(name, []).append(fn)
+
+    def create_image(self, *coords, **kwargs):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = (coords, kwargs)
+        self.created += 1
+        return item
+
+    def coords(self, item, *coords):
+        self.items[item] = (coords, self.items[item][1])
+
+    def itemconfig(self, item, **kwargs):
+        self.items[item][1].update(kwargs)
+
+    def delete(self, item):
+        self.items.pop(item, None)
+
+    def tag_raise(self, tag):
+        self.raised.append(tag)
+
+
+class FakeCache:
+    sizes = (12, 18, 24, 32, 48)
+
+    def __init__(self):
+        self.loads = []
+
+    def photo(self, path, size):
+        self.loads.append((path.name, size))
+        return f"img:{path.stem}:{size}"
+
+
+class Event:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+class UI:
+    pass
+
+
+def test_layout_rows_and_spacing():
+    placed = layout_icon_bar([f"i{n}" for n in range(6)], 800, 600, 24)
+    assert len(placed) == 6
+    assert {y for _, _, y in placed} == {600 - 18, 600 - 18 - 32}
+    first_row = [x for _, x, y in placed if y == 582]
+    assert first_row == [200, 400, 600]
+    # Too narrow for two rows of five: a third row is used
+    assert len({y for _, _, y in layout_icon_bar([str(n) for n in range(10)], 200, 600, 24)}) == 3
+
+
+def test_icon_bar_follows_configure_without_timers(monkeypatch):
+    monkeypatch.delenv("PIPBOY_ICON_SIZE", raising=False)
+    ui = UI()
+    ui.canvas = FakeCanvas()
+    ui._icon_cache = cache = FakeCache()
+    attach_icon_support(ui)
+
+    n = len(ui._icons)
+    assert n and ui.canvas.created == n
+    assert ui.canvas.raised == [ICON_TAG]
+    assert len(ui.canvas.bindings["<Configure>"]) == 1
+    assert {size for _, size in cache.loads} == {18}
+
+    # Same size: nothing to do
+    configure = ui.canvas.bindings["<Configure>"][0]
+    configure(Event(800, 600))
+    assert ui.canvas.raised == [ICON_TAG]
+
+    # Resize: items move, nothing is recreated, images come from the cache at a cached size
+    configure(Event(1920, 1080))
+    assert ui.canvas.created == n
+    assert ui.canvas.raised == [ICON_TAG, ICON_TAG]
+    assert {size for _, size in cache.loads} == {18, 24}
+    ys = {coords[1] for coords, _ in ui.canvas.items.values()}
+    assert max(ys) == 1080 - 24 // 2 - 6
@@ -0,0 +1,274 @@
+import select
+import threading
+import time
+
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.tk_interface import TkInterface
+from pipboy.interface.tk_items import RetainedCanvas
+
+
+class FakeCanvas:
+    def __init__(self, master=None, **kwargs):
+        self.master = master
+        self.kwargs = kwargs
+        self.items = {}
+        self.next_id = 1
+        self.calls = []
+        self.lowered = []
+
+    def _create(self, kind, coords, kwargs):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = (kind, coords, dict(kwargs))
+        self.calls.append(("create", kind))
+        return item
+
+    def create_text(self, *coords, **kwargs):
+        return self._create("text", coords, kwargs)
+
+    def create_rectangle(self, *coords, **kwargs):
+        return self._create("rectangle", coords, kwargs)
+
+    def create_image(self, *coords, **kwargs):
+        return self._create("image", coords, kwargs)
+
+    def coords(self, item, *coords):
+        kind, _, kw = self.items[item]
+        self.items[item] = (kind, coords, kw)
+        self.calls.append(("coords", item))
+
+    def itemconfig(self, item, **kwargs):
+        self.items[item][2].update(kwargs)
+        self.calls.append(("itemconfig", item, tuple(sorted(kwargs))))
+
+    def delete(self, item):
+        self.items.pop(item, None)
+        self.calls.append(("delete", item))
+
+    def tag_lower(self, item):
+        self.lowered.append(item)
+
+    def config(self, **kwargs):
+        self.kwargs.update(kwargs)
+
+    def pack(self):
+        pass
+
+    def winfo_width(self):
+        return 800
+
+    def winfo_height(self):
+        return 600
+
+
+class FakeTcl:
+    def __init__(self, threaded=True, file_handlers=True):
+        self.threaded = threaded
+        self.file_handlers = file_handlers
+        self.handlers = {}
+
+    def call(self, *a):
+        return self.threaded
+
+    def createfilehandler(self, fd, mask, fn):
+        if not self.file_handlers:
+            raise AttributeError("createfilehandler")
+        self.handlers[fd] = fn
+
+    def deletefilehandler(self, fd):
+        self.handlers.pop(fd, None)
+
+
+class FakeRoot:
+    """Tk root whose after() callbacks run only when the test calls fire()."""
+
+    def __init__(self, tcl=None):
+        self.tk = tcl or FakeTcl()
+        self.bindings = {}
+        self.pending = {}
+        self.next_id = 0
+
+    def title(self, t):
+        pass
+
+    def bind(self, name, fn):
+        self.bindings[name] = fn
+
+    def update(self):
+        pass
+
+    def after(self, ms, fn, *args):
+        self.next_id += 1
+        self.pending[self.next_id] = (ms, fn, args)
+        return self.next_id
+
+    def after_cancel(self, item):
+        self.pending.pop(item, None)
+
+    def fire(self):
+        due = sorted(self.pending.items(), key=lambda kv: kv[1][0])
+        self.pending.clear()
+        for _, (_, fn, args) in due:
+            fn(*args)
+
+
+class App:
+    def __init__(self, name):
+        self.name = name
+        self.animating = False
+
+    def render(self, ctx):
+        ctx.draw_text(10, 60, f"{self.name} body")
+
+
+def _ui(monkeypatch, tmp_path, config, tcl=None):
+    monkeypatch.setattr("tkinter.Tk", lambda: FakeRoot(tcl))
+    monkeypatch.setattr("tkinter.Canvas", FakeCanvas)
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(config)
+    return TkInterface(cfg, sensors={})
+
+
+def test_items_are_created_once_and_updated_in_place():
+    canvas = FakeCanvas()
+    items = RetainedCanvas(canvas)
+    items.begin()
+    a = items.text("title", 10, 10, text="PIP", fill="#99ff66")
+    items.rect("bar", 0, 0, 800, 36, lower=True, fill="#001100")
+    items.end()
+    assert items.created == 2 and canvas.lowered == [2]
+
+    canvas.calls.clear()
+    items.begin()
+    assert items.text("title", 10, 10, text="PIP", fill="#99ff66") == a
+    items.rect("bar", 0, 0, 800, 36, lower=True, fill="#001100")
+    items.end()
+    assert canvas.calls == []
+
+    items.begin()
+    items.text("title", 20, 10, text="PIP", fill="#ffff66")
+    items.end()
+    assert canvas.calls == [("coords", a), ("itemconfig", a, ("fill",)), ("delete", 2)]
+    assert items.created == 2 and len(items) == 1
+
+
+def test_auto_keys_follow_draw_order():
+    canvas = FakeCanvas()
+    items = RetainedCanvas(canvas)
+    for lines in (["a", "b", "c"], ["a", "x"]):
+        items.begin()
+        for i, text in enumerate(lines):
+            items.text(None, 0, i * 10, text=text)
+        items.end()
+    assert items.created == 3 and items.deleted == 1
+    assert sorted(kw["text"] for _, _, kw in canvas.items.values()) == ["a", "x"]
+
+
+def test_tk_tick_does_not_recreate_items(monkeypatch, tmp_path):
+    ui = _ui(monkeypatch, tmp_path, "theme: green\n")
+    ui.app_manager = AppManager([App("A"), App("B")], feedback_duration=0)
+    ui._tick()
+    created = ui.items.created
+    assert created == 5  # title, tab bar, two tab labels, app body
+    for _ in range(10):
+        ui._tick()
+    assert ui.items.created == created
+
+    ui.app_manager.next()
+    ui._tick()
+    assert ui.items.created == created
+    texts = sorted(kw.get("text", "") for _, _, kw in ui.canvas.items.values())
+    assert "B body" in texts and "A body" not in texts
+
+
+def _adaptive_ui(monkeypatch, tmp_path, threaded=True, file_handlers=True):
+    ui = _ui(monkeypatch, tmp_path, "theme: green\nui:\n  animation_fps: 25\n", FakeTcl(threaded, file_handlers))
+    ui.app_manager = AppManager([App("A"), App("B")], feedback_duration=0.05)
+    ui.app_manager.on_invalidate = ui.request_redraw
+    return ui
+
+
+def test_tk_idles_until_input(monkeypatch, tmp_path):
+    ui = _adaptive_ui(monkeypatch, tmp_path)
+    ui._tick()
+    assert ui.root.pending == {}
+
+    ui.app_manager.next()
+    assert [ms for ms, _, _ in ui.root.pending.values()] == [0]
+    ui.root.fire()
+    # Feedback pulse: animation frame rate until it ends
+    assert [ms for ms, _, _ in ui.root.pending.values()] == [40]
+    time.sleep(0.06)
+    ui.root.fire()
+    assert ui.root.pending == {}
+
+    ui.app_manager.current.animating = True
+    ui.app_manager.invalidate()
+    ui.root.fire()
+    assert [ms for ms, _, _ in ui.root.pending.values()] == [40]
+
+
+def test_tk_pulse_ending_during_the_draw_gets_a_last_frame(monkeypatch, tmp_path):
+    ui = _adaptive_ui(monkeypatch, tmp_path)
+    ui._tick()
+    ui.app_manager.next()
+    # The feedback deadline passes while this frame is drawn
+    ui.app_manager.current.render = lambda ctx: time.sleep(0.07)
+    ui.root.fire()
+    assert not ui.app_manager._is_feedback_active()
+    assert [ms for ms, _, _ in ui.root.pending.values()] == [40]
+    ui.root.fire()
+    assert ui.root.pending == {}
+
+
+def test_tk_redraw_from_worker_thread(monkeypatch, tmp_path):
+    ui = _adaptive_ui(monkeypatch, tmp_path, threaded=False)
+    ui._open_wakeup()
+    try:
+        ui._tick()
+        # Idle with nothing scheduled; the pipe wakes Tk instead of a poll
+        assert ui.root.pending == {}
+        (fd, handler), = ui.root.tk.handlers.items()
+
+        t = threading.Thread(target=ui.request_redraw)
+        t.start()
+        t.join()
+        assert ui._dirty
+        assert select.select([fd], [], [], 1.0)[0] == [fd]
+        handler(fd, 0)
+        assert [ms for ms, _, _ in ui.root.pending.values()] == [0]
+        ui.root.fire()
+        assert not ui._dirty
+        assert ui.root.pending == {}
+        # Drained
+        assert select.select([fd], [], [], 0)[0] == []
+    finally:
+        ui._close_wakeup()
+    assert ui.root.tk.handlers == {}
+
+
+def test_tk_polls_only_while_updates_run_without_file_handlers(monkeypatch, tmp_path):
+    ui = _adaptive_ui(monkeypatch, tmp_path, threaded=False, file_handlers=False)
+    ui._open_wakeup()
+    assert ui._wakeup is None
+    ui._tick()
+    assert ui.root.pending == {}
+
+    ui.updates = type("Updates", (), {"running": True})()
+    ui._tick()
+    (ms, fn, _), = ui.root.pending.values()
+    assert ms == ui.IDLE_POLL_MS and fn == ui._poll
+    created = ui.items.created
+    ui.root.fire()
+    assert ui.items.created == created
+
+    t = threading.Thread(target=ui.request_redraw)
+    t.start()
+    t.join()
+    assert ui._dirty
+    ui.root.fire()
+    assert not ui._dirty
+
+    ui.updates.running = False
+    ui.root.fire()
+    assert ui.root.pending == {}
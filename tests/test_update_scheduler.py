@@ -0,0 +1,107 @@
+import threading
+import time
+
+from pipboy.app.base import SelfUpdatingApp
+from pipboy.app.environment import EnvironmentApp
+from pipboy.interface.app_manager import AppManager
+from pipboy.interface.update_scheduler import UpdateScheduler
+
+
+class Counter(SelfUpdatingApp):
+    def __init__(self, name, interval=0.05, hidden=False, delay=0.0):
+        super().__init__(name)
+        self.update_interval = interval
+        self.update_when_hidden = hidden
+        self.delay = delay
+        self.count = 0
+
+    def needs_update(self):
+        return True
+
+    def update(self):
+        time.sleep(self.delay)
+        self.count += 1
+
+    def render(self, ctx):
+        ctx.draw_text(0, 60, str(self.count))
+
+
+def test_only_visible_or_opted_in_apps_update():
+    shown, hidden, background = Counter("A"), Counter("B"), Counter("C", hidden=True)
+    am = AppManager([shown, hidden, background])
+    sched = UpdateScheduler(am)
+    assert sched.run_pending() == ["A", "C"]
+    # Not due again until the interval passes
+    assert sched.run_pending() == []
+    time.sleep(0.06)
+    am.next()
+    assert sched.run_pending() == ["B", "C"]
+    assert (shown.count, hidden.count, background.count) == (1, 1, 2)
+
+
+def test_slow_updates_run_off_the_render_thread():
+    app = Counter("Slow", interval=0.01, delay=0.2)
+    am = AppManager([app])
+    invalidated = threading.Event()
+    am.on_invalidate = invalidated.set
+    sched = UpdateScheduler(am)
+    sched.start()
+    try:
+        time.sleep(0.02)
+        # The update is mid-sleep; rendering is not held up by it
+        t0 = time.perf_counter()
+        am.render(type("Ctx", (), {"draw_text": lambda *a, **k: None})())
+        assert time.perf_counter() - t0 < 0.05
+        assert invalidated.wait(1.0)
+        assert app.count >= 1
+    finally:
+        sched.stop()
+    assert sched.errors == {}
+
+
+def test_environment_readings_are_swapped_atomically():
+    class BME:
+        def read_temperature(self):
+            return 21.0
+
+        def read_humidity(self):
+            raise OSError("i2c")
+
+        def read_pressure(self):
+            return 100000
+
+    app = EnvironmentApp(sensors={"bme280": BME()})
+    assert app.needs_update()
+    before = app._readings
+    app.update()
+    assert app._readings is not before and before == {}
+    assert app._readings == {"temperature": 21.0, "pressure": 100000}
+    assert not EnvironmentApp().needs_update()
+
+
+def test_placeholders_are_left_for_the_render_thread_to_build():
+    from pipboy.app.registry import AppSpec, LazyApp
+
+    loads = []
+
+    class Spec(AppSpec):
+        def create(self, context=None):
+            loads.append(threading.current_thread().name)
+            return Counter(self.name)
+
+    am = AppManager([LazyApp(Spec("Lazy", ".clock:ClockApp"), {})])
+    sched = UpdateScheduler(am)
+    sched.start()
+    try:
+        sched.wake()
+        time.sleep(0.05)
+        assert loads == [] and isinstance(am.apps[0], LazyApp)
+        app = am.current
+        assert loads == [threading.current_thread().name]
+        sched.wake()
+        deadline = time.monotonic() + 1.0
+        while app.count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert app.count >= 1
+    finally:
+        sched.stop()